@@ -0,0 +1,47 @@
+"""
+Вставка в консоль: OutputController -> скрытый ScrolledText.
+
+    python -m benchmarks.bench_console
+
+Нужен дисплей (на CI — xvfb-run); без него бенчмарк пропускается.
+"""
+import time
+from tkinter import scrolledtext
+
+from benchmarks.harness import benchmark, tk_root, Result
+from serial_monitor.console_model import ConsoleModel
+from serial_monitor.controllers.output_controller import OutputController
+
+LINE = b"TEMP:23.45 HUM:45.67"
+
+
+@benchmark("console")
+def bench_console(scale: float = 1.0) -> list[Result]:
+    root = tk_root()
+    if root is None:
+        return []
+    try:
+        results = []
+        ticks, per_tick = max(10, int(200 * scale)), 1000
+        for mode in ("UTF-8", "HEX"):
+            text = scrolledtext.ScrolledText(root, state="disabled")
+            output = OutputController(text, None, max_lines_per_flush=per_tick,
+                                      model=ConsoleModel(max_lines=100_000))
+            frames = [memoryview(LINE)] * per_tick
+            start = time.perf_counter()
+            for _ in range(ticks):
+                output.display_received_many(frames, mode)
+                output.flush()
+                root.update_idletasks()
+            seconds = time.perf_counter() - start
+            lines = ticks * per_tick
+            results.append(Result(f"console.{mode}", lines, lines * (len(LINE) + 1), seconds))
+            text.destroy()
+        return results
+    finally:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    for r in bench_console() or []:
+        print(f"{r.name:<20} {r.lines_per_s:>12,.0f} lines/s {r.bytes_per_s / 1e6:>8.2f} MB/s")
@@ -0,0 +1,40 @@
+"""
+Micro-benchmark for display modes.
+
+    python -m benchmarks.bench_formatters [frame_size] [frames]
+
+Prints throughput of format_data (frame by frame) and format_many (one tick batch).
+"""
+import os
+import sys
+
+from benchmarks.harness import benchmark, measure, Result
+from serial_monitor.formatters import ENCODINGS, format_data, format_many
+
+
+@benchmark("formatters")
+def bench_formatters(scale: float = 1.0, frame_size: int = 64) -> list[Result]:
+    """format_many на пачке кадров для каждого режима ENCODINGS."""
+    count = max(1000, int(10_000 * scale))
+    frames = [memoryview(os.urandom(frame_size)) for _ in range(count)]
+    results = []
+    for mode in ENCODINGS:
+        seconds = measure(lambda: format_many(mode, frames, "[Receive]: "), repeat=3)
+        results.append(Result(f"formatters.{mode}", count, count * frame_size, seconds))
+    return results
+
+
+def main(frame_size: int = 64, count: int = 10_000):
+    frames = [memoryview(os.urandom(frame_size)) for _ in range(count)]
+    total = frame_size * count
+    print(f"{count} frames x {frame_size} bytes")
+    print(f"{'mode':<6} {'format_data':>22} {'format_many':>22}")
+    for mode in ENCODINGS:
+        single = measure(lambda: [format_data(mode, f) for f in frames])
+        batch = measure(lambda: format_many(mode, frames, "[Receive]: "))
+        print(f"{mode:<6} {count / single:>10.0f} fr/s {total / single / 1e6:>6.1f} MB/s"
+              f" {count / batch:>10.0f} fr/s {total / batch / 1e6:>6.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,45 @@
+"""
+Пропускная способность LineParser: parse по строке и parse_many пачкой.
+
+    python -m benchmarks.bench_parsers
+"""
+import random
+
+from benchmarks.harness import benchmark, measure, Result
+from serial_monitor.parsers import LineParser
+
+REGEX = {
+    "type": "regex",
+    "pattern": r"TEMP:(?P<TEMP>[0-9.]+) HUM:(?P<HUM>[0-9.]+)",
+    "fields": {"TEMP": "float", "HUM": "float"},
+}
+CSV = {"type": "csv", "fields": {"ax": "float", "ay": "float", "az": "float"}}
+
+
+def _lines(kind: str, count: int) -> list[str]:
+    rng = random.Random(0)
+    if kind == "regex":
+        return [f"TEMP:{20 + 5 * rng.random():.2f} HUM:{40 + 20 * rng.random():.2f}"
+                for _ in range(count)]
+    return [f"{rng.gauss(0, 1):.3f},{rng.gauss(0, 1):.3f},{9.81 + rng.gauss(0, 0.1):.3f}"
+            for _ in range(count)]
+
+
+@benchmark("parsers")
+def bench_parsers(scale: float = 1.0) -> list[Result]:
+    count = max(1000, int(100_000 * scale))
+    results = []
+    for kind, config in (("regex", REGEX), ("csv", CSV)):
+        parser = LineParser(config)
+        lines = _lines(kind, count)
+        nbytes = sum(len(line) for line in lines)
+        single = measure(lambda: [parser.parse(line) for line in lines], repeat=3)
+        batch = measure(lambda: parser.parse_many(lines), repeat=3)
+        results.append(Result(f"parsers.{kind}.parse", count, nbytes, single))
+        results.append(Result(f"parsers.{kind}.parse_many", count, nbytes, batch))
+    return results
+
+
+if __name__ == "__main__":
+    for r in bench_parsers():
+        print(f"{r.name:<28} {r.lines_per_s:>12,.0f} lines/s {r.bytes_per_s / 1e6:>8.2f} MB/s")
@@ -0,0 +1,66 @@
+"""
+График: SimplePlot.add_data (разбор и добавление точки) и _refresh_plot
+(окно, прореживание и перерисовка линий).
+
+    python -m benchmarks.bench_plot
+
+Нужен дисплей (на CI — xvfb-run); без него бенчмарк пропускается.
+"""
+import time
+
+import numpy as np
+
+from benchmarks.harness import benchmark, measure, tk_root, Result
+from benchmarks.bench_parsers import REGEX, _lines
+from serial_monitor.parsers import LineParser
+from serial_monitor.ui.simple_plot import SimplePlot
+
+
+@benchmark("plot")
+def bench_plot(scale: float = 1.0) -> list[Result]:
+    root = tk_root()
+    if root is None:
+        return []
+    try:
+        root.deiconify()
+        root.geometry("800x400")
+        plot = SimplePlot(root, max_points=100_000)
+        plot.pack(fill="both", expand=True)
+        root.update()
+
+        plot.set_parser(LineParser(REGEX))
+        plot.set_connected(True)
+        count = max(1000, int(50_000 * scale))
+        lines = _lines("regex", count)
+        nbytes = sum(len(line) for line in lines)
+        start = time.perf_counter()
+        for line in lines:
+            plot.add_data(line)
+        add_data = Result("plot.add_data", count, nbytes, time.perf_counter() - start)
+
+        # окно 10 с, плотно заполненное точками двух серий
+        points = max(1000, int(100_000 * scale))
+        now = time.time()
+        ts = np.linspace(now - 10, now, points)
+        for key in ("TEMP", "HUM"):
+            series = plot._series(key)
+            series.clear()
+            series.extend(ts, np.sin(ts) * 10 + 50)
+        rounds = max(5, int(50 * scale))
+
+        def refresh():
+            for _ in range(rounds):
+                plot._dirty = True
+                plot._refresh_plot()
+                root.update_idletasks()
+
+        seconds = measure(refresh, repeat=3)
+        refresh_plot = Result("plot.refresh", rounds * 2 * points, 0, seconds)
+        return [add_data, refresh_plot]
+    finally:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    for r in bench_plot() or []:
+        print(f"{r.name:<20} {r.lines_per_s:>14,.0f} points/s")
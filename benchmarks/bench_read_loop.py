@@ -0,0 +1,87 @@
+"""
+Пропускная способность потока чтения SerialHandler.
+
+    python -m benchmarks.bench_read_loop
+
+fake — порт в памяти, отдающий данные кусками как драйвер (до 4 КБ за read);
+pty  — настоящий pty от serial_monitor.simulator (только POSIX).
+"""
+import time
+from unittest import mock
+
+from benchmarks.harness import benchmark, Result
+from serial_monitor import serial_io
+from serial_monitor.serial_io import SerialHandler
+
+LINE = b"TEMP:23.45 HUM:45.67\n"
+
+
+class FakePort:
+    """Порт, у которого в буфере драйвера всегда лежит до chunk байт данных."""
+
+    chunk = 4096
+
+    def __init__(self, *a, **kw):
+        self.is_open = True
+        self.data = b""
+        self.pos = 0
+
+    @property
+    def in_waiting(self):
+        return min(self.chunk, len(self.data) - self.pos)
+
+    def read(self, size=1):
+        data = self.data[self.pos:self.pos + size]
+        self.pos += len(data)
+        return data
+
+    def close(self):
+        self.is_open = False
+
+
+@benchmark("read_loop")
+def bench_read_loop(scale: float = 1.0) -> list[Result]:
+    results = [_fake(int(200_000 * scale))]
+    pty = _pty(max(0.2, 1.0 * scale))
+    if pty:
+        results.append(pty)
+    return results
+
+
+def _fake(lines: int) -> Result:
+    with mock.patch.object(serial_io.serial, "Serial", FakePort):
+        handler = SerialHandler("FAKE", 921600)
+    port = handler.ser
+    port.data = LINE * lines
+    start = time.perf_counter()
+    while port.pos < len(port.data):
+        handler._read_loop_iteration()
+    seconds = time.perf_counter() - start
+    assert handler.queue.qsize() == lines
+    return Result("read_loop.fake", lines, len(port.data), seconds)
+
+
+def _pty(duration: float) -> Result | None:
+    try:
+        from serial_monitor.simulator import VirtualDevice
+    except ImportError:
+        return None
+    with VirtualDevice("regex", rate=1_000_000, burst=500, seed=0) as device:
+        handler = SerialHandler(device.port, 921600, timeout=20)
+        handler.start()
+        lines = nbytes = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < duration:
+            while not handler.queue.empty():
+                frame = handler.queue.get_nowait()
+                lines += 1
+                nbytes += len(frame) + 1
+            time.sleep(0.001)
+        seconds = time.perf_counter() - start
+        handler.stop()
+    return Result("read_loop.pty", lines, nbytes, seconds)
+
+
+if __name__ == "__main__":
+    for r in bench_read_loop():
+        print(f"{r.name:<20} {r.lines_per_s:>12,.0f} lines/s {r.bytes_per_s / 1e6:>8.2f} MB/s")
@@ -0,0 +1,74 @@
+"""
+Сквозной прогон захвата: ReplayHandler на максимальной скорости ->
+SerialController.read_lines -> OutputController (консоль, разбор в потоке)
+-> SimplePlot, тиками как в MainWindow, пока replay не отметит drained().
+
+    python -m benchmarks.bench_replay
+
+Нужен дисплей (на CI — xvfb-run); без него бенчмарк пропускается.
+"""
+import os
+import tempfile
+from tkinter import scrolledtext
+
+from benchmarks.harness import benchmark, tk_root, Result
+from benchmarks.bench_parsers import REGEX, _lines
+from serial_monitor.capture import CaptureWriter
+from serial_monitor.console_model import ConsoleModel
+from serial_monitor.controllers.output_controller import OutputController
+from serial_monitor.controllers.serial_controller import SerialController
+from serial_monitor.parsers import LineParser
+from serial_monitor.ui.simple_plot import SimplePlot
+
+TICK_LINES = 2000  # poll_budget_lines по умолчанию
+
+
+@benchmark("replay")
+def bench_replay(scale: float = 1.0) -> list[Result]:
+    root = tk_root()
+    if root is None:
+        return []
+    fd, path = tempfile.mkstemp(suffix=".smcap")
+    os.close(fd)
+    serial = SerialController()
+    output = None
+    try:
+        count = max(1000, int(200_000 * scale))
+        with CaptureWriter(path) as writer:
+            writer.log_many("RX", [line.encode() for line in _lines("regex", count)])
+
+        root.deiconify()
+        root.geometry("800x600")
+        text = scrolledtext.ScrolledText(root, state="disabled", height=10)
+        text.pack(fill="both", expand=True)
+        plot = SimplePlot(root, max_points=100_000)
+        plot.pack(fill="both", expand=True)
+        parser = LineParser(REGEX)
+        plot.set_parser(parser)
+        plot.set_connected(True)
+        output = OutputController(text, plot, max_lines_per_flush=TICK_LINES,
+                                  model=ConsoleModel(max_lines=10_000))
+        output.set_parser(parser, "thread")
+
+        serial.connect_replay(path, speed=0)
+        handler = serial.handler
+        while True:
+            frames = serial.read_lines(TICK_LINES)
+            output.display_received_many(frames, "UTF-8")
+            backlog = output.flush()
+            root.update()  # перерисовка графика по своему таймеру, как в приложении
+            if not (frames or backlog or output.parse_stage.busy) and handler.drained():
+                break
+        stats = handler.stats
+        return [Result("replay.pipeline", stats["frames"], stats["bytes"], stats["elapsed"])]
+    finally:
+        serial.disconnect()
+        if output:
+            output.parse_stage.close()
+        root.destroy()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    for r in bench_replay() or []:
+        print(f"{r.name:<20} {r.lines_per_s:>12,.0f} lines/s {r.bytes_per_s / 1e6:>8.2f} MB/s")
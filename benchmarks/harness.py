@@ -0,0 +1,112 @@
+"""
+Общая часть бенчмарков: замер, результаты в lines/s и bytes/s,
+JSON с результатами и сравнение с baseline.
+
+Каждый модуль bench_*.py регистрирует функции через @benchmark; функция
+получает scale (1 — полный прогон, меньше — быстрый для pytest) и
+возвращает список Result. Если окружение не позволяет (нет дисплея,
+нет pty), функция возвращает пустой список.
+"""
+import json
+import platform
+import sys
+import time
+from typing import Callable, NamedTuple
+
+BENCHMARKS: dict[str, Callable[[float], list["Result"]]] = {}
+
+
+class Result(NamedTuple):
+    name: str
+    lines: int
+    nbytes: int
+    seconds: float
+
+    @property
+    def lines_per_s(self) -> float:
+        return self.lines / self.seconds if self.seconds else 0.0
+
+    @property
+    def bytes_per_s(self) -> float:
+        return self.nbytes / self.seconds if self.seconds else 0.0
+
+    def to_json(self) -> dict:
+        return {
+            "lines": self.lines,
+            "bytes": self.nbytes,
+            "seconds": self.seconds,
+            "lines_per_s": self.lines_per_s,
+            "bytes_per_s": self.bytes_per_s,
+        }
+
+
+def benchmark(name: str):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+def measure(fn, repeat: int = 5) -> float:
+    """Лучшее время из repeat прогонов — меньше всего шума от планировщика."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def tk_root():
+    """Скрытое окно Tk или None, если дисплея нет."""
+    import tkinter as tk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    root.withdraw()
+    return root
+
+
+def run(names=None, scale: float = 1.0) -> list[Result]:
+    results = []
+    for name, fn in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        results.extend(fn(scale))
+    return results
+
+
+def to_json(results: list[Result]) -> dict:
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": {r.name: r.to_json() for r in results},
+    }
+
+
+def compare(results: list[Result], baseline: dict, threshold: float = 0.2) -> list[str]:
+    """
+    Регрессии относительно baseline (JSON из to_json): результат медленнее
+    больше чем на threshold по lines/s. Бенчмарки, которых нет в baseline, пропускаются.
+    """
+    regressions = []
+    base = baseline.get("results", {})
+    for r in results:
+        ref = base.get(r.name, {}).get("lines_per_s")
+        if ref and r.lines_per_s < ref * (1 - threshold):
+            regressions.append(f"{r.name}: {r.lines_per_s:,.0f} lines/s vs baseline "
+                               f"{ref:,.0f} ({r.lines_per_s / ref - 1:+.0%})")
+    return regressions
+
+
+def load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save(path: str, data: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
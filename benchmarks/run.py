@@ -0,0 +1,41 @@
+"""
+Запуск всех бенчмарков с результатами в JSON и сравнением с baseline.
+
+    python -m benchmarks.run [--out results.json] [--baseline baseline.json]
+                             [--threshold 0.2] [--quick] [name ...]
+
+Код выхода 1, если какой-то результат медленнее baseline больше чем на threshold.
+Тот же набор запускается через pytest: python -m pytest benchmarks
+"""
+import argparse
+import sys
+
+from benchmarks import harness
+# модули регистрируют свои бенчмарки при импорте
+from benchmarks import bench_read_loop, bench_parsers, bench_formatters, bench_console, bench_plot, bench_replay  # noqa: F401
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Serial Monitor benchmarks")
+    ap.add_argument("names", nargs="*", help=f"subset of: {', '.join(harness.BENCHMARKS)}")
+    ap.add_argument("--out", help="write results to this JSON file")
+    ap.add_argument("--baseline", help="compare with results from an earlier run")
+    ap.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)")
+    ap.add_argument("--quick", action="store_true", help="smaller inputs, for smoke runs")
+    args = ap.parse_args(argv)
+
+    results = harness.run(args.names, scale=0.1 if args.quick else 1.0)
+    for r in results:
+        print(f"{r.name:<30} {r.lines_per_s:>14,.0f} lines/s {r.bytes_per_s / 1e6:>9.2f} MB/s")
+    if args.out:
+        harness.save(args.out, harness.to_json(results))
+    if args.baseline:
+        regressions = harness.compare(results, harness.load(args.baseline), args.threshold)
+        for line in regressions:
+            print("REGRESSION", line, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
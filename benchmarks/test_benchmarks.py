@@ -0,0 +1,37 @@
+"""
+Бенчмарки под pytest (в обычный прогон tests/ не входят):
+
+    python -m pytest benchmarks
+    BENCH_BASELINE=baseline.json BENCH_OUT=results.json python -m pytest benchmarks
+
+BENCH_SCALE задаёт размер входных данных (по умолчанию 0.1 — быстрый прогон).
+"""
+import os
+import pytest
+
+from benchmarks import harness
+from benchmarks import bench_read_loop, bench_parsers, bench_formatters, bench_console, bench_plot, bench_replay  # noqa: F401
+
+SCALE = float(os.environ.get("BENCH_SCALE", "0.1"))
+_results: list[harness.Result] = []
+
+
+@pytest.fixture(scope="module", autouse=True)
+def report():
+    yield
+    if os.environ.get("BENCH_OUT") and _results:
+        harness.save(os.environ["BENCH_OUT"], harness.to_json(_results))
+
+
+@pytest.mark.parametrize("name", list(harness.BENCHMARKS))
+def test_benchmark(name):
+    results = harness.BENCHMARKS[name](SCALE)
+    if not results:
+        pytest.skip(f"{name}: not available here")
+    _results.extend(results)
+    assert all(r.seconds > 0 and r.lines > 0 for r in results)
+
+    baseline = os.environ.get("BENCH_BASELINE")
+    if baseline:
+        regressions = harness.compare(results, harness.load(baseline))
+        assert not regressions, "\n".join(regressions)
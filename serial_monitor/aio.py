@@ -0,0 +1,292 @@
+"""
+asyncio-версия порта для скриптов автоматизации: много портов и сам
+тестовый сценарий в одном event loop, без потоков и Queue.
+
+    async with AsyncSerialPort("/dev/ttyUSB0", 115200) as port:
+        await port.write(b"ping\\n")
+        async for frame in port:
+            print(bytes(frame))
+
+Порт открывает pyserial, дальше чтение и запись идут прямо по его fd
+через loop.add_reader/add_writer. Только POSIX.
+
+AsyncHandler — тот же порт с интерфейсом SerialHandler (queue,
+start/stop, send, ...): event loop в своём потоке, для SerialController
+с io_backend="asyncio".
+"""
+import asyncio
+import os
+import threading
+from collections import deque
+from queue import Queue
+from threading import Event, current_thread
+import serial
+from serial_monitor.framing import DelimiterFramer
+
+READ_SIZE = 1 << 16
+
+
+class AsyncSerialPort:
+    """
+    async for frame in port — кадры по одному (memoryview, как у
+    SerialHandler); await port.read_frames() — все готовые кадры разом.
+    await port.write(data) возвращается, когда всё ушло в драйвер.
+    Ошибка порта (устройство пропало) поднимается из итерации/read_frames,
+    после close() итерация заканчивается.
+    """
+
+    def __init__(self, port: str, baudrate: int = 115200, bytesize: int = 8,
+                 parity: str = "N", framer=None, logger=None):
+        self.port = port
+        self.framer = framer or DelimiterFramer(b"\n")
+        self.logger = logger  # SessionLogger / CaptureWriter: журнал RX/TX
+        self.ser = serial.Serial(port=port, baudrate=baudrate, bytesize=bytesize,
+                                 parity=parity, timeout=0, write_timeout=0)
+        self._fd = self.ser.fileno()
+        self._frames: deque = deque()
+        self._waiter: asyncio.Future | None = None
+        self._error: Exception | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._gap_timer: asyncio.TimerHandle | None = None
+        self._write_lock = asyncio.Lock()  # кадры разных write() не перемешиваются
+        self._closed = False
+        self.frames = 0
+        self.bytes = 0
+
+    async def __aenter__(self):
+        self._attach()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._frames:
+            if not await self._wait():
+                raise StopAsyncIteration
+        return self._frames.popleft()
+
+    async def read_frames(self) -> list[memoryview]:
+        """Все накопившиеся кадры (ждёт хотя бы один); [] — порт закрыт."""
+        while not self._frames:
+            if not await self._wait():
+                return []
+        frames = list(self._frames)
+        self._frames.clear()
+        return frames
+
+    async def write(self, data: bytes | str) -> None:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self._attach()
+        async with self._write_lock:
+            view = memoryview(data)
+            while view:
+                if self._closed:
+                    raise serial.PortNotOpenError()
+                try:
+                    n = os.write(self._fd, view)
+                except BlockingIOError:
+                    # буфер драйвера полон: ждём, пока fd снова станет доступен для записи
+                    writable = self._loop.create_future()
+                    self._loop.add_writer(self._fd, writable.set_result, None)
+                    try:
+                        await writable
+                    finally:
+                        self._loop.remove_writer(self._fd)
+                    continue
+                view = view[n:]
+            if self.logger:
+                self.logger.log("TX", data)
+
+    def set_dtr(self, state: bool):
+        if self.ser.is_open:
+            self.ser.dtr = state
+
+    def set_rts(self, state: bool):
+        if self.ser.is_open:
+            self.ser.rts = state
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._loop:
+            self._loop.remove_reader(self._fd)
+        if self._gap_timer:
+            self._gap_timer.cancel()
+        self.ser.close()
+        self._wake()
+
+    # --- внутри event loop ---
+    def _attach(self):
+        if self._loop is None and not self._closed:
+            self._loop = asyncio.get_running_loop()
+            self._loop.add_reader(self._fd, self._on_readable)
+
+    async def _wait(self) -> bool:
+        if self._error:
+            error, self._error = self._error, None
+            raise error
+        if self._closed:
+            return False
+        self._attach()
+        self._waiter = self._loop.create_future()
+        try:
+            await self._waiter
+        finally:
+            self._waiter = None
+        return True
+
+    def _wake(self):
+        if self._waiter and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _on_readable(self):
+        try:
+            data = os.read(self._fd, READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            self._fail(e)
+            return
+        if not data:
+            # как pyserial: готов к чтению, а данных нет — устройство отключено
+            self._fail(serial.SerialException("device reports readiness to read but returned no data"))
+            return
+        self.bytes += len(data)
+        self._push(self.framer.feed(data))
+        gap = getattr(self.framer, "gap", None)
+        if gap:
+            if self._gap_timer:
+                self._gap_timer.cancel()
+            self._gap_timer = self._loop.call_later(gap, self._on_gap)
+
+    def _on_gap(self):
+        self._gap_timer = None
+        frames = self.framer.poll()
+        if not frames and self.framer.ring.pending:
+            # таймер сработал чуть раньше gap по часам фреймера
+            self._gap_timer = self._loop.call_later(self.framer.gap / 4, self._on_gap)
+        self._push(frames)
+
+    def _push(self, frames: list):
+        queued = [frame for frame in frames if frame]
+        if not queued:
+            return
+        self._frames.extend(queued)
+        self.frames += len(queued)
+        if self.logger:
+            self.logger.log_many("RX", queued)
+        self._wake()
+
+    def _fail(self, error: Exception):
+        self._loop.remove_reader(self._fd)
+        self._error = error
+        self._wake()
+
+
+class AsyncHandler:
+    """
+    AsyncSerialPort с интерфейсом SerialHandler: event loop в своём
+    потоке перекладывает кадры в queue, send() ставит запись в этот loop
+    и не ждёт её. Порт открывается в конструкторе, как у SerialHandler.
+    """
+
+    def __init__(self, port: str, baudrate: int, bytesize: int = 8, parity: str = "N", timeout=50,
+                 framer=None, on_frames=None, logger=None, on_error=None):
+        # timeout не нужен: чтение по готовности fd, параметр — для совместимости
+        self.port = AsyncSerialPort(port, baudrate, bytesize, parity, framer, logger)
+        self.ser = self.port.ser
+        self.on_frames = on_frames
+        self.on_error = on_error
+        self.queue: Queue[memoryview] = Queue()
+        self.stop_event = Event()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self._task: asyncio.Task | None = None
+
+    @property
+    def logger(self):
+        return self.port.logger
+
+    @logger.setter
+    def logger(self, value):
+        self.port.logger = value
+
+    @staticmethod
+    def available_ports() -> list[str]:
+        from serial_monitor.serial_io import SerialHandler
+
+        return SerialHandler.available_ports()
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread.is_alive():
+            try:
+                self.loop.call_soon_threadsafe(self._cancel)
+            except RuntimeError:
+                pass  # loop уже закрылся сам
+            if self.thread is not current_thread():
+                self.thread.join(timeout=0.5)
+        elif self.thread.ident is None and not self.loop.is_closed():
+            self.loop.close()  # start() так и не вызвали
+        self.port.close()
+
+    def send(self, data: str):
+        payload = data.encode("utf-8") + b"\n"
+        if self.thread.is_alive():
+            asyncio.run_coroutine_threadsafe(self._send(payload), self.loop)
+
+    def set_dtr(self, state: bool):
+        self.port.set_dtr(state)
+
+    def set_rts(self, state: bool):
+        self.port.set_rts(state)
+
+    async def _send(self, payload: bytes):
+        try:
+            await self.port.write(payload)
+        except (serial.SerialException, OSError):
+            pass  # порт пропал — это заметит чтение
+
+    def _cancel(self):
+        if self._task:
+            self._task.cancel()
+
+    def _run(self):
+        self._task = self.loop.create_task(self._pump())
+        try:
+            self.loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.port.close()
+            self.loop.close()
+
+    async def _pump(self):
+        port = self.port
+        async with port:
+            while not self.stop_event.is_set():
+                try:
+                    frames = await port.read_frames()
+                except (serial.SerialException, OSError) as e:
+                    if self.stop_event.is_set():
+                        break
+                    if self.on_error:
+                        # устройство отвалилось: отдаём решение контроллеру
+                        self.on_error(e)
+                        break
+                    raise
+                if not frames:
+                    break
+                for frame in frames:
+                    self.queue.put(frame)
+                if self.on_frames:
+                    self.on_frames()
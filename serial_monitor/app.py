@@ -1,8 +1,21 @@
-from serial_monitor.ui.main_window import MainWindow
+import sys
+from serial_monitor import startup
 
-def main():
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--headless" in argv:
+        # консольный режим не тянет tkinter и numpy
+        from serial_monitor.cli import main as cli_main
+
+        return cli_main(argv)
+
+    startup.enabled = "--startup-probe" in argv
+    from serial_monitor.ui.main_window import MainWindow
+
+    startup.mark("imports")
     app = MainWindow()
     app.mainloop()
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
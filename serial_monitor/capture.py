@@ -0,0 +1,280 @@
+"""
+Бинарный захват сессии (.smcap).
+
+    заголовок   HEADER: магия, версия, время начала (time_ns)
+    записи      RECORD + байты кадра, подряд
+    индекс      INDEX_ENTRY на каждую INDEX_EVERY-ю запись: (t_ns, смещение)
+    хвост       FOOTER: смещение индекса, число записей индекса и кадров, магия
+
+t_ns — монотонные наносекунды от начала захвата. Индекс пишется при
+close(); если захват оборвался без хвоста, CaptureReader восстанавливает
+индекс одним проходом по записям.
+"""
+import mmap
+import struct
+import threading
+import time
+from bisect import bisect_right
+from queue import Queue, Full
+from typing import Iterator, NamedTuple
+
+MAGIC = b"SMCAP\x00\x00\x01"
+INDEX_MAGIC = b"SMCAPIDX"
+VERSION = 1
+CAPTURE_SUFFIX = ".smcap"
+
+HEADER = struct.Struct("<8sHxxq")     # magic, version, start time_ns
+RECORD = struct.Struct("<qBBI")       # t_ns, direction, port_id, length
+INDEX_ENTRY = struct.Struct("<qQ")    # t_ns, offset
+FOOTER = struct.Struct("<QQQ8s")      # index offset, index entries, records, magic
+INDEX_EVERY = 1024
+
+DIRECTIONS = ("RX", "TX", "EV")  # EV — служебная отметка (разрыв связи и т.п.)
+
+
+class CaptureRecord(NamedTuple):
+    t_ns: int           # от начала захвата
+    direction: str      # "RX" | "TX" | "EV"
+    port: int
+    data: memoryview    # байты кадра прямо в mmap, без копии
+
+
+class CaptureWriter:
+    """
+    Пишет захват. Интерфейс журнала как у SessionLogger (log/log_many/close),
+    поэтому его можно отдать SerialHandler вместо текстового лога.
+
+    Как и у SessionLogger, поток чтения только копирует кадры и кладёт
+    пачку в ограниченную очередь без ожидания; если очередь полна, кадры
+    считаются в dropped. struct.pack и write — в отдельном потоке.
+    """
+
+    def __init__(self, path: str, port_id: int = 0, buffer_size: int = 1 << 20,
+                 queue_size: int = 4096):
+        self.path = path
+        self.port_id = port_id
+        self.frames = 0
+        self.bytes = 0
+        self.dropped = 0  # кадров потеряно из-за переполненной очереди
+        self._file = open(path, "wb", buffering=buffer_size)
+        self._file.write(HEADER.pack(MAGIC, VERSION, time.time_ns()))
+        self._offset = HEADER.size
+        self._t0 = time.monotonic_ns()
+        self._index: list[tuple[int, int]] = []
+        self._queue: Queue = Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+
+    # --- вызывается из потоков чтения/отправки ---
+    def log(self, direction: str, frame, port_id: int | None = None) -> None:
+        self.log_many(direction, (frame,), port_id)
+
+    def log_many(self, direction: str, frames, port_id: int | None = None) -> None:
+        code = DIRECTIONS.index(direction)
+        port = self.port_id if port_id is None else port_id
+        # кадры — memoryview на буфер, который скоро перезапишут, поэтому копия
+        data = [bytes(frame) for frame in frames]
+        with self._lock:
+            if self._closed:
+                return
+            # время и постановка в очередь под замком, чтобы записи шли в порядке времени
+            try:
+                self._queue.put_nowait((time.monotonic_ns() - self._t0, code, port, data))
+            except Full:
+                self.dropped += len(data)
+
+    def mark(self, text: str) -> None:
+        """Служебная отметка в захвате (например, разрыв связи)."""
+        self.log("EV", text.encode("utf-8"))
+
+    def close(self, timeout: float = 2.0) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._queue.put(None, timeout=timeout)
+        except Full:
+            pass  # запись зависла (диск): не держим disconnect(), поток-демон доработает сам
+        self._thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- поток записи ---
+    def _writer(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            self._write(*item)
+        index_offset = self._offset
+        self._file.write(b"".join(INDEX_ENTRY.pack(*entry) for entry in self._index))
+        self._file.write(FOOTER.pack(index_offset, len(self._index), self.frames, INDEX_MAGIC))
+        self._file.close()
+
+    def _write(self, t: int, code: int, port: int, frames: list[bytes]):
+        write = self._file.write
+        for frame in frames:
+            if self.frames % INDEX_EVERY == 0:
+                self._index.append((t, self._offset))
+            n = len(frame)
+            write(RECORD.pack(t, code, port, n))
+            write(frame)
+            self._offset += RECORD.size + n
+            self.frames += 1
+            self.bytes += n
+
+
+class _IndexView:
+    """Индекс из mmap как последовательность t_ns — для bisect без загрузки в память."""
+
+    def __init__(self, buf, offset: int, count: int):
+        self._buf = buf
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> int:
+        return INDEX_ENTRY.unpack_from(self._buf, self._offset + i * INDEX_ENTRY.size)[0]
+
+    def offset(self, i: int) -> int:
+        return INDEX_ENTRY.unpack_from(self._buf, self._offset + i * INDEX_ENTRY.size)[1]
+
+
+class _ListIndex(list):
+    """Восстановленный индекс: список (t_ns, offset) с тем же интерфейсом."""
+
+    def __getitem__(self, i: int) -> int:
+        return super().__getitem__(i)[0]
+
+    def offset(self, i: int) -> int:
+        return super().__getitem__(i)[1]
+
+
+class CaptureReader:
+    """
+    Читает захват через mmap: открытие читает только заголовок и хвост,
+    seek() по времени — бинарный поиск по разреженному индексу и не больше
+    INDEX_EVERY записей линейно. Данные записей — memoryview в mmap.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # пустой файл
+            self._file.close()
+            raise ValueError(f"Not a capture file: {path}")
+        self._view = memoryview(self._map)
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"Not a capture file: {path}")
+        magic, version, start_ns = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a capture file: {path}")
+        self.start_time = start_ns / 1e9  # время начала захвата, epoch seconds
+        self._index, self._count, self._end = self._read_footer() or self._scan()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def duration(self) -> float:
+        """Секунды от начала захвата до последней записи."""
+        if not self._count:
+            return 0.0
+        last = self._count - 1
+        offset = self._offset_of(last)
+        return RECORD.unpack_from(self._map, offset)[0] / 1e9
+
+    def records(self, start: int = 0) -> Iterator[CaptureRecord]:
+        """Записи начиная с порядкового номера start."""
+        if start >= self._count:
+            return
+        offset = self._offset_of(max(0, start))
+        view, end = self._view, self._end
+        unpack = RECORD.unpack_from
+        while offset < end:
+            t, code, port, n = unpack(view, offset)
+            offset += RECORD.size
+            yield CaptureRecord(t, DIRECTIONS[code], port, view[offset:offset + n])
+            offset += n
+
+    def seek(self, t: float) -> int:
+        """Номер первой записи с временем >= t секунд от начала захвата."""
+        t_ns = int(t * 1e9)
+        i = max(0, bisect_right(self._index, t_ns) - 1)
+        ordinal = i * INDEX_EVERY
+        offset = self._index.offset(i) if len(self._index) else self._end
+        while offset < self._end:
+            rec_t, _, _, n = RECORD.unpack_from(self._map, offset)
+            if rec_t >= t_ns:
+                break
+            offset += RECORD.size + n
+            ordinal += 1
+        return ordinal
+
+    def between(self, t0: float, t1: float) -> Iterator[CaptureRecord]:
+        """Записи с t0 <= t < t1 (секунды от начала захвата)."""
+        t1_ns = t1 * 1e9
+        for record in self.records(self.seek(t0)):
+            if record.t_ns >= t1_ns:
+                break
+            yield record
+
+    def close(self) -> None:
+        if self._map is None:
+            return
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            pass  # снаружи ещё держат memoryview записей — закроется сборщиком
+        self._file.close()
+        self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _offset_of(self, ordinal: int) -> int:
+        i, skip = divmod(ordinal, INDEX_EVERY)
+        offset = self._index.offset(i)
+        for _ in range(skip):
+            offset += RECORD.size + RECORD.unpack_from(self._map, offset)[3]
+        return offset
+
+    def _read_footer(self):
+        size = len(self._map)
+        if size < HEADER.size + FOOTER.size:
+            return None
+        index_offset, entries, count, magic = FOOTER.unpack_from(self._map, size - FOOTER.size)
+        if magic != INDEX_MAGIC or index_offset + entries * INDEX_ENTRY.size != size - FOOTER.size:
+            return None
+        return _IndexView(self._map, index_offset, entries), count, index_offset
+
+    def _scan(self):
+        # хвоста нет (захват не закрыли) — один проход по записям
+        index = _ListIndex()
+        offset, count, size = HEADER.size, 0, len(self._map)
+        while offset + RECORD.size <= size:
+            t, _, _, n = RECORD.unpack_from(self._map, offset)
+            if offset + RECORD.size + n > size:
+                break  # оборванная последняя запись
+            if count % INDEX_EVERY == 0:
+                index.append((t, offset))
+            offset += RECORD.size + n
+            count += 1
+        return index, count, offset
@@ -0,0 +1,228 @@
+"""
+Консольный режим без Tk: кадры с порта (или из захвата/журнала) идут
+в stdout или файл как текст, CSV или JSON lines.
+
+    serial-monitor --headless --port /dev/ttyUSB0 --baudrate 115200
+    serial-monitor --headless --parser example/temp_n_num.json --format csv > data.csv
+    serial-monitor --headless --replay session.smcap --speed 0 --format jsonl | jq .
+    serial-monitor --headless --port /dev/ttyUSB0 --port /dev/ttyUSB1 --format csv
+
+Несколько --port читаются одним потоком (IOLoop), строки помечаются портом
+и идут в порядке прихода.
+
+Порт, скорость, framing и т.д. по умолчанию берутся из ~/.serial_monitor.json.
+Модуль не импортирует tkinter и numpy (numpy подтянется, только если
+бинарному парсеру он доступен).
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from queue import Empty
+from serial_monitor.formatters import ENCODINGS, format_many, to_text
+from serial_monitor.settings_model import SettingsModel
+from serial_monitor.controllers.serial_controller import SerialController, IO_BACKENDS
+from serial_monitor.parsers import load_parser_config
+
+OUTPUT_FORMATS = ("text", "csv", "jsonl")
+BATCH = 4096  # кадров на одну запись в вывод
+
+
+def field_names(parser) -> list[str]:
+    """Поля парсера в порядке конфига (для MultiParser — объединение по сообщениям)."""
+    if hasattr(parser, "parsers"):
+        names = []
+        for sub in parser.parsers.values():
+            names.extend(name for name in field_names(sub) if name not in names)
+        return names
+    if hasattr(parser, "names"):
+        return list(parser.names)
+    return [name for name, _ in parser.fields]
+
+
+def batch_rows(batch) -> list[dict]:
+    """ParsedBatch (колонки) -> словари по разобранным строкам, в порядке строк."""
+    rows = {i: {} for i in batch.rows}
+    for key, column in batch.columns.items():
+        indices = (batch.column_rows or {}).get(key, batch.rows)
+        values = column.tolist() if hasattr(column, "tolist") else column
+        for i, value in zip(indices, values):
+            rows[i][key] = value
+    return [rows[i] for i in batch.rows]
+
+
+class StreamWriter:
+    """
+    Пишет пачки кадров в выбранном формате одной записью на пачку.
+    labeled — несколько портов: у строк появляется метка порта
+    (префикс "[порт] " в тексте, поле "port" в CSV и JSON).
+    """
+
+    def __init__(self, out, fmt: str, mode: str, parser=None, labeled: bool = False):
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Invalid output format: {fmt}")
+        self.out = out
+        self.fmt = fmt
+        self.mode = mode
+        self.parser = parser
+        self.labeled = labeled
+        self.lines = 0
+        self._binary = getattr(parser, "binary", False)
+        if fmt == "csv":
+            self._fields = ["time"] + (["port"] if labeled else []) \
+                + (field_names(parser) if parser else ["data"])
+            self._csv = csv.writer(out, lineterminator="\n")
+            self._csv.writerow(self._fields)
+
+    def write(self, frames: list, ts: float, port: str | None = None):
+        if self.fmt == "text":
+            prefix = f"[{port}] " if self.labeled else ""
+            self.out.write(format_many(self.mode, frames, prefix) + "\n")
+            self.lines += len(frames)
+            return
+        if self.parser:
+            inputs = frames if self._binary else [to_text(frame) for frame in frames]
+            rows = batch_rows(self.parser.parse_many(inputs))
+        else:
+            rows = [{"data": to_text(frame)} for frame in frames]
+        if self.labeled:
+            rows = [{"port": port, **row} for row in rows]
+        if self.fmt == "csv":
+            fields = self._fields[1:]
+            self._csv.writerows([ts] + [row.get(name, "") for name in fields] for row in rows)
+        else:
+            dumps = json.dumps
+            self.out.write("".join(dumps({"time": ts, **row}) + "\n" for row in rows))
+        self.lines += len(rows)
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(prog="serial-monitor", description="Serial Monitor")
+    ap.add_argument("--headless", action="store_true", help="stream to stdout/file without the GUI")
+    ap.add_argument("--port", action="append",
+                    help="serial port (default: from settings); repeat to monitor several ports")
+    ap.add_argument("--baudrate", type=int, help="baud rate (default: from settings)")
+    ap.add_argument("--framing", help="LF, CRLF, NUL, SLIP, LEN8, LEN16, FIXED, IDLE")
+    ap.add_argument("--io-backend", choices=IO_BACKENDS, help="port I/O: thread or asyncio")
+    ap.add_argument("--replay", metavar="FILE", help="play a capture (.smcap) or log instead of a port")
+    ap.add_argument("--speed", type=float, default=0, help="replay speed (1 = real time, 0 = max)")
+    ap.add_argument("--parser", metavar="JSON", help="parser config (default: from settings)")
+    ap.add_argument("--format", choices=OUTPUT_FORMATS, default="text", dest="fmt")
+    ap.add_argument("--mode", choices=tuple(ENCODINGS), help="display mode for text output")
+    ap.add_argument("--output", "-o", metavar="FILE", help="write here instead of stdout")
+    ap.add_argument("--duration", type=float, default=0, help="stop after N seconds")
+    ap.add_argument("--count", type=int, default=0, help="stop after N frames")
+    return ap.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    settings = SettingsModel()
+    ports = args.port or []
+    multi = len(ports) > 1 and not args.replay
+    overrides = {"port": ports[0] if ports and not multi else None, "baudrate": args.baudrate,
+                 "framing": args.framing, "parser_path": args.parser, "io_backend": args.io_backend}
+    settings.update(**{key: value for key, value in overrides.items() if value is not None})
+    config = settings.config
+
+    parser = None
+    if args.fmt != "text" and config.parser_path:
+        parser = load_parser_config(config.parser_path)
+
+    out = open(args.output, "w", encoding="utf-8", newline="", buffering=1 << 16) \
+        if args.output else sys.stdout
+    writer = StreamWriter(out, args.fmt, args.mode or config.display_mode, parser,
+                          labeled=multi)
+    if multi:
+        return stream_ports(args, settings, writer, out)
+
+    serial = SerialController()
+    try:
+        if args.replay:
+            serial.connect_replay(args.replay, args.speed)
+        else:
+            serial.connect(settings)
+    except (OSError, ValueError) as e:
+        print(f"serial-monitor: {e}", file=sys.stderr)
+        return 1
+    queue = serial.handler.queue
+    deadline = time.monotonic() + args.duration if args.duration else None
+    received = 0
+    try:
+        while not (deadline and time.monotonic() >= deadline):
+            for event in serial.pop_events():  # разрыв связи и переподключение
+                print(f"serial-monitor: {event}", file=sys.stderr)
+            try:
+                # ждём первый кадр, остальное забираем без ожидания одной пачкой
+                frames = [queue.get(timeout=0.1)]
+            except Empty:
+                if serial.replaying and serial.handler.drained():
+                    break
+                continue
+            room = min(BATCH, args.count - received) if args.count else BATCH
+            if room > 1:
+                frames.extend(serial.read_lines(room - 1))
+            received += len(frames)
+            writer.write(frames, time.time())
+            out.flush()
+            if args.count and received >= args.count:
+                break
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        # читатель (head, grep -m) закрыл канал: дальнейший вывод — в никуда
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        serial.disconnect()
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def stream_ports(args, settings: SettingsModel, writer: StreamWriter, out) -> int:
+    """Несколько портов: пачки (время, порт, кадры) в порядке прихода."""
+    from serial_monitor.controllers.multi_port_controller import MultiPortController
+
+    serial = MultiPortController()
+    try:
+        serial.connect(args.port, settings)
+    except (OSError, ValueError) as e:
+        print(f"serial-monitor: {e}", file=sys.stderr)
+        return 1
+    labels = serial.labels
+    deadline = time.monotonic() + args.duration if args.duration else None
+    received = 0
+    try:
+        while not (deadline and time.monotonic() >= deadline):
+            for event in serial.pop_events():
+                print(f"serial-monitor: {event}", file=sys.stderr)
+            try:
+                records = [serial.records.get(timeout=0.1)]
+            except Empty:
+                continue
+            records.extend(serial.read_records(BATCH))
+            for ts, index, frames in records:
+                if args.count:
+                    frames = frames[:args.count - received]
+                received += len(frames)
+                writer.write(frames, ts, labels[index])
+                if args.count and received >= args.count:
+                    break
+            out.flush()
+            if args.count and received >= args.count:
+                break
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    finally:
+        serial.disconnect()
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
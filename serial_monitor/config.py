@@ -22,16 +22,29 @@ class SerialConfig:
     dtr_default: bool = True
     rts_default: bool = True
     log_path: str = ""
+    log_max_bytes: int = 0
+    log_rotate_s: int = 0
+    log_compress: str = "none"
     send_delay_ms: int = 50
     parser_path: str = "" 
+    framing: str = "LF"
+    frame_length: int = 16
+    idle_gap_ms: int = 20
+    scrollback_lines: int = 100000
+    scrollback_chars: int = 0
+    poll_min_ms: int = 10
+    poll_max_ms: int = 200
+    poll_budget_lines: int = 2000
+    poll_budget_ms: int = 30
+    plot_max_points: int = 100000
+    plot_decimation: str = "minmax"
+    parse_mode: str = "thread"
+    replay_speed: float = 1.0
+    auto_reconnect: bool = True
+    reconnect_min_ms: int = 5
+    reconnect_max_ms: int = 250
+    io_backend: str = "thread"
 
-ENCODINGS = {
-        "UTF-8": lambda x: x,
-        "ANSI": lambda x: x.encode("utf-8", errors="ignore").decode("latin1", errors="ignore"),
-        "HEX": lambda x: " ".join(f"{ord(c):02X}" for c in x),
-        "DEC": lambda x: " ".join(str(ord(c)) for c in x),
-        "BIN": lambda x: " ".join(f"{ord(c):08b}" for c in x),
-    }
 
 def load_config() -> SerialConfig:
     if CONFIG_FILE.exists():
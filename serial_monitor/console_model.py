@@ -0,0 +1,62 @@
+from collections import deque
+
+
+class ConsoleModel:
+    """
+    Учёт того, что лежит в текстовом виджете консоли, для ограничения scrollback.
+
+    Хранится не каждая строка, а одна запись (строк, символов) на вставку,
+    поэтому модель компактна, а обрезка идёт целыми блоками. Обрезка
+    начинается, когда лимит превышен на trim_slack, и убирает всё лишнее сразу.
+    """
+
+    def __init__(self, max_lines: int = 0, max_chars: int = 0, trim_slack: float = 0.1):
+        self.max_lines = max_lines  # 0 = без ограничения
+        self.max_chars = max_chars
+        self.trim_slack = trim_slack
+        self._chunks: deque[list[int]] = deque()  # [строк, символов] на вставку
+        self.lines = 0
+        self.chars = 0
+
+    def add(self, lines: int, chars: int) -> None:
+        self._chunks.append([lines, chars])
+        self.lines += lines
+        self.chars += chars
+
+    def trim(self) -> int:
+        """Сколько строк нужно удалить из начала виджета (0 — ничего)."""
+        if not self._over(1 + self.trim_slack):
+            return 0
+        removed = 0
+        while self._chunks and self._over(1):
+            chunk = self._chunks[0]
+            lines = self._excess_lines(chunk)
+            chars = chunk[1] if lines == chunk[0] else chunk[1] * lines // chunk[0]
+            if lines == chunk[0]:
+                self._chunks.popleft()
+            else:
+                chunk[0] -= lines
+                chunk[1] -= chars
+            self.lines -= lines
+            self.chars -= chars
+            removed += lines
+        return removed
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self.lines = self.chars = 0
+
+    def _over(self, factor: float) -> bool:
+        return (bool(self.max_lines) and self.lines > self.max_lines * factor) or \
+               (bool(self.max_chars) and self.chars > self.max_chars * factor)
+
+    def _excess_lines(self, chunk: list[int]) -> int:
+        # сколько строк из первого блока надо убрать, чтобы уложиться в лимиты
+        lines, chars = chunk
+        need = 0
+        if self.max_lines and self.lines > self.max_lines:
+            need = self.lines - self.max_lines
+        if self.max_chars and self.chars > self.max_chars and chars:
+            per_line = chars / lines
+            need = max(need, -(-(self.chars - self.max_chars) // per_line))
+        return min(lines, max(1, int(need)))
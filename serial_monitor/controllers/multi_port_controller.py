@@ -0,0 +1,117 @@
+from collections import deque
+from functools import partial
+from queue import Queue
+import serial
+from serial_monitor.framing import make_framer
+from serial_monitor.io_loop import IOLoop, LoopPort
+from serial_monitor.settings_model import SettingsModel
+
+
+class MultiPortController:
+    """
+    Несколько портов на одном IOLoop (один поток на все порты).
+
+    Кадры всех портов идут в общую очередь records пачками
+    (время, номер порта, кадры) в порядке прихода — из неё строится
+    и общая консоль, и консоли по портам. Скорость, framing и т.д.
+    у всех портов общие, из настроек.
+    """
+
+    def __init__(self):
+        self.loop: IOLoop | None = None
+        self.handlers: list[LoopPort] = []
+        self.records: Queue = Queue()
+        self.connected = False
+        self.on_frames = None  # пробуждение UI из потока IOLoop
+        self.events: deque[str] = deque(maxlen=100)
+        self.lost: set[int] = set()  # номера пропавших портов, остальные работают
+
+    @property
+    def labels(self) -> list[str]:
+        return [handler.port for handler in self.handlers]
+
+    def connect(self, ports: list[str], settings: SettingsModel | None = None):
+        settings = settings or SettingsModel()
+        config = settings.config
+        loop = IOLoop()
+        handlers = []
+        try:
+            for index, port in enumerate(ports):
+                handlers.append(LoopPort(
+                    loop, port,
+                    baudrate=settings.baudrate,
+                    bytesize=settings.bytesize,
+                    parity=settings.parity,
+                    framer=make_framer(config.framing, config.frame_length, config.idle_gap_ms),
+                    index=index,
+                    records=self.records,
+                    on_frames=self.on_frames,
+                    on_error=partial(self._on_port_lost, index),
+                    ))
+        except (OSError, ValueError):
+            # один порт не открылся — закрываем уже открытые
+            for handler in handlers:
+                handler.ser.close()
+            loop.stop()
+            raise
+        self.loop = loop.start()
+        self.handlers = handlers
+        self.lost = set()
+        for handler in handlers:
+            handler.start()
+        self.connected = True
+
+    def disconnect(self):
+        if self.loop:
+            for handler in self.handlers:
+                handler.stop()
+            self.loop.stop()
+            self.loop = None
+        self.handlers = []
+        self.connected = False
+
+    def read_records(self, max_frames: int = 0) -> list[tuple[float, int, list]]:
+        """
+        Забирает пачки (время, номер порта, кадры) в порядке прихода, пока
+        не наберётся max_frames кадров (0 — все); пачки не делятся.
+        """
+        records = []
+        count = 0
+        queue = self.records
+        while not queue.empty() and (not max_frames or count < max_frames):
+            record = queue.get_nowait()
+            records.append(record)
+            count += len(record[2])
+        return records
+
+    @property
+    def has_pending(self) -> bool:
+        return not self.records.empty()
+
+    def send(self, index: int, data: str):
+        if self.connected and self.handlers[index].ser.is_open:
+            try:
+                self.handlers[index].send(data)
+            except (serial.SerialException, OSError):
+                pass  # порт пропал, а цикл ещё не заметил — сообщит через events
+
+    def set_dtr(self, index: int, value: bool):
+        if self.connected:
+            self.handlers[index].set_dtr(value)
+
+    def set_rts(self, index: int, value: bool):
+        if self.connected:
+            self.handlers[index].set_rts(value)
+
+    def pop_events(self) -> list[str]:
+        events = []
+        while self.events:
+            events.append(self.events.popleft())
+        return events
+
+    def _on_port_lost(self, index: int, error: Exception):
+        # порт уже снят с цикла и закрыт, остальные работают дальше
+        self.lost.add(index)
+        self.events.append(f"{self.handlers[index].port} lost: {error}")
+        if self.on_frames:
+            self.on_frames()
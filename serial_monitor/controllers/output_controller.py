@@ -1,22 +1,122 @@
-from serial_monitor.formatters import format_data
+import time
+from collections import deque
+from serial_monitor.formatters import format_many, to_text
+from serial_monitor.console_model import ConsoleModel
+from serial_monitor.controllers.parse_stage import ParseStage
+
+RECEIVE_PREFIX = "[Receive]: "
+SEND_PREFIX = "[Send]: "
+
 
 class OutputController:
-    def __init__(self, text_widget, plot_widget):
+    def __init__(self, text_widget, plot_widget, max_lines_per_flush: int = 2000,
+                 model: ConsoleModel | None = None):
         self.text_widget = text_widget
         self.plot_widget = plot_widget
+        self.model = model or ConsoleModel()
+        self.parse_stage = ParseStage()
+        self.max_lines_per_flush = max_lines_per_flush
+        # (префикс, кадры, режим) ждут отрисовки; send_file пишет сюда из своего потока
+        self._pending: deque[tuple[str, list, str]] = deque()
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def set_parser(self, parser, mode: str = "thread"):
+        """Разбор кадров для графика: в потоке Tk, в потоке или в процессе."""
+        self.parse_stage.close()
+        self.parse_stage = ParseStage(parser, mode)
+
+    def clear(self):
+        """Очищает консоль и всё, что ещё ждёт отрисовки или разбора."""
+        self._pending.clear()
+        self.model.clear()
+        stage = self.parse_stage
+        if stage.parser is not None:
+            # новый этап: пачки, которые ещё разбираются, на график не попадут
+            self.set_parser(stage.parser, stage.mode)
+        widget = self.text_widget
+        widget.configure(state="normal")
+        widget.delete("1.0", "end")
+        widget.configure(state="disabled")
 
-    def display_received(self, raw: str, mode: str):
-        line = format_data(mode, raw)
-        self._append(f"[Receive]: {line}")
+    def display_received(self, raw, mode: str):
+        self.display_received_many([raw], mode)
+
+    def display_received_many(self, frames: list, mode: str, prefix: str = RECEIVE_PREFIX):
+        if not frames:
+            return
+        self._pending.append((prefix, frames, mode))
         if self.plot_widget:
-            self.plot_widget.add_data(raw)
+            self.parse_stage.submit(frames)
 
     def display_sent(self, raw: str, mode: str):
-        line = format_data(mode, raw)
-        self._append(f"[Send]: {line}")
+        self._pending.append((SEND_PREFIX, [raw], mode))
+
+    def display_note(self, text: str):
+        """Служебная строка (разрыв связи и т.п.) — как есть, без режима отображения."""
+        self._pending.append(("", [f"--- {text} ---"], None))
+
+    def display_records(self, records: list, mode: str, start_time: float = 0.0):
+        """
+        Записи захвата (CaptureRecord): RX и TX в консоль по порядку,
+        RX — на график со временем записи start_time + t_ns.
+        """
+        run: list = []
+        for i, record in enumerate(records):
+            run.append(record)
+            if i + 1 < len(records) and records[i + 1].direction == record.direction:
+                continue
+            frames = [r.data for r in run]
+            if record.direction == "EV":
+                for r in run:
+                    self.display_note(to_text(r.data))
+            elif record.direction == "TX":
+                self._pending.append((SEND_PREFIX, frames, mode))
+            else:
+                self._pending.append((RECEIVE_PREFIX, frames, mode))
+                if self.plot_widget:
+                    self.parse_stage.submit(frames, [start_time + r.t_ns / 1e9 for r in run])
+            run = []
+
+    def flush(self, time_budget: float = 0) -> bool:
+        """
+        Рисует накопленные строки одной вставкой, но не больше
+        max_lines_per_flush и не дольше time_budget секунд (0 — без
+        ограничения) за раз. Возвращает True, если что-то осталось.
+        """
+        if self.plot_widget:
+            for ts, batch in self.parse_stage.collect():
+                self.plot_widget.add_batch(batch, ts)
+        budget = self.max_lines_per_flush
+        deadline = time.perf_counter() + time_budget if time_budget else None
+        parts = []
+        while self._pending and budget > 0:
+            if deadline and parts and time.perf_counter() > deadline:
+                break
+            prefix, frames, mode = self._pending.popleft()
+            if len(frames) > budget:
+                self._pending.appendleft((prefix, frames[budget:], mode))
+                frames = frames[:budget]
+            parts.append(format_many(mode, frames, prefix) if mode else "\n".join(frames))
+            budget -= len(frames)
+        if parts:
+            self._append("\n".join(parts))
+        return self.has_pending
 
     def _append(self, text: str):
-        self.text_widget.configure(state="normal")
-        self.text_widget.insert("end", text + "\n")
-        self.text_widget.configure(state="disabled")
-        self.text_widget.yview("end")
+        widget = self.text_widget
+        # не дёргаем прокрутку, если пользователь отмотал вверх
+        at_bottom = widget.yview()[1] >= 1.0
+        text += "\n"
+        widget.configure(state="normal")
+        widget.insert("end", text)
+        self.model.add(text.count("\n"), len(text))
+        trimmed = self.model.trim()
+        if trimmed:
+            # старые строки удаляются одним куском
+            widget.delete("1.0", f"{trimmed + 1}.0")
+        widget.configure(state="disabled")
+        if at_bottom:
+            widget.yview("end")
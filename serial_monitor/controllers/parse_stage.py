@@ -0,0 +1,155 @@
+import time
+import threading
+from collections import deque
+from queue import Queue
+from serial_monitor.formatters import to_text
+from serial_monitor.parsers import ParsedBatch, make_parser
+
+PARSE_MODES = ("inline", "thread", "process")
+
+
+def _prepare(parser, frames: list) -> list:
+    # текстовым парсерам — строки, бинарным — байты как есть
+    if getattr(parser, "binary", False):
+        return frames
+    return [to_text(frame) for frame in frames]
+
+
+class ParseStage:
+    """
+    Разбор принятых кадров между SerialHandler и UI.
+
+    inline  — parse_many прямо в потоке Tk (как раньше);
+    thread  — в отдельном потоке, UI забирает готовые ParsedBatch;
+    process — в отдельном процессе для тяжёлых парсеров. Кадры
+              копируются в bytes, парсер собирается в процессе из
+              parser.config, поэтому его счётчики там же и остаются.
+
+    submit() вызывается из потока Tk на каждый тик, collect() отдаёт
+    готовые пачки (время приёма, ParsedBatch) в порядке отправки.
+
+    Если разбор в потоке или процессе упал, пачка считается в failed,
+    а она и все следующие разбираются inline; упавший inline разбор
+    тоже только считается в failed.
+    """
+
+    def __init__(self, parser=None, mode: str = "thread"):
+        if mode not in PARSE_MODES:
+            raise ValueError(f"Invalid parse mode: {mode}")
+        self.parser = parser
+        self.mode = mode
+        self.failed = 0  # сколько раз разбор пачки упал
+        self._ready: deque[tuple[float | list, ParsedBatch]] = deque()
+        self._inbox: Queue | None = None
+        self._futures: deque = deque()
+        self._fallback: deque = deque()  # пачки от упавшего потока для разбора inline
+        self._executor = None  # ProcessPoolExecutor в режиме process
+        if parser is None or mode == "inline":
+            return
+        if mode == "thread":
+            self._inbox = Queue()
+            threading.Thread(target=self._worker, daemon=True).start()
+        else:
+            # multiprocessing грузится только для этого режима
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # spawn: fork из процесса с Tk и потоками чтения может зависнуть
+            self._executor = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process, initargs=(parser.config,))
+
+    def submit(self, frames: list, ts=None) -> None:
+        """ts — время приёма пачки или список времён по кадрам (для захватов)."""
+        if self.parser is None or not frames:
+            return
+        ts = time.time() if ts is None else ts
+        if self._inbox is not None:
+            # и после сбоя потока: он пересылает пачки в _fallback по порядку
+            self._inbox.put((ts, frames))
+        elif self._executor is not None:
+            payload = [bytes(frame) if not isinstance(frame, str) else frame for frame in frames]
+            try:
+                self._futures.append((ts, payload, self._executor.submit(_parse_in_process, payload)))
+            except Exception:  # пул уже сломан (процесс умер)
+                self.failed += 1
+                self._to_inline()
+                self._parse_inline(ts, payload)
+        else:
+            self._parse_inline(ts, frames)
+
+    def collect(self) -> list[tuple[float | list, ParsedBatch]]:
+        while self._futures and self._futures[0][2].done():
+            ts, payload, future = self._futures.popleft()
+            try:
+                self._ready.append((ts, future.result()))
+            except Exception:
+                self.failed += 1
+                self._to_inline()
+                self._parse_inline(ts, payload)
+        while self._fallback:
+            self._parse_inline(*self._fallback.popleft())
+        batches = []
+        while self._ready:
+            batches.append(self._ready.popleft())
+        return batches
+
+    @property
+    def busy(self) -> bool:
+        """Есть отправленные, но ещё не собранные кадры."""
+        return bool(self._ready or self._futures or self._fallback
+                    or (self._inbox and self._inbox.unfinished_tasks))
+
+    def close(self) -> None:
+        if self._inbox is not None:
+            self._inbox.put(None)
+            self._inbox = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _parse_inline(self, ts, frames: list) -> None:
+        try:
+            self._ready.append((ts, self.parser.parse_many(_prepare(self.parser, frames))))
+        except Exception:
+            self.failed += 1
+
+    def _to_inline(self) -> None:
+        # процесс разбора сломан: остальные отправленные пачки — inline, по порядку
+        self.mode = "inline"
+        futures, self._futures = self._futures, deque()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        for ts, payload, future in futures:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                self._ready.append((ts, future.result()))
+            else:
+                self._parse_inline(ts, payload)
+
+    def _worker(self):
+        inbox, parser = self._inbox, self.parser
+        while (item := inbox.get()) is not None:
+            try:
+                if self.mode == "inline":
+                    self._fallback.append(item)
+                    continue
+                ts, frames = item
+                try:
+                    self._ready.append((ts, parser.parse_many(_prepare(parser, frames))))
+                except Exception:
+                    # поток жив и дальше, но разбор переходит в поток Tk
+                    self.failed += 1
+                    self.mode = "inline"
+                    self._fallback.append(item)
+            finally:
+                inbox.task_done()
+
+
+_process_parser = None
+
+def _init_process(config: dict):
+    global _process_parser
+    _process_parser = make_parser(config)
+
+def _parse_in_process(frames: list) -> ParsedBatch:
+    return _process_parser.parse_many(_prepare(_process_parser, frames))
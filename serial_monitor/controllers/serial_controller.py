@@ -1,34 +1,202 @@
 import threading
 import time
+from collections import deque
 from serial_monitor.serial_io import SerialHandler
+from serial_monitor.framing import make_framer
 from serial_monitor.settings_model import SettingsModel
 
+# thread — SerialHandler (поток с блокирующим read), asyncio — AsyncHandler (event loop по fd)
+IO_BACKENDS = ("thread", "asyncio")
+
 class SerialController:
-    def __init__(self):
-        self.handler: SerialHandler | None = None
+    """
+    Подключение к порту. Если устройство пропало (сброс, выдернули USB)
+    и включён auto_reconnect, соединение считается живым: порт
+    переоткрывается с backoff от reconnect_min_ms до reconnect_max_ms
+    (или сразу, как только PortRegistry снова увидит порт), новый
+    обработчик пишет в ту же очередь, так что консоль и график не
+    сбрасываются. Разрыв отмечается в журнале и в events,
+    длительность — в reconnect_stats.
+    """
+
+    def __init__(self, ports=None):
+        self.handler = None  # SerialHandler или ReplayHandler
+        self.logger = None   # SessionLogger или CaptureWriter
         self.connected = False
-        
+        self.replaying = False
+        self.reconnecting = False
+        self.on_frames = None  # пробуждение UI из потока чтения
+        self.ports = ports     # PortRegistry: ускоряет переподключение
+        self.events: deque[str] = deque(maxlen=100)  # служебные сообщения для консоли
+        self.reconnects = 0
+        self.reconnect_attempts = 0
+        self.last_reconnect_ms = 0.0
+        self.max_reconnect_ms = 0.0
+        self.downtime = 0.0
+        self._dtr: bool | None = None
+        self._rts: bool | None = None
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()      # disconnect() во время переподключения
+        self._port_seen = threading.Event()   # реестр снова увидел порт
+
+    def connect(self, settings: SettingsModel | None = None):
+        self.settings = settings or SettingsModel()
+        config = self.settings.config
+        self._cancel.clear()
+        self.handler = self._open_handler()
+        if config.log_path:
+            # журнал открываем, только когда порт уже открылся
+            from serial_monitor.capture import CaptureWriter, CAPTURE_SUFFIX
+            from serial_monitor.session_log import SessionLogger
+            try:
+                if config.log_path.endswith(CAPTURE_SUFFIX):
+                    self.logger = CaptureWriter(config.log_path)
+                else:
+                    self.logger = SessionLogger(
+                        config.log_path,
+                        max_bytes=config.log_max_bytes,
+                        rotate_s=config.log_rotate_s,
+                        compress=config.log_compress,
+                        )
+            except (OSError, ValueError):
+                self.handler.stop()
+                self.handler = None
+                raise
+            self.handler.logger = self.logger
+        self.handler.start()
+        self.connected = True
 
-    def connect(self):
-        self.settings = SettingsModel()
-        self.handler = SerialHandler(
+    def _open_handler(self) -> SerialHandler:
+        config = self.settings.config
+        if config.io_backend not in IO_BACKENDS:
+            raise ValueError(f"Invalid I/O backend: {config.io_backend}")
+        handler_class = SerialHandler
+        if config.io_backend == "asyncio":
+            from serial_monitor.aio import AsyncHandler
+            handler_class = AsyncHandler
+        return handler_class(
             port=self.settings.port, 
             baudrate=self.settings.baudrate,
             bytesize=self.settings.bytesize,
             parity=self.settings.parity,
-            timeout=self.settings.send_delay_ms
+            timeout=self.settings.send_delay_ms,
+            framer=make_framer(config.framing, config.frame_length, config.idle_gap_ms),
+            on_frames=self.on_frames,
+            logger=self.logger,
+            on_error=self._on_port_lost if config.auto_reconnect else None,
             )
+
+    @property
+    def reconnect_stats(self) -> dict:
+        return {
+            "reconnects": self.reconnects,
+            "attempts": self.reconnect_attempts,
+            "last_ms": self.last_reconnect_ms,
+            "max_ms": self.max_reconnect_ms,
+            "downtime": self.downtime,
+        }
+
+    def pop_events(self) -> list[str]:
+        events = []
+        while self.events:
+            events.append(self.events.popleft())
+        return events
+
+    def _event(self, text: str):
+        self.events.append(text)
+        # из потока переподключения: disconnect() может обнулить self.logger между проверкой и вызовом
+        logger = self.logger
+        if logger:
+            logger.mark(text)
+        if self.on_frames:
+            self.on_frames()
+
+    def _on_port_lost(self, error: Exception):
+        # вызывается из потока чтения пропавшего порта; он же и переподключает,
+        # всё равно после этого завершится
+        lost = self.handler
+        if lost is None or self._cancel.is_set():
+            return
+        lost_at = time.perf_counter()
+        self.reconnecting = True
+        lost.stop()
+        port = self.settings.port
+        self._event(f"{port} lost: {error}")
+        self._port_seen.clear()
+        if self.ports:
+            self.ports.subscribe(self._on_ports_changed)
+            self.ports.poke()
+        try:
+            handler = self._reopen(lost)
+        finally:
+            if self.ports:
+                self.ports.unsubscribe(self._on_ports_changed)
+            self.reconnecting = False
+        if handler is None:
+            return
+        elapsed = time.perf_counter() - lost_at
+        self.reconnects += 1
+        self.last_reconnect_ms = elapsed * 1000
+        self.max_reconnect_ms = max(self.max_reconnect_ms, self.last_reconnect_ms)
+        self.downtime += elapsed
+        self._event(f"{port} reconnected in {self.last_reconnect_ms:.0f} ms")
+
+    def _reopen(self, lost) -> SerialHandler | None:
+        config = self.settings.config
+        delay = config.reconnect_min_ms / 1000
+        while not self._cancel.is_set():
+            self.reconnect_attempts += 1
+            try:
+                handler = self._open_handler()
+            except OSError:  # SerialException — тоже OSError
+                # ждём backoff или появления порта в реестре, что раньше
+                self._port_seen.wait(delay)
+                self._port_seen.clear()
+                delay = min(delay * 2, config.reconnect_max_ms / 1000)
+                continue
+            handler.queue = lost.queue  # недочитанные кадры и порядок сохраняются
+            if self._dtr is not None:
+                handler.set_dtr(self._dtr)
+            if self._rts is not None:
+                handler.set_rts(self._rts)
+            with self._lock:
+                if self._cancel.is_set():
+                    handler.stop()
+                    return None
+                self.handler = handler
+                handler.start()
+            return handler
+        return None
+
+    def _on_ports_changed(self, added, removed):
+        if self.settings.port in added:
+            self._port_seen.set()
+
+    def connect_replay(self, path: str, speed: float = 1.0):
+        """Вместо порта — проигрывание захвата или журнала через ту же очередь."""
+        from serial_monitor.replay import ReplayHandler
+
+        self.handler = ReplayHandler(path, speed, on_frames=self.on_frames)
         self.handler.start()
         self.connected = True
+        self.replaying = True
 
     def disconnect(self):
-        if self.handler:
-            self.handler.stop()
-            self.handler = None
+        with self._lock:
+            self._cancel.set()
+            self._port_seen.set()
+            handler, self.handler = self.handler, None
+        if handler:
+            handler.stop()
+        if self.logger:
+            self.logger.close()
+            self.logger = None
         self.connected = False
+        self.replaying = False
 
     def send(self, data: str):
-        if self.handler and self.connected:
+        # пока порт переоткрывается, отправлять некуда
+        if self.handler and self.connected and not self.reconnecting:
             self.handler.send(data)
 
     def send_file(self, path: str, output_controller, mode: str, delay: float):
@@ -42,18 +210,26 @@ class SerialController:
                     time.sleep(delay)
         threading.Thread(target=worker, daemon=True).start()
 
-    def read_lines(self) -> list[str]:
+    def read_lines(self, max_lines: int = 0) -> list[memoryview]:
+        """Забирает из очереди до max_lines кадров (0 — все), остальное ждёт следующего тика."""
         lines = []
         if self.handler:
-            while not self.handler.queue.empty():
-                lines.append(self.handler.queue.get())
+            queue = self.handler.queue
+            while not queue.empty() and (not max_lines or len(lines) < max_lines):
+                lines.append(queue.get_nowait())
         return lines
 
+    @property
+    def has_pending(self) -> bool:
+        return bool(self.handler) and not self.handler.queue.empty()
+
     def set_dtr(self, value: bool):
+        self._dtr = value  # восстанавливается после переподключения
         if self.handler:
             self.handler.set_dtr(value)
 
     def set_rts(self, value: bool):
+        self._rts = value
         if self.handler:
             self.handler.set_rts(value)
 
@@ -1,11 +1,48 @@
+# Таблицы на все 256 значений байта: форматирование сводится к выборке из кортежа
+DEC_TABLE = tuple(str(i) for i in range(256))
+BIN_TABLE = tuple(f"{i:08b}" for i in range(256))
+
+
+def to_bytes(data) -> bytes:
+    """Отправляемые строки кодируются в UTF-8, принятые кадры уже байты."""
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+def to_text(data) -> str:
+    """Декодирует кадр в текст только тогда, когда нужен текст."""
+    if isinstance(data, str):
+        return data
+    return str(data, "utf-8", errors="replace").rstrip("\r")
+
+def _ansi(data) -> str:
+    return str(to_bytes(data), "latin1")
+
+def _hex(data) -> str:
+    return to_bytes(data).hex(" ").upper()
+
+def _dec(data) -> str:
+    table = DEC_TABLE
+    return " ".join([table[b] for b in to_bytes(data)])
+
+def _bin(data) -> str:
+    table = BIN_TABLE
+    return " ".join([table[b] for b in to_bytes(data)])
+
 ENCODINGS = {
-        "UTF-8": lambda x: x,
-        "ANSI": lambda x: x.encode("utf-8", errors="ignore").decode("latin1", errors="ignore"),
-        "HEX": lambda x: " ".join(f"{ord(c):02X}" for c in x),
-        "DEC": lambda x: " ".join(str(ord(c)) for c in x),
-        "BIN": lambda x: " ".join(f"{ord(c):08b}" for c in x),
+        "UTF-8": to_text,
+        "ANSI": _ansi,
+        "HEX": _hex,
+        "DEC": _dec,
+        "BIN": _bin,
     }
 
-def format_data(mode : str, data: str) -> str:
+def format_data(mode : str, data) -> str:
         encoder = ENCODINGS.get(mode, ENCODINGS["UTF-8"])
-        return encoder(data)
\ No newline at end of file
+        return encoder(data)
+
+def format_many(mode: str, frames, prefix: str = "") -> str:
+    """Форматирует все кадры одного тика в одну строку, по кадру на строку."""
+    encoder = ENCODINGS.get(mode, ENCODINGS["UTF-8"])
+    formatted = [encoder(frame) for frame in frames]
+    if not formatted:
+        return ""
+    return prefix + ("\n" + prefix).join(formatted)
@@ -0,0 +1,164 @@
+import time
+from serial_monitor.ring_buffer import ByteRing
+
+SLIP_END = 0xC0
+SLIP_ESC = 0xDB
+SLIP_ESC_END = 0xDC
+SLIP_ESC_ESC = 0xDD
+
+DELIMITERS = {
+    "LF": b"\n",
+    "CRLF": b"\r\n",
+    "NUL": b"\0",          # также граница COBS-кадров
+    "SLIP": bytes([SLIP_END]),
+}
+# длина кадра в заголовке, little-endian: размер заголовка в байтах
+LENGTH_PREFIXES = {
+    "LEN8": 1,
+    "LEN16": 2,
+}
+
+FRAMING_OPTIONS = (*DELIMITERS.keys(), *LENGTH_PREFIXES.keys(), "FIXED", "IDLE")
+
+
+class DelimiterFramer:
+    """Режет поток байт на кадры по разделителю (сам разделитель отбрасывается)."""
+
+    def __init__(self, delimiter: bytes = b"\n", ring: ByteRing | None = None):
+        if not delimiter:
+            raise ValueError("Delimiter must not be empty")
+        self.delimiter = delimiter
+        self.ring = ring or ByteRing()
+        self._scanned = 0  # сколько байт хвоста уже просмотрено без разделителя
+
+    def feed(self, data) -> list[memoryview]:
+        ring, delimiter = self.ring, self.delimiter
+        ring.write(data)
+        frames = []
+        pos = ring.find(delimiter, self._scanned)
+        while pos >= 0:
+            frames.append(ring.take(pos))
+            ring.skip(len(delimiter))
+            pos = ring.find(delimiter)
+        self._scanned = max(0, ring.pending - len(delimiter) + 1)
+        return frames
+
+    def poll(self) -> list[memoryview]:
+        return []
+
+
+class FixedLengthFramer:
+    """Кадры фиксированной длины."""
+
+    def __init__(self, length: int, ring: ByteRing | None = None):
+        if length <= 0:
+            raise ValueError(f"Invalid frame length: {length}")
+        self.length = length
+        self.ring = ring or ByteRing()
+
+    def feed(self, data) -> list[memoryview]:
+        ring = self.ring
+        ring.write(data)
+        return [ring.take(self.length) for _ in range(ring.pending // self.length)]
+
+    def poll(self) -> list[memoryview]:
+        return []
+
+
+class IdleGapFramer:
+    """Кадр заканчивается, когда линия молчит дольше gap секунд."""
+
+    def __init__(self, gap: float, ring: ByteRing | None = None):
+        if gap <= 0:
+            raise ValueError(f"Invalid idle gap: {gap}")
+        self.gap = gap
+        self.ring = ring or ByteRing()
+        self._last_rx = 0.0
+
+    def feed(self, data) -> list[memoryview]:
+        now = time.monotonic()
+        frames = self._take() if now - self._last_rx >= self.gap else []
+        self.ring.write(data)
+        self._last_rx = now
+        return frames
+
+    def poll(self) -> list[memoryview]:
+        if time.monotonic() - self._last_rx >= self.gap:
+            return self._take()
+        return []
+
+    def _take(self) -> list[memoryview]:
+        if not self.ring.pending:
+            return []
+        return [self.ring.take(self.ring.pending)]
+
+
+class LengthPrefixFramer:
+    """Кадры вида <длина><данные>; наружу отдаются только данные."""
+
+    def __init__(self, header_size: int = 2, ring: ByteRing | None = None):
+        self.header_size = header_size
+        self.ring = ring or ByteRing()
+
+    def feed(self, data) -> list[memoryview]:
+        ring, header = self.ring, self.header_size
+        ring.write(data)
+        frames = []
+        while ring.pending >= header:
+            size = int.from_bytes(ring.peek(header), "little")
+            if ring.pending < header + size:
+                break
+            ring.skip(header)
+            frames.append(ring.take(size))
+        return frames
+
+    def poll(self) -> list[memoryview]:
+        return []
+
+
+def slip_encode(payload: bytes) -> bytes:
+    escaped = payload.replace(b"\xdb", b"\xdb\xdd").replace(b"\xc0", b"\xdb\xdc")
+    return escaped + b"\xc0"
+
+def slip_decode(frame) -> bytes:
+    # сначала ESC_END: после него новых последовательностей ESC ESC_ESC не появится
+    return bytes(frame).replace(b"\xdb\xdc", b"\xc0").replace(b"\xdb\xdd", b"\xdb")
+
+def cobs_encode(payload: bytes) -> bytes:
+    out = bytearray()
+    for block in payload.split(b"\0"):
+        while len(block) >= 0xFE:
+            out.append(0xFF)
+            out += block[:0xFE]
+            block = block[0xFE:]
+        out.append(len(block) + 1)
+        out += block
+    return bytes(out) + b"\0"
+
+def cobs_decode(frame) -> bytes:
+    """Кадр без завершающего нуля (его отрезает фреймер NUL)."""
+    data = bytes(frame)
+    out = bytearray()
+    i, n = 0, len(data)
+    while i < n:
+        code = data[i]
+        end = i + code
+        if code == 0 or end > n:
+            raise ValueError("Invalid COBS frame")
+        out += data[i + 1:end]
+        i = end
+        if code < 0xFF and i < n:
+            out.append(0)
+    return bytes(out)
+
+
+def make_framer(framing: str = "LF", frame_length: int = 16, idle_gap_ms: int = 20):
+    if framing in DELIMITERS:
+        return DelimiterFramer(DELIMITERS[framing])
+    if framing in LENGTH_PREFIXES:
+        return LengthPrefixFramer(LENGTH_PREFIXES[framing])
+    if framing == "FIXED":
+        return FixedLengthFramer(frame_length)
+    if framing == "IDLE":
+        return IdleGapFramer(idle_gap_ms / 1000)
+    raise ValueError(f"Invalid framing: {framing}")
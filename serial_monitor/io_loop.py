@@ -0,0 +1,230 @@
+"""
+Много портов на одном потоке: IOLoop ждёт готовности всех открытых
+портов в selectors (epoll/kqueue) и читает только те, где есть данные,
+вместо отдельного потока с блокирующим read() на каждый порт.
+
+Только POSIX: на Windows у pyserial нет fd, который можно ждать в select.
+"""
+import os
+import selectors
+import threading
+import time
+from collections import deque
+from queue import Queue
+from threading import Event, current_thread
+import serial
+from serial_monitor.framing import DelimiterFramer
+
+
+class LoopPort:
+    """
+    Порт, обслуживаемый IOLoop, с интерфейсом SerialHandler: queue,
+    start/stop, send, set_dtr/set_rts, logger, on_frames, on_error.
+
+    Если задана records (общая очередь нескольких портов), кадры идут
+    туда пачками (время, index, кадры) вместо queue: все порты читает
+    один поток, поэтому порядок в records — это порядок прихода.
+    """
+
+    def __init__(self, loop: "IOLoop", port: str, baudrate: int, bytesize: int = 8,
+                 parity: str = "N", framer=None, index: int = 0, records: Queue | None = None,
+                 on_frames=None, logger=None, on_error=None):
+        self.loop = loop
+        self.port = port
+        self.index = index
+        self.framer = framer or DelimiterFramer(b"\n")
+        self.records = records
+        self.on_frames = on_frames
+        self.logger = logger
+        self.on_error = on_error  # on_error(exc) из потока IOLoop, порт уже снят с цикла
+        # timeout=0: read() отдаёт только то, что уже есть, цикл никогда не блокируется на порту
+        self.ser = serial.Serial(port=port, baudrate=baudrate, bytesize=bytesize,
+                                 parity=parity, timeout=0)
+        self.queue: Queue[memoryview] = Queue()
+        self.stop_event = Event()
+        self.frames = 0
+        self.bytes = 0
+        self._fd = -1
+
+    def start(self):
+        self.loop.add(self)
+
+    def stop(self):
+        self.stop_event.set()
+        self.loop.remove(self)
+        if self.ser.is_open:
+            self.ser.close()
+
+    def send(self, data: str):
+        payload = data.encode("utf-8")
+        self.ser.write(payload + b"\n")
+        if self.logger:
+            self.logger.log("TX", payload)
+
+    def set_dtr(self, state: bool):
+        if self.ser and self.ser.is_open:
+            self.ser.dtr = state
+
+    def set_rts(self, state: bool):
+        if self.ser and self.ser.is_open:
+            self.ser.rts = state
+
+    def _read(self) -> None:
+        data = self.ser.read(max(1, self.ser.in_waiting))
+        self._deliver(self.framer.feed(data) if data else [])
+        self.bytes += len(data)
+
+    def _poll(self) -> None:
+        self._deliver(self.framer.poll())
+
+    def _deliver(self, frames: list):
+        queued = [frame for frame in frames if frame]
+        if not queued:
+            return
+        self.frames += len(queued)
+        if self.records is not None:
+            self.records.put((time.time(), self.index, queued))
+        else:
+            for frame in queued:
+                self.queue.put(frame)
+        if self.logger:
+            self.logger.log_many("RX", queued)
+        if self.on_frames:
+            self.on_frames()
+
+
+class IOLoop:
+    """
+    Один поток и один selector на все LoopPort. add/remove можно звать
+    из любого потока: изменения передаются циклу через pipe-пробуждение.
+    Порты с IdleGapFramer опрашиваются не реже раза в свой gap.
+
+    stats — сколько раз цикл просыпался и сколько прочитал.
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._commands: deque = deque()
+        self._ports: list[LoopPort] = []
+        self._stop = Event()
+        self.thread: threading.Thread | None = None
+        self.wakeups = 0
+        self.reads = 0
+
+    @property
+    def ports(self) -> list[LoopPort]:
+        return list(self._ports)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "ports": len(self._ports),
+            "wakeups": self.wakeups,
+            "reads": self.reads,
+            "frames": sum(port.frames for port in self._ports),
+        }
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self):
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._wake()
+        if self.thread and self.thread is not current_thread():
+            self.thread.join(timeout=1)
+        for port in list(self._ports):
+            port.stop_event.set()
+            if port.ser.is_open:
+                port.ser.close()
+        self._ports.clear()
+        self._selector.close()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def add(self, port: LoopPort):
+        self._call(self._register, port)
+
+    def remove(self, port: LoopPort):
+        self._call(self._unregister, port)
+
+    def _call(self, command, port: LoopPort):
+        # из потока цикла (on_error, on_frames) — сразу, иначе ждём, пока цикл выполнит
+        if self.thread is None or self.thread is current_thread() or self._stop.is_set():
+            command(port)
+            return
+        done = Event()
+        self._commands.append((command, port, done))
+        self._wake()
+        done.wait(1)
+
+    def _wake(self):
+        try:
+            os.write(self._wake_w, b"\0")
+        except (BlockingIOError, OSError):
+            pass  # в pipe уже лежит пробуждение или цикл закрыт
+
+    def _register(self, port: LoopPort):
+        if port not in self._ports:
+            port._fd = port.ser.fileno()
+            self._selector.register(port._fd, selectors.EVENT_READ, port)
+            self._ports.append(port)
+
+    def _unregister(self, port: LoopPort):
+        if port in self._ports:
+            self._ports.remove(port)
+            try:
+                self._selector.unregister(port._fd)
+            except (KeyError, ValueError, OSError):
+                pass  # fd уже закрыт
+
+    def _timeout(self) -> float | None:
+        gaps = [port.framer.gap for port in self._ports if getattr(port.framer, "gap", None)]
+        return min(gaps) if gaps else None
+
+    def _run(self):
+        while not self._stop.is_set():
+            events = self._selector.select(self._timeout())
+            self.wakeups += 1
+            for key, _ in events:
+                if key.data is None:
+                    self._run_commands()
+                else:
+                    self._read(key.data)
+            for port in list(self._ports):
+                if getattr(port.framer, "gap", None):
+                    port._poll()
+
+    def _run_commands(self):
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        while self._commands:
+            command, port, done = self._commands.popleft()
+            command(port)
+            done.set()
+
+    def _read(self, port: LoopPort):
+        if port not in self._ports:
+            return  # сняли в этой же итерации
+        self.reads += 1
+        try:
+            port._read()
+        except (serial.SerialException, OSError, TypeError) as e:
+            # устройство пропало: «готов к чтению, но данных нет» и т.п.
+            self._unregister(port)
+            port.ser.close()  # fd больше не нужен, send() по is_open его пропустит
+            if port.stop_event.is_set():
+                return
+            if port.on_error:
+                port.on_error(e)
@@ -1,6 +1,45 @@
+import binascii
 import json
 import re
-from typing import Dict, Any, Optional
+import struct
+import zlib
+from array import array
+from operator import methodcaller
+from typing import Dict, Any, Optional, NamedTuple
+from serial_monitor.framing import slip_decode, cobs_decode
+
+
+def _auto(value: Optional[str]) -> Any:
+    """Конвертация строк в float или int (тип поля не указан в конфиге)."""
+    if value is None:
+        return None
+    try:
+        if "." in value:
+            return float(value)
+        return int(value)
+    except ValueError:
+        return value
+
+def _hex(value: str) -> int:
+    return int(value, 16)
+
+# тип поля в JSON -> функция конвертации
+CONVERTERS = {
+    "float": float,
+    "int": int,
+    "hex": _hex,
+    "str": str,
+    "auto": _auto,
+}
+NUMERIC_TYPES = ("float", "int", "hex")
+
+
+class ParsedBatch(NamedTuple):
+    """Результат parse_many в колонках: rows — индексы разобранных строк."""
+    rows: list[int]
+    columns: Dict[str, Any]  # числовые поля — array("d"), остальные — list
+    # для MultiParser у колонок разные строки: поле -> индексы его строк
+    column_rows: Optional[Dict[str, list[int]]] = None
 
 
 class LineParser:
@@ -13,48 +52,453 @@ class LineParser:
             "type": "regex" | "csv",
             "pattern": "TEMP:(?P<TEMP>[0-9.]+) HUM:(?P<HUM>[0-9.]+)",
             "delimiter": ",",
-            "fields": ["TEMP", "HUM"]
+            "fields": ["TEMP", "HUM"] | {"TEMP": "float", "HUM": "float"}
         }
+
+        Конфиг компилируется один раз: self.parse(line) -> dict — готовая
+        функция под конкретный тип парсера и типы полей, без разбора
+        конфига на каждой строке.
         """
         self.config = config
         self.regex: Optional[re.Pattern] = None
         if config.get("type") == "regex":
             self.regex = re.compile(config["pattern"])
+        self.fields = self._field_types()
+        self._extract = self._compile_extract()
+        self._extract_many = self._compile_extract_many()
+        self.parse = self._compile_parse()
+
+    def parse_many(self, lines) -> ParsedBatch:
+        """
+        Разбирает пачку строк сразу в колонки, пропуская неразобранные.
+        Поиск и конвертация идут через map() по всей пачке; если какое-то
+        значение колонки не конвертируется, пачка разбирается построчно.
+        """
+        rows, raw_columns = self._extract_many(lines)
+        columns = {}
+        try:
+            for (name, kind), values in zip(self.fields, raw_columns):
+                convert = CONVERTERS[kind]
+                if kind in NUMERIC_TYPES:
+                    columns[name] = array("d", map(convert, values))
+                else:
+                    columns[name] = list(map(convert, values))
+        except (ValueError, TypeError):
+            return self._parse_rows(rows, list(zip(*raw_columns)))
+        return ParsedBatch(rows, columns)
+
+    def _parse_rows(self, rows: list[int], raws: list) -> ParsedBatch:
+        # медленный путь: строки с неконвертируемыми значениями отбрасываются целиком
+        converters = [CONVERTERS[kind] for _, kind in self.fields]
+        columns = [array("d") if kind in NUMERIC_TYPES else [] for _, kind in self.fields]
+        kept = []
+        for i, raw in zip(rows, raws):
+            try:
+                values = [convert(v) for convert, v in zip(converters, raw)]
+            except (ValueError, TypeError):
+                continue
+            kept.append(i)
+            for column, value in zip(columns, values):
+                column.append(value)
+        return ParsedBatch(kept, {name: column for (name, _), column in zip(self.fields, columns)})
+
+    def _field_types(self) -> list[tuple[str, str]]:
+        fields = self.config.get("fields")
+        if isinstance(fields, dict):
+            types = dict(fields)
+        else:
+            names = fields if fields is not None else \
+                    (list(self.regex.groupindex) if self.regex else [])
+            types = {name: "auto" for name in names}
+        if self.regex:
+            # для regex поля — это именованные группы, в порядке шаблона
+            types = {name: types.get(name, "auto") for name in self.regex.groupindex}
+        for name, kind in types.items():
+            if kind not in CONVERTERS:
+                raise ValueError(f"Invalid type {kind!r} for field {name!r}")
+        return list(types.items())
+
+    def _compile_extract(self):
+        """Функция: строка -> кортеж сырых значений полей или None."""
+        kind = self.config.get("type")
+        names = [name for name, _ in self.fields]
+        if kind == "regex" and names:
+            search = self.regex.search
+            if len(names) == 1:
+                name = names[0]
+
+                def extract(line):
+                    match = search(line)
+                    return (match.group(name),) if match else None
+            else:
+                def extract(line):
+                    match = search(line)
+                    return match.group(*names) if match else None
+            return extract
+        if kind == "csv":
+            delimiter = self.config.get("delimiter", ",")
+            count = len(names)
+
+            def extract(line):
+                parts = line.strip().split(delimiter)
+                return parts if len(parts) == count else None
+            return extract
+        return lambda line: None
+
+    def _compile_extract_many(self):
+        """Функция: строки -> (индексы разобранных строк, колонки сырых значений)."""
+        kind = self.config.get("type")
+        names = [name for name, _ in self.fields]
+        if kind == "regex" and names:
+            search = self.regex.search
+            group = methodcaller("group", *names)
+
+            def extract_many(lines):
+                matches = list(map(search, lines))
+                rows = [i for i, match in enumerate(matches) if match is not None]
+                found = [matches[i] for i in rows]
+                if len(names) == 1:
+                    return rows, [list(map(group, found))]
+                return rows, list(zip(*map(group, found))) or [() for _ in names]
+            return extract_many
+        if kind == "csv":
+            delimiter = self.config.get("delimiter", ",")
+            count = len(names)
+
+            def extract_many(lines):
+                parts = [line.strip().split(delimiter) for line in lines]
+                rows = [i for i, p in enumerate(parts) if len(p) == count]
+                return rows, list(zip(*[parts[i] for i in rows])) or [() for _ in names]
+            return extract_many
+        return lambda lines: ([], [() for _ in names])
+
+    def _compile_parse(self):
+        extract = self._extract
+        names = [name for name, _ in self.fields]
+        converters = [CONVERTERS[kind] for _, kind in self.fields]
+
+        if self.regex and len(names) > 1 and len(set(converters)) == 1:
+            # частый случай: regex, все поля одного типа — без промежуточных вызовов
+            search = self.regex.search
+            group = methodcaller("group", *names)
+            convert = converters[0]
+
+            def parse(line: str) -> Dict[str, Any]:
+                match = search(line)
+                if match is None:
+                    return {}
+                try:
+                    return dict(zip(names, map(convert, group(match))))
+                except (ValueError, TypeError):
+                    return {}
+            return parse
+
+        def parse(line: str) -> Dict[str, Any]:
+            raw = extract(line)
+            if raw is None:
+                return {}
+            try:
+                return {name: convert(v) for name, convert, v in zip(names, converters, raw)}
+            except (ValueError, TypeError):
+                return {}
+        return parse
+
+
+class MultiParser:
+    """
+    Несколько типов сообщений в одном потоке (TEMP:, IMU:, GPS: ...).
+
+    config example:
+    {
+        "type": "multi",
+        "messages": [
+            {"name": "temp", "prefix": "TEMP:", "type": "regex",
+             "pattern": "TEMP:(?P<TEMP>[0-9.]+)", "fields": {"TEMP": "float"}},
+            {"name": "imu", "prefix": "IMU:", "type": "csv",
+             "fields": {"ax": "float", "ay": "float", "az": "float"}},
+            {"name": "status", "type": "regex", "pattern": "state=(?P<state>\\w+)"}
+        ]
+    }
+
+    Сообщение выбирается по литеральному префиксу через словарь
+    (по одному словарю на каждую длину префикса, длинные префиксы
+    проверяются первыми), а не перебором всех regex. Сообщения без
+    префикса пробуются по порядку, только если префикс не нашёлся.
+    CSV-сообщениям отдаётся строка без префикса.
+    """
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.parsers: dict[str, LineParser] = {}
+        self._prefixes: dict[int, dict[str, tuple[str, int]]] = {}
+        self._fallback: list[str] = []
+        kinds: dict[str, tuple[bool, str]] = {}
+        for i, message in enumerate(config.get("messages", [])):
+            name = message.get("name", f"message{i}")
+            if name in self.parsers:
+                raise ValueError(f"Duplicate message name: {name!r}")
+            self.parsers[name] = LineParser(message)
+            for field, kind in self.parsers[name].fields:
+                # общее поле сливается в одну колонку: array("d") и list смешивать нельзя
+                numeric = kind in NUMERIC_TYPES
+                if kinds.setdefault(field, (numeric, name))[0] != numeric:
+                    raise ValueError(f"Field {field!r} has different types in messages "
+                                     f"{kinds[field][1]!r} and {name!r}")
+            prefix = message.get("prefix")
+            if prefix:
+                skip = len(prefix) if message.get("type") == "csv" else 0
+                by_prefix = self._prefixes.setdefault(len(prefix), {})
+                if prefix in by_prefix:
+                    raise ValueError(f"Duplicate message prefix: {prefix!r}")
+                by_prefix[prefix] = (name, skip)
+            else:
+                self._fallback.append(name)
+        self._lengths = sorted(self._prefixes, reverse=True)
+        self.matched: dict[str, int] = dict.fromkeys(self.parsers, 0)
+        self.unmatched = 0
+
+    def dispatch(self, line: str) -> tuple[str, int] | None:
+        """(имя сообщения, сколько символов префикса отрезать) или None."""
+        for length in self._lengths:
+            found = self._prefixes[length].get(line[:length])
+            if found:
+                return found
+        return None
 
     def parse(self, line: str) -> Dict[str, Any]:
-        if self.config["type"] == "regex":
-            return self._parse_regex(line)
-        elif self.config["type"] == "csv":
-            return self._parse_csv(line)
+        found = self.dispatch(line)
+        if found:
+            name, skip = found
+            parsed = self.parsers[name].parse(line[skip:] if skip else line)
+            if parsed:
+                self.matched[name] += 1
+                return parsed
         else:
-            return {}
+            for name in self._fallback:
+                parsed = self.parsers[name].parse(line)
+                if parsed:
+                    self.matched[name] += 1
+                    return parsed
+        self.unmatched += 1
+        return {}
 
-    def _parse_regex(self, line: str) -> Dict[str, Any]:
-        if not self.regex:
-            return {}
-        match = self.regex.search(line.strip())
-        if not match:
-            return {}
-        return {k: self._convert(v) for k, v in match.groupdict().items()}
+    def parse_many(self, lines) -> ParsedBatch:
+        """Раскладывает строки по типам сообщений и разбирает каждую группу пачкой."""
+        groups: dict[str, tuple[list[int], list[str]]] = {}
+        leftovers: list[tuple[int, str]] = []
+        dispatch = self.dispatch
+        for i, line in enumerate(lines):
+            found = dispatch(line)
+            if found:
+                name, skip = found
+                indices, texts = groups.setdefault(name, ([], []))
+                indices.append(i)
+                texts.append(line[skip:] if skip else line)
+            else:
+                leftovers.append((i, line))
 
-    def _parse_csv(self, line: str) -> Dict[str, Any]:
-        parts = line.strip().split(self.config.get("delimiter", ","))
-        fields = self.config.get("fields", [])
-        if len(parts) != len(fields):
-            return {}
-        return {field: self._convert(value) for field, value in zip(fields, parts)}
+        rows: set[int] = set()
+        columns: Dict[str, Any] = {}
+        column_rows: Dict[str, list[int]] = {}
+        shared: set[str] = set()  # поля, собранные из нескольких групп
+
+        def merge(name: str, indices: list[int], batch: ParsedBatch):
+            self.matched[name] += len(batch.rows)
+            picked = [indices[r] for r in batch.rows]
+            rows.update(picked)
+            for field, column in batch.columns.items():
+                if field in columns:
+                    columns[field].extend(column)
+                    column_rows[field].extend(picked)
+                    shared.add(field)
+                else:
+                    columns[field] = column
+                    column_rows[field] = picked
+
+        for name, (indices, texts) in groups.items():
+            merge(name, indices, self.parsers[name].parse_many(texts))
+        for name in self._fallback:
+            if not leftovers:
+                break
+            indices = [i for i, _ in leftovers]
+            batch = self.parsers[name].parse_many([line for _, line in leftovers])
+            merge(name, indices, batch)
+            done = set(batch.rows)
+            leftovers = [item for r, item in enumerate(leftovers) if r not in done]
+
+        # группы шли по типам сообщений — общие поля возвращаем в порядок строк
+        for field in shared:
+            indices = column_rows[field]
+            order = sorted(range(len(indices)), key=indices.__getitem__)
+            column = columns[field]
+            values = [column[i] for i in order]
+            columns[field] = array(column.typecode, values) if isinstance(column, array) else values
+            column_rows[field] = [indices[i] for i in order]
+
+        self.unmatched += len(lines) - len(rows)
+        return ParsedBatch(sorted(rows), columns, column_rows)
+
+
+def _crc8(data: bytes, crc: int = 0) -> int:
+    table = _CRC8_TABLE
+    for byte in data:
+        crc = table[crc ^ byte]
+    return crc
+
+def _crc8_table(poly: int = 0x07) -> tuple[int, ...]:
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table.append(crc)
+    return tuple(table)
+
+_CRC8_TABLE = _crc8_table()
+
+# имя CRC -> (функция, размер в байтах)
+CRCS = {
+    "crc8": (_crc8, 1),
+    "crc16-ccitt": (lambda data: binascii.crc_hqx(data, 0xFFFF), 2),
+    "crc32": (zlib.crc32, 4),
+}
+
+# коды struct -> типы numpy (стандартные размеры, без выравнивания)
+_NUMPY_CODES = {
+    "b": "i1", "B": "u1", "?": "?", "h": "i2", "H": "u2", "i": "i4", "I": "u4",
+    "l": "i4", "L": "u4", "q": "i8", "Q": "u8", "e": "f2", "f": "f4", "d": "f8",
+}
+
+
+class BinaryParser:
+    """
+    Упакованная бинарная телеметрия.
+
+    config example:
+    {
+        "type": "binary",
+        "framing": "slip" | "cobs" | "none",
+        "format": "<Hff",
+        "fields": ["id", "temp", "hum"],
+        "crc": "crc16-ccitt" | "crc32" | "crc8",
+        "crc_byteorder": "little"
+    }
+
+    Границы кадров режет SerialHandler (framing SLIP, NUL для COBS,
+    LEN8/LEN16 или FIXED), парсер снимает SLIP/COBS-кодирование,
+    проверяет CRC в хвосте кадра и распаковывает payload по format.
+    parse_many склеивает все прошедшие проверку кадры и распаковывает
+    их одним numpy.frombuffer со структурным dtype (без numpy —
+    struct.iter_unpack).
+    """
 
-    def _convert(self, value: str) -> Any:
-        """Конвертация строк в float или int."""
+    binary = True  # получает кадры байтами, а не текстом
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.struct = struct.Struct(config["format"])
+        self.names = list(config.get("fields", []))
+        values = len(self.struct.unpack(bytes(self.struct.size)))
+        if len(self.names) != values:
+            raise ValueError(f"Format {config['format']!r} has {values} values, "
+                             f"but {len(self.names)} fields are given")
+        decoders = {"none": bytes, "slip": slip_decode, "cobs": cobs_decode}
+        framing = config.get("framing", "none")
+        if framing not in decoders:
+            raise ValueError(f"Invalid binary framing: {framing}")
+        self._decode = decoders[framing]
+        crc = config.get("crc")
+        if crc and crc not in CRCS:
+            raise ValueError(f"Invalid crc: {crc}")
+        self._crc, self._crc_size = CRCS[crc] if crc else (None, 0)
+        self._crc_order = config.get("crc_byteorder", "little")
+        self._dtype = None  # numpy dtype строится при первом parse_many
+        self.crc_errors = 0
+        self.size_errors = 0
+
+    def payload(self, frame) -> Optional[bytes]:
+        """Payload кадра без кодирования и CRC или None, если кадр битый."""
         try:
-            if "." in value:
-                return float(value)
-            return int(value)
+            data = self._decode(frame)
         except ValueError:
-            return value
+            self.size_errors += 1
+            return None
+        if self._crc:
+            data, tail = data[:-self._crc_size], data[-self._crc_size:]
+            if len(tail) != self._crc_size or \
+                    self._crc(data) != int.from_bytes(tail, self._crc_order):
+                self.crc_errors += 1
+                return None
+        if len(data) != self.struct.size:
+            self.size_errors += 1
+            return None
+        return data
+
+    def parse(self, frame) -> Dict[str, Any]:
+        data = self.payload(frame)
+        if data is None:
+            return {}
+        return dict(zip(self.names, self.struct.unpack(data)))
+
+    def parse_many(self, frames) -> ParsedBatch:
+        payloads = list(map(self.payload, frames))
+        rows = [i for i, data in enumerate(payloads) if data is not None]
+        if not rows:
+            return ParsedBatch([], {name: [] for name in self.names})
+        joined = b"".join([payloads[i] for i in rows])
+        dtype = self._numpy_dtype()
+        if dtype is not None:
+            import numpy as np
+
+            records = np.frombuffer(joined, dtype=dtype)
+            return ParsedBatch(rows, {name: records[name] for name in self.names})
+        columns = zip(*self.struct.iter_unpack(joined))
+        return ParsedBatch(rows, {name: list(column) for name, column in zip(self.names, columns)})
 
+    def _numpy_dtype(self):
+        if self._dtype is None:
+            self._dtype = _struct_to_dtype(self.struct.format, self.names) or False
+        return self._dtype or None
 
-def load_parser_config(path: str) -> LineParser:
+
+def _struct_to_dtype(fmt: str, names: list[str]):
+    """Структурный numpy dtype для формата struct или None (нет numpy / нет аналога)."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    order = {"<": "<", ">": ">", "!": ">", "=": "="}.get(fmt[:1])
+    if order is None:
+        return None  # нативное выравнивание "@" numpy не повторяет
+    formats, offsets, offset = [], [], 0
+    for count, code in re.findall(r"(\d*)([a-zA-Z?])", fmt[1:]):
+        count = int(count) if count else 1
+        if code == "x":
+            offset += count
+        elif code == "s":
+            formats.append(f"S{count}")
+            offsets.append(offset)
+            offset += count
+        elif code in _NUMPY_CODES:
+            item = np.dtype(order + _NUMPY_CODES[code])
+            for _ in range(count):
+                formats.append(item)
+                offsets.append(offset)
+                offset += item.itemsize
+        else:
+            return None
+    return np.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": offset})
+
+
+def make_parser(config: dict):
+    if config.get("type") == "multi":
+        return MultiParser(config)
+    if config.get("type") == "binary":
+        return BinaryParser(config)
+    return LineParser(config)
+
+
+def load_parser_config(path: str) -> LineParser | MultiParser | BinaryParser:
     with open(path, "r", encoding="utf-8") as f:
         config = json.load(f)
-    return LineParser(config)
+    return make_parser(config)
@@ -0,0 +1,131 @@
+import os
+import threading
+import time
+
+# на Linux появление/исчезновение порта меняет mtime /dev и список /sys/class/tty
+WATCH_PATHS = ("/dev", "/sys/class/tty")
+
+
+class PortRegistry:
+    """
+    Кэш списка последовательных портов.
+
+    Полный scan() (comports()) выполняется в фоновом потоке: сразу после
+    start(), когда меняется содержимое watch_paths, и, если следить не за
+    чем (Windows), раз в rescan_s секунд. ports отдаёт закэшированный
+    список мгновенно. Подписчики subscribe(callback) получают
+    callback(added, removed) из фонового потока — после первого
+    сканирования и при каждом изменении списка.
+
+    Ошибка сканирования или подписчика не останавливает фоновый поток
+    и не мешает остальным подписчикам: она считается в errors, последняя
+    хранится в last_error.
+    """
+
+    def __init__(self, scan=None, interval: float = 0.5, rescan_s: float = 5.0,
+                 watch_paths=WATCH_PATHS):
+        if scan is None:
+            from serial_monitor.serial_io import SerialHandler
+            scan = SerialHandler.available_ports
+        self.scan = scan
+        self.interval = interval
+        self.rescan_s = rescan_s
+        self.watch_paths = [path for path in watch_paths if os.path.isdir(path)]
+        self.scans = 0
+        self.errors = 0
+        self.last_error: Exception | None = None
+        self._ports: list[str] = []
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def ports(self) -> list[str]:
+        with self._lock:
+            return list(self._ports)
+
+    @property
+    def ready(self) -> bool:
+        return self.scans > 0
+
+    def subscribe(self, callback) -> None:
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def poke(self) -> None:
+        """Попросить фоновый поток пересканировать, не дожидаясь изменений."""
+        self._wake.set()
+
+    def refresh(self) -> list[str]:
+        """Синхронное сканирование (из любого потока)."""
+        ports = list(self.scan())
+        with self._lock:
+            old = self._ports
+            self._ports = ports
+        first = not self.scans
+        self.scans += 1
+        added = [p for p in ports if p not in old]
+        removed = [p for p in old if p not in ports]
+        if first or added or removed:
+            for callback in list(self._subscribers):
+                try:
+                    callback(added, removed)
+                except Exception as e:  # чужой callback: список уже обновлён, остальные получат событие
+                    self._error(e)
+        return ports
+
+    def _signature(self):
+        sig = []
+        for path in self.watch_paths:
+            try:
+                # mtime каталога на sysfs не обновляется — там сравниваем имена
+                sig.append(frozenset(os.listdir(path)) if path.startswith("/sys/")
+                           else os.stat(path).st_mtime_ns)
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def _loop(self):
+        signature = self._signature()
+        self._safe_refresh()
+        last_scan = time.monotonic()
+        while not self._stop.is_set():
+            poked = self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            current = self._signature()
+            stale = not self.watch_paths and time.monotonic() - last_scan >= self.rescan_s
+            if poked or stale or current != signature:
+                signature = current
+                self._safe_refresh()
+                last_scan = time.monotonic()
+
+    def _safe_refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            # драйвер отвалился посреди сканирования и т.п. — попробуем в следующий раз
+            self._error(e)
+
+    def _error(self, error: Exception):
+        self.errors += 1
+        self.last_error = error
@@ -0,0 +1,169 @@
+import time
+from itertools import islice
+from pathlib import Path
+from queue import Queue
+from threading import Thread, Event, current_thread
+from serial_monitor.capture import CaptureReader, CAPTURE_SUFFIX
+from serial_monitor.session_log import read_log
+
+
+class ReplayHandler:
+    """
+    Источник кадров с интерфейсом SerialHandler: проигрывает захват
+    (.smcap) или журнал SessionLogger в ту же очередь, так что дальше
+    кадры идут обычным путём — read_lines, OutputController, парсер, график.
+
+    speed: 1 — в реальном времени, N — в N раз быстрее, 0 — как можно
+    быстрее. В очередь попадают только RX-кадры; TX в журнале — это то,
+    что отправлял пользователь, порт их не возвращал.
+
+    stats — кадры, байты и время для замеров пропускной способности
+    всего конвейера: elapsed — до момента, когда потребитель отметил
+    drained() (всё забрано и отрисовано), produced — только проигрывание.
+    """
+
+    BATCH = 1024           # кадров за одно пробуждение UI на максимальной скорости
+    MAX_QUEUED = 1 << 16   # на максимальной скорости не убегаем от потребителя дальше этого
+
+    def __init__(self, path: str, speed: float = 1.0, on_frames=None):
+        if speed < 0:
+            raise ValueError(f"Invalid replay speed: {speed}")
+        self.path = path
+        self.speed = speed
+        self.on_frames = on_frames
+        self.logger = None  # совместимость с SerialHandler, проигрывание не журналируется
+        self.capture: CaptureReader | None = None
+        if path.endswith(CAPTURE_SUFFIX):
+            self.capture = CaptureReader(path)
+        elif not Path(path).is_file():
+            raise FileNotFoundError(path)
+        self.queue: Queue = Queue()
+        self.stop_event = Event()
+        self.finished = Event()
+        self.frames = 0
+        self.bytes = 0
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.drained_at: float | None = None
+        self.thread = Thread(target=self._play, daemon=True)
+
+    @staticmethod
+    def available_ports() -> list[str]:
+        return []
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread.is_alive() and self.thread is not current_thread():
+            self.thread.join(timeout=0.5)
+        if self.thread.ident is None and self.capture is not None:
+            self.capture.close()  # start() так и не вызвали, иначе захват закрывает сам поток
+
+    def send(self, data: str):
+        pass  # отвечать некому
+
+    def set_dtr(self, state: bool):
+        pass
+
+    def set_rts(self, state: bool):
+        pass
+
+    @property
+    def done(self) -> bool:
+        """Всё проиграно и всё забрано из очереди."""
+        return self.finished.is_set() and self.queue.empty()
+
+    def drained(self) -> bool:
+        """
+        Потребитель зовёт после отрисовки, когда у него ничего не осталось:
+        если всё проиграно и забрано, это конец сквозного замера.
+        """
+        if self.drained_at is None and self.done:
+            self.drained_at = time.perf_counter()
+        return self.drained_at is not None
+
+    @property
+    def stats(self) -> dict:
+        now = time.perf_counter()
+        start = self.started_at
+        elapsed = (self.drained_at or now) - start if start else 0.0
+        produced = (self.finished_at or now) - start if start else 0.0
+        return {
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "elapsed": elapsed,
+            "produced": produced,
+            "frames_per_s": self.frames / elapsed if elapsed else 0.0,
+            "bytes_per_s": self.bytes / elapsed if elapsed else 0.0,
+        }
+
+    def _records(self):
+        # (секунды от начала записи, кадр) только для RX
+        if self.capture is not None:
+            for record in self.capture.records():
+                if record.direction == "RX" and record.data:
+                    yield record.t_ns / 1e9, record.data
+        else:
+            first = None
+            for ts, direction, data in read_log(self.path):
+                if first is None:
+                    first = ts
+                if direction == "RX" and data:
+                    yield ts - first, data
+
+    def _play(self):
+        self.started_at = time.perf_counter()
+        records = self._records()
+        try:
+            if self.speed:
+                self._play_timed(records)
+            else:
+                self._play_fast(records)
+        finally:
+            # mmap закрывается только здесь: поток мог ещё читать его после таймаута join в stop()
+            records.close()
+            if self.capture is not None:
+                self.capture.close()
+            self.finished_at = time.perf_counter()
+            self.finished.set()
+            if self.on_frames:
+                self.on_frames()
+
+    def _play_fast(self, records):
+        while not self.stop_event.is_set():
+            batch = [data for _, data in islice(records, self.BATCH)]
+            if not batch:
+                return
+            while self.queue.qsize() > self.MAX_QUEUED and not self.stop_event.is_set():
+                time.sleep(0.001)
+            self._emit(batch)
+
+    def _play_timed(self, records):
+        batch = []
+        for t, data in records:
+            delay = t / self.speed - (time.perf_counter() - self.started_at)
+            if delay > 0:
+                # всё, что уже пора отдать, уходит одной пачкой перед ожиданием
+                if batch:
+                    self._emit(batch)
+                    batch = []
+                if self.stop_event.wait(delay):
+                    return
+            elif self.stop_event.is_set():
+                return
+            batch.append(data)
+            if len(batch) >= self.BATCH:
+                self._emit(batch)
+                batch = []
+        if batch:
+            self._emit(batch)
+
+    def _emit(self, batch: list):
+        for frame in batch:
+            self.queue.put(frame)
+            self.bytes += len(frame)
+        self.frames += len(batch)
+        if self.on_frames:
+            self.on_frames()
@@ -0,0 +1,74 @@
+class ByteRing:
+    """
+    Приёмный буфер из заранее выделенных bytearray-слабов, которые
+    используются по кругу. Кадры выдаются как memoryview без копирования.
+
+    Текущий слаб только дописывается. Когда место кончается, ещё не
+    нарезанный хвост переносится в следующий слаб. Слаб используется
+    повторно, только если на него не осталось ни одного memoryview —
+    иначе вместо него выделяется новый, так что выданный кадр никогда
+    не перезаписывается.
+    """
+
+    def __init__(self, slab_size: int = 1 << 18, slabs: int = 4):
+        self.slab_size = slab_size
+        self._slabs = [bytearray(slab_size) for _ in range(slabs)]
+        self._index = 0
+        self._buf = self._slabs[0]
+        self._view = memoryview(self._buf)
+        self._start = 0  # начало ещё не нарезанных данных
+        self._end = 0    # конец записанных данных
+
+    @property
+    def pending(self) -> int:
+        return self._end - self._start
+
+    def write(self, data) -> None:
+        n = len(data)
+        if self._end + n > len(self._buf):
+            self._rotate(n)
+        self._view[self._end:self._end + n] = data
+        self._end += n
+
+    def find(self, sub: bytes, offset: int = 0) -> int:
+        """Позиция sub относительно начала ненарезанных данных или -1."""
+        i = self._buf.find(sub, self._start + offset, self._end)
+        return i - self._start if i >= 0 else -1
+
+    def take(self, n: int) -> memoryview:
+        """Отдаёт следующие n байт как memoryview и сдвигает начало."""
+        frame = self._view[self._start:self._start + n]
+        self._start += n
+        return frame
+
+    def peek(self, n: int) -> memoryview:
+        """Следующие n байт без сдвига начала."""
+        return self._view[self._start:self._start + n]
+
+    def skip(self, n: int) -> None:
+        self._start += n
+
+    def _rotate(self, incoming: int) -> None:
+        pending = self._view[self._start:self._end]
+        size = len(pending)
+        need = size + incoming
+        self._index = (self._index + 1) % len(self._slabs)
+        slab = self._slabs[self._index]
+        if len(slab) < need or not _is_released(slab):
+            slab = bytearray(max(self.slab_size, need))
+            self._slabs[self._index] = slab
+        view = memoryview(slab)
+        view[:size] = pending
+        pending.release()
+        self._buf, self._view = slab, view
+        self._start, self._end = 0, size
+
+
+def _is_released(buf: bytearray) -> bool:
+    # bytearray с живыми memoryview нельзя менять в размере
+    try:
+        buf.append(0)
+    except BufferError:
+        return False
+    del buf[-1]
+    return True
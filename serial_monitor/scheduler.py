@@ -0,0 +1,23 @@
+class PollScheduler:
+    """
+    Адаптивный интервал опроса очереди для UI.
+
+    Пока идут данные, опрос идёт с min_ms; на простое интервал растёт
+    в backoff раз до max_ms. Если тик не успел всё отрисовать в свой
+    бюджет, следующий тик будет как можно раньше.
+    """
+
+    def __init__(self, min_ms: int = 10, max_ms: int = 200, backoff: float = 2.0):
+        self.min_ms = max(1, min_ms)
+        self.max_ms = max(self.min_ms, max_ms)
+        self.backoff = backoff
+        self.interval = self.max_ms
+
+    def next_interval(self, got_data: bool, backlog: bool = False) -> int:
+        if backlog:
+            return 1
+        if got_data:
+            self.interval = self.min_ms
+        else:
+            self.interval = min(self.max_ms, int(self.interval * self.backoff) + 1)
+        return self.interval
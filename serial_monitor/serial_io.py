@@ -1,14 +1,24 @@
 import serial
-import serial.tools.list_ports
-from threading import Thread, Event
+from threading import Thread, Event, current_thread
 from queue import Queue
+from serial_monitor.framing import DelimiterFramer
 
 
 class SerialHandler:
-    def __init__(self, port: str, baudrate: int, bytesize: int = 8, parity: str = "N",timeout=50):
+    def __init__(self, port: str, baudrate: int, bytesize: int = 8, parity: str = "N",timeout=50,
+                 framer=None, on_frames=None, logger=None, on_error=None):
         
         if timeout:
            timeout = timeout / 1000 #Because we give timout in ms 
+        else:
+           timeout = None  # 0 would make read() non-blocking and the loop would spin
+        self.framer = framer or DelimiterFramer(b"\n")
+        self.on_frames = on_frames  # вызывается из потока чтения после новых кадров
+        self.logger = logger  # SessionLogger: журнал RX/TX
+        self.on_error = on_error  # порт пропал во время чтения (сброс, USB): on_error(exc)
+        gap = getattr(self.framer, "gap", None)
+        if gap and (timeout is None or gap < timeout):
+            timeout = gap  # idle-gap framing needs read() to return at least once per gap
         self.ser = serial.Serial(
             port=port, 
             baudrate=baudrate, 
@@ -16,12 +26,14 @@ class SerialHandler:
             parity=parity, 
             timeout=timeout
             )
-        self.queue: Queue[str] = Queue()
+        self.queue: Queue[memoryview] = Queue()
         self.stop_event = Event()
         self.thread = Thread(target=self._read_loop, daemon=True)
 
     @staticmethod
     def available_ports() -> list[str]:
+        import serial.tools.list_ports  # ~10 мс импорта, нужен только здесь
+
         return [p.device for p in serial.tools.list_ports.comports()]
 
     def start(self):
@@ -29,11 +41,19 @@ class SerialHandler:
 
     def stop(self):
         self.stop_event.set()
+        cancel_read = getattr(self.ser, "cancel_read", None)
+        if cancel_read and self.ser.is_open:
+            cancel_read()  # прерываем блокирующий read() в потоке чтения
+        if self.thread.is_alive() and self.thread is not current_thread():
+            self.thread.join(timeout=0.5)
         if self.ser.is_open:
             self.ser.close()
 
     def send(self, data: str):
-        self.ser.write(data.encode("utf-8") + b"\n")
+        payload = data.encode("utf-8")
+        self.ser.write(payload + b"\n")
+        if self.logger:
+            self.logger.log("TX", payload)
         
     def set_dtr(self, state: bool):
         if self.ser and self.ser.is_open:
@@ -45,14 +65,31 @@ class SerialHandler:
 
     def _read_loop(self):
         while not self.stop_event.is_set():
-            if self.ser.in_waiting > 0:
-                line = self.ser.readline().decode(errors="ignore").strip()
-                if line:
-                    self.queue.put(line)
-                    
+            try:
+                self._read_loop_iteration()
+            except (serial.SerialException, OSError, TypeError) as e:
+                # порт закрыли во время чтения
+                if self.stop_event.is_set():
+                    break
+                if self.on_error:
+                    # устройство отвалилось: отдаём решение контроллеру
+                    self.on_error(e)
+                    break
+                raise
+
     def _read_loop_iteration(self):
-        # For testing
-        if self.ser.in_waiting > 0:
-            line = self.ser.readline().decode(errors="ignore").strip()
-            if line:
-                self.queue.put(line)
+        # Blocks in read() until data arrives or the port timeout expires,
+        # then takes everything the driver has buffered in one call.
+        data = self.ser.read(max(1, self.ser.in_waiting))
+        frames = self.framer.feed(data) if data else self.framer.poll()
+        # Кадры уходят в очередь сырыми байтами (memoryview на ByteRing),
+        # декодирование в текст делает тот, кому нужен текст.
+        queued = [frame for frame in frames if frame]
+        if not queued:
+            return
+        for frame in queued:
+            self.queue.put(frame)
+        if self.logger:
+            self.logger.log_many("RX", queued)
+        if self.on_frames:
+            self.on_frames()
@@ -0,0 +1,252 @@
+import codecs
+import gzip
+import io
+import re
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from queue import Queue, Empty, Full
+
+try:
+    import zstandard
+except ImportError:  # zstd — необязательная зависимость
+    zstandard = None
+
+LOG_COMPRESSION = ("none", "gzip", "zstd")
+# остальные управляющие байты (\r и \n экранируются отдельно)
+_CONTROL = re.compile(rb"[\x00-\x09\x0b\x0c\x0e-\x1f\x7f]")
+
+
+def escape(data: bytes) -> str:
+    """
+    Кадр в одну строку лога: \\, \\r, \\n экранируются, остальные
+    управляющие байты и невалидный UTF-8 — как \\xNN.
+    """
+    data = data.replace(b"\\", b"\\\\").replace(b"\n", b"\\n").replace(b"\r", b"\\r")
+    data = _CONTROL.sub(lambda m: b"\\x%02x" % m[0][0], data)
+    return data.decode("utf-8", "backslashreplace")
+
+
+def unescape(line: str) -> bytes:
+    return codecs.escape_decode(line.encode("utf-8"))[0]
+
+
+def read_log(path: str):
+    """
+    Читает журнал SessionLogger (в том числе сжатый .gz/.zst):
+    выдаёт (время epoch, "RX"|"TX", байты кадра) по строкам.
+    """
+    if path.endswith(".gz"):
+        f = gzip.open(path, "rt", encoding="utf-8", newline="\n")
+    elif path.endswith(".zst"):
+        if zstandard is None:
+            raise ValueError("zstd logs require the 'zstandard' package")
+        f = io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True),
+                             encoding="utf-8", newline="\n")
+    else:
+        f = open(path, "r", encoding="utf-8", newline="\n")
+    with f:
+        for line in f:
+            parts = line.rstrip("\n").split(" ", 3)
+            if len(parts) < 4 or parts[2] not in ("RX", "TX"):
+                continue  # не строка журнала
+            try:
+                ts = datetime.fromisoformat(f"{parts[0]} {parts[1]}").timestamp()
+            except ValueError:
+                continue
+            yield ts, parts[2], unescape(parts[3])
+
+
+class SessionLogger:
+    """
+    Журнал сессии: каждый принятый и отправленный кадр пишется строкой
+    "<время ISO> <RX|TX> <кадр>", служебные отметки — "<время ISO> -- <текст>".
+
+    Поток чтения только копирует кадры и кладёт пачку в ограниченную
+    очередь без ожидания; если очередь полна, кадры считаются в dropped,
+    а не тормозят чтение. Форматирование, запись большими блоками,
+    flush раз в flush_interval секунд и ротация — в отдельном потоке.
+
+    Ротация — по размеру (max_bytes) и/или по времени (rotate_s), 0 — выкл.
+    Закрытый файл переименовывается в <имя>-<дата-время><расширение> и при
+    compress="gzip"/"zstd" сжимается в фоне.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 0, rotate_s: float = 0,
+                 compress: str = "none", queue_size: int = 4096,
+                 flush_interval: float = 1.0, buffer_size: int = 1 << 20):
+        if compress not in LOG_COMPRESSION:
+            raise ValueError(f"Invalid log compression: {compress}")
+        if compress == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.rotate_s = rotate_s
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+
+        # счётчики
+        self.frames = 0        # записано кадров
+        self.bytes = 0         # записано байт в лог
+        self.dropped = 0       # кадров потеряно из-за переполненной очереди
+        self.writes = 0
+        self.flushes = 0
+        self.rotations = 0
+        self.max_latency = 0.0  # от приёма кадра до записи, с
+        self.max_flush_time = 0.0
+
+        self._queue: Queue = Queue(maxsize=queue_size)
+        self._file = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._compressors: list[threading.Thread] = []
+        self._open()
+        self._thread = threading.Thread(target=self._writer, daemon=True)
+        self._thread.start()
+
+    # --- вызывается из потоков чтения/отправки ---
+    def log(self, direction: str, frame) -> None:
+        self.log_many(direction, (frame,))
+
+    def log_many(self, direction: str, frames) -> None:
+        # кадры — memoryview на буфер, который скоро перезапишут, поэтому копия
+        batch = (time.time(), direction, [bytes(frame) for frame in frames])
+        try:
+            self._queue.put_nowait(batch)
+        except Full:
+            self.dropped += len(batch[2])
+
+    def mark(self, text: str) -> None:
+        """Служебная отметка (например, разрыв связи); read_log её пропускает."""
+        self.log("--", text.encode("utf-8"))
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "dropped": self.dropped,
+            "writes": self.writes,
+            "flushes": self.flushes,
+            "rotations": self.rotations,
+            "queued": self._queue.qsize(),
+            "max_latency": self.max_latency,
+            "max_flush_time": self.max_flush_time,
+        }
+
+    def close(self, timeout: float = 2.0) -> None:
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except Full:
+            pass  # запись зависла (диск): не держим disconnect(), поток-демон доработает сам
+        self._thread.join(timeout)
+        for thread in self._compressors:
+            thread.join(timeout)
+
+    # --- поток записи ---
+    def _writer(self):
+        last_flush = time.monotonic()
+        dirty = False
+        running = True
+        while running:
+            try:
+                items = [self._queue.get(timeout=self.flush_interval)]
+            except Empty:
+                items = []
+            # забираем всё накопившееся, чтобы писать одним большим блоком
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            if None in items:
+                running = False
+                items = [item for item in items if item is not None]
+            if items:
+                self._write(items)
+                dirty = True
+
+            now = time.monotonic()
+            if dirty and (not running or now - last_flush >= self.flush_interval):
+                self._flush()
+                last_flush, dirty = now, False
+            if running and self._should_rotate(now):
+                self._rotate()
+        self._file.close()
+
+    def _write(self, items):
+        lines = []
+        frames = 0
+        oldest = items[0][0]
+        for ts, direction, batch in items:
+            stamp = datetime.fromtimestamp(ts).isoformat(sep=" ", timespec="microseconds")
+            prefix = f"{stamp} {direction} "
+            lines.extend(prefix + escape(frame) + "\n" for frame in batch)
+            frames += len(batch)
+        data = "".join(lines).encode("utf-8")
+        self._file.write(data)
+        self._size += len(data)
+        self.bytes += len(data)
+        self.frames += frames
+        self.writes += 1
+        self.max_latency = max(self.max_latency, time.time() - oldest)
+
+    def _flush(self):
+        start = time.perf_counter()
+        self._file.flush()
+        self.flushes += 1
+        self.max_flush_time = max(self.max_flush_time, time.perf_counter() - start)
+
+    def _should_rotate(self, now: float) -> bool:
+        if not self._size:
+            return False
+        if self.max_bytes and self._size >= self.max_bytes:
+            return True
+        return bool(self.rotate_s) and now - self._opened_at >= self.rotate_s
+
+    def _open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab", buffering=self.buffer_size)
+        self._size = self._file.tell()
+        self._opened_at = time.monotonic()
+
+    def _rotate(self):
+        self._file.close()
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        target = self.path.with_name(f"{self.path.stem}-{stamp}{self.path.suffix}")
+        n = 1
+        while target.exists() or _compressed_name(target, self.compress).exists():
+            target = self.path.with_name(f"{self.path.stem}-{stamp}-{n}{self.path.suffix}")
+            n += 1
+        self.path.rename(target)
+        self.rotations += 1
+        self._open()
+        if self.compress != "none":
+            thread = threading.Thread(target=_compress_file, args=(target, self.compress), daemon=True)
+            thread.start()
+            self._compressors = [t for t in self._compressors if t.is_alive()] + [thread]
+
+
+def _compressed_name(path: Path, compress: str) -> Path:
+    if compress == "gzip":
+        return path.with_name(path.name + ".gz")
+    if compress == "zstd":
+        return path.with_name(path.name + ".zst")
+    return path
+
+
+def _compress_file(path: Path, compress: str) -> None:
+    target = _compressed_name(path, compress)
+    with open(path, "rb") as src:
+        if compress == "gzip":
+            with gzip.open(target, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+        else:
+            with open(target, "wb") as dst:
+                zstandard.ZstdCompressor().copy_stream(src, dst)
+    path.unlink()
@@ -0,0 +1,215 @@
+"""
+Виртуальное устройство на псевдотерминале (Linux/macOS).
+
+VirtualDevice открывает пару pty и отдаёт путь ведомой стороны (port)
+как обычный последовательный порт: SerialHandler открывает его через
+pyserial. Устройство шлёт синтетический трафик с заданной частотой,
+пачками и с шумом, и отвечает на то, что ему прислали.
+
+    python -m serial_monitor.simulator --traffic regex --rate 1000 --echo
+"""
+import argparse
+import binascii
+import os
+import random
+import re
+import select
+import struct
+import threading
+import time
+import tty
+from serial_monitor.framing import slip_encode
+
+TRAFFIC_TYPES = ("regex", "csv", "binary")
+
+# binary — кадры под example/binary_telemetry.json: SLIP, "<Hff", CRC16-CCITT
+BINARY_FORMAT = struct.Struct("<Hff")
+
+
+def regex_frame(i: int, rng: random.Random) -> bytes:
+    """Строка под example/temp_n_num.json."""
+    return b"TEMP:%.2f HUM:%.2f\n" % (20 + 5 * rng.random(), 40 + 20 * rng.random())
+
+
+def csv_frame(i: int, rng: random.Random) -> bytes:
+    return b"%.3f,%.3f,%.3f\n" % (rng.gauss(0, 1), rng.gauss(0, 1), 9.81 + rng.gauss(0, 0.1))
+
+
+def binary_frame(i: int, rng: random.Random) -> bytes:
+    payload = BINARY_FORMAT.pack(i & 0xFFFF, 20 + 5 * rng.random(), 40 + 20 * rng.random())
+    crc = binascii.crc_hqx(payload, 0xFFFF).to_bytes(2, "little")
+    return slip_encode(payload + crc)
+
+
+GENERATORS = {"regex": regex_frame, "csv": csv_frame, "binary": binary_frame}
+
+
+class VirtualDevice:
+    """
+    rate      — кадров в секунду в среднем (0 — только ответы);
+    burst     — сколько кадров уходит одной записью;
+    noise     — доля кадров, испорченных случайным байтом или мусором;
+    baudrate  — если задан, байты выдаются со скоростью линии
+                (10 бит на байт), так что чтение видит неполные кадры;
+    echo      — вернуть каждую присланную строку;
+    replies   — {regex: ответ}: на строку, совпавшую с regex, отправить ответ
+                ("\\n" добавляется, если его нет; группы подставляются
+                через \\1 / \\g<name>).
+
+    frames_sent / bytes_sent / lines_received — счётчики для тестов и нагрузки.
+    """
+
+    def __init__(self, traffic: str = "regex", rate: float = 100, burst: int = 1,
+                 noise: float = 0.0, baudrate: int | None = None, echo: bool = False,
+                 replies: dict[str, str] | None = None, seed: int | None = None):
+        if traffic not in GENERATORS:
+            raise ValueError(f"Invalid traffic type: {traffic}")
+        self.traffic = traffic
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.noise = noise
+        self.baudrate = baudrate
+        self.echo = echo
+        self.replies = [(re.compile(p.encode()), r.encode()) for p, r in (replies or {}).items()]
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.lines_received: list[bytes] = []
+
+        self._rng = random.Random(seed)
+        self._generate = GENERATORS[traffic]
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)  # без эха и перевода строк на стороне терминала
+        os.set_blocking(self._master, False)  # никто не читает — поток не виснет в write
+        self.port = os.ttyname(self._slave)
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self):
+        targets = [self._reply_loop] + ([self._stream_loop] if self.rate else [])
+        for target in targets:
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=1)
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def write(self, data: bytes):
+        """Отправить байты в порт (со скоростью линии, если задан baudrate)."""
+        with self._write_lock:
+            if not self.baudrate:
+                self._write_all(data)
+                return
+            # кусками по ~1 мс линии, чтобы чтение видело кадры частями
+            chunk = max(1, self.baudrate // 10 // 1000)
+            per_byte = 10 / self.baudrate
+            for i in range(0, len(data), chunk):
+                piece = data[i:i + chunk]
+                self._write_all(piece)
+                time.sleep(len(piece) * per_byte)
+
+    def _write_all(self, data: bytes):
+        view = memoryview(data)
+        while view and not self._stop.is_set():
+            try:
+                n = os.write(self._master, view)
+            except BlockingIOError:
+                select.select([], [self._master], [], 0.01)
+                continue
+            except OSError:
+                return  # устройство закрыли
+            view = view[n:]
+            self.bytes_sent += n
+
+    def _frame(self) -> bytes:
+        frame = self._generate(self.frames_sent, self._rng)
+        self.frames_sent += 1
+        if self.noise and self._rng.random() < self.noise:
+            if self._rng.random() < 0.5:
+                i = self._rng.randrange(len(frame) - 1)
+                frame = frame[:i] + bytes([self._rng.randrange(256)]) + frame[i + 1:]
+            else:
+                frame = bytes(self._rng.randrange(256) for _ in range(self._rng.randint(1, 8))) + frame
+        return frame
+
+    def _stream_loop(self):
+        period = self.burst / self.rate
+        next_t = time.perf_counter()
+        while not self._stop.is_set():
+            self.write(b"".join(self._frame() for _ in range(self.burst)))
+            next_t += period
+            delay = next_t - time.perf_counter()
+            if delay > 0:
+                self._stop.wait(delay)
+            elif delay < -1:
+                next_t = time.perf_counter()  # не догоняем, если сильно отстали
+
+    def _reply_loop(self):
+        pending = b""
+        while not self._stop.is_set():
+            try:
+                ready, _, _ = select.select([self._master], [], [], 0.05)
+                if not ready:
+                    continue
+                data = os.read(self._master, 4096)
+            except OSError:
+                return
+            *lines, pending = (pending + data).split(b"\n")
+            for line in lines:
+                line = line.rstrip(b"\r")
+                self.lines_received.append(line)
+                self._answer(line)
+
+    def _answer(self, line: bytes):
+        if self.echo:
+            self.write(line + b"\n")
+        for pattern, reply in self.replies:
+            match = pattern.search(line)
+            if match:
+                answer = match.expand(reply)
+                self.write(answer if answer.endswith(b"\n") else answer + b"\n")
+                break
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Virtual serial device on a pseudo-terminal")
+    ap.add_argument("--traffic", choices=TRAFFIC_TYPES, default="regex")
+    ap.add_argument("--rate", type=float, default=10, help="frames per second (0 - replies only)")
+    ap.add_argument("--burst", type=int, default=1, help="frames per write")
+    ap.add_argument("--noise", type=float, default=0.0, help="fraction of corrupted frames")
+    ap.add_argument("--baudrate", type=int, default=0, help="pace output at this line rate")
+    ap.add_argument("--echo", action="store_true", help="echo received lines")
+    ap.add_argument("--reply", action="append", default=[], metavar="REGEX=ANSWER",
+                    help="answer lines matching REGEX")
+    ap.add_argument("--seed", type=int)
+    args = ap.parse_args(argv)
+
+    replies = dict(item.split("=", 1) for item in args.reply)
+    device = VirtualDevice(args.traffic, args.rate, args.burst, args.noise,
+                           args.baudrate or None, args.echo, replies, args.seed)
+    with device:
+        print(device.port, flush=True)
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
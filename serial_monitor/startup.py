@@ -0,0 +1,34 @@
+"""
+Замер запуска GUI.
+
+    python -m serial_monitor.app --startup-probe
+
+печатает JSON с отметками (секунды от импорта serial_monitor.app) и
+списком тяжёлых модулей, загруженных к первому кадру, и закрывает окно,
+как только отработала отложенная загрузка. Тесты проверяют по нему, что
+numpy и перечисление портов не попадают на путь до первого кадра.
+"""
+import json
+import sys
+import time
+
+T0 = time.perf_counter()
+HEAVY_MODULES = ("numpy", "serial.tools.list_ports", "concurrent.futures.process",
+                 "serial_monitor.ui.simple_plot", "serial_monitor.ui.settings_window")
+
+enabled = False
+marks: dict[str, float] = {}
+modules_at: dict[str, list[str]] = {}
+
+
+def mark(name: str) -> None:
+    marks[name] = time.perf_counter() - T0
+    modules_at[name] = [m for m in HEAVY_MODULES if m in sys.modules]
+
+
+def report() -> dict:
+    return {"marks": marks, "modules": modules_at}
+
+
+def dump(out=None) -> None:
+    print(json.dumps(report()), file=out or sys.stdout, flush=True)
@@ -1,12 +1,18 @@
+import time
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog
+from tkinter import ttk, scrolledtext, messagebox, filedialog, simpledialog
 from pathlib import Path
-from serial_monitor.config import ENCODINGS
+from serial_monitor.formatters import ENCODINGS
 from serial_monitor.settings_model import SettingsModel
-from serial_monitor.ui.simple_plot import SimplePlot
 from serial_monitor.controllers.serial_controller import SerialController
 from serial_monitor.controllers.output_controller import OutputController
+from serial_monitor.console_model import ConsoleModel
+from serial_monitor.scheduler import PollScheduler
+from serial_monitor.ui.wakeup import TkWakeup
 from serial_monitor.controllers.parser_controller import ParserController
+from serial_monitor.capture import CaptureReader, CAPTURE_SUFFIX
+from serial_monitor.port_registry import PortRegistry
+from serial_monitor import startup
 
 
 def get_icon(filepath: str):
@@ -24,20 +30,43 @@ class MainWindow(tk.Tk):
         self.settings = SettingsModel()
         self.serial = SerialController()
         self.parser = ParserController()
+        self.capture: CaptureReader | None = None
 
         # режим отображения
         self.display_mode = tk.StringVar(value=self.settings.config.display_mode)
 
         # --- UI ---
         self._setup_ui()
-        self.output = OutputController(self.output_box, self.plot_tab)
+        self.output = OutputController(
+            self.output_box, self.plot_tab,
+            max_lines_per_flush=self.settings.config.poll_budget_lines,
+            model=ConsoleModel(self.settings.config.scrollback_lines,
+                               self.settings.config.scrollback_chars),
+        )
 
-        # циклический опрос
-        self.after(200, self._update_output)
+        # поток чтения будит UI сразу, таймер с адаптивным интервалом — страховка
+        self.poll = PollScheduler(self.settings.config.poll_min_ms, self.settings.config.poll_max_ms)
+        self._poll_id = None
+        self._last_tick = 0.0
+        self.wakeup = TkWakeup(self, self._on_serial_data)
+        self.serial.on_frames = self.wakeup.notify
+        self.protocol("WM_DELETE_WINDOW", self._close)
+
+        # список портов кэшируется и обновляется в фоне при подключении/отключении устройств
+        self.ports = PortRegistry()
+        self.ports_wakeup = TkWakeup(self, self._on_ports_changed)
+        self.ports.subscribe(lambda added, removed: self.ports_wakeup.notify())
+        self.serial.ports = self.ports  # переподключение ждёт появления порта в реестре
+        self._multi_windows = []  # MultiPortWindow: при закрытии главного окна закрываются первыми
+        self._schedule_update(self.poll.interval)
 
         # заголовок и иконка
         self._update_window_title()
 
+        # график (numpy) и список портов — после первого кадра
+        startup.mark("window")
+        self.after(0, self._on_first_frame)
+
     def _setup_ui(self):
         top_frame = ttk.Frame(self)
         top_frame.pack(fill="x")
@@ -46,13 +75,18 @@ class MainWindow(tk.Tk):
         # Settings 
         menubar = tk.Menu(self)
         self.config(menu=menubar)
+        file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Open capture...", command=self._open_capture)
+        file_menu.add_command(label="Replay...", command=self._replay)
+        file_menu.add_command(label="Monitor several ports...", command=self._open_multi_port)
+        menubar.add_cascade(label="File", menu=file_menu)
         settings_menu = tk.Menu(menubar, tearoff=0)
         settings_menu.add_command(label="Preferences...", command=self._open_settings)
         menubar.add_cascade(label="Settings", menu=settings_menu)
         
         # Port
         ttk.Label(top_frame, text="Port:").pack(side="left")
-        self.port_cb = ttk.Combobox(top_frame, values=self.serial.available_ports())
+        self.port_cb = ttk.Combobox(top_frame, values=[])  # заполняется в фоне после старта
         self.port_cb.set(self.settings.config.port)
         self.port_cb.pack(side="left")
         self.port_cb.bind("<Button-1>", lambda e: self._refresh_ports())
@@ -128,36 +162,73 @@ class MainWindow(tk.Tk):
                                       command=lambda: self.serial.set_rts(self.rts_var.get()))
         self.rts_cb.pack(side="left", padx=5)
 
-        # Plot tab
-        self.plot_tab = SimplePlot(self.notebook)
-        
-        self.notebook.add(self.plot_tab, text="Plot")
+        # Plot tab: сам SimplePlot создаётся в _load_deferred
+        self.plot_tab = None
+        self._plot_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self._plot_frame, text="Plot")
+
+    # --- deferred startup ---
+    def _on_first_frame(self):
+        self.update_idletasks()
+        startup.mark("first_frame")
+        self.after(1, self._load_deferred)
+
+    def _load_deferred(self):
+        from serial_monitor.ui.simple_plot import SimplePlot  # тянет numpy
+
+        config = self.settings.config
+        self.plot_tab = SimplePlot(self._plot_frame, max_points=config.plot_max_points,
+                                   decimation=config.plot_decimation)
+        self.plot_tab.pack(fill="both", expand=True)
+        self.plot_tab.set_parser(self.output.parse_stage.parser)
+        self.plot_tab.set_connected(self.serial.connected)
+        self.output.plot_widget = self.plot_tab
+        startup.mark("plot")
+        self.ports.start()  # первое сканирование — в фоновом потоке
+
+    def _on_ports_changed(self):
+        self.ports_wakeup.rearm()
+        self.port_cb["values"] = self.ports.ports
+        if "ports" not in startup.marks:
+            startup.mark("ports")
+            if startup.enabled:
+                startup.dump()
+                self._close()
 
     
     def _load_parser(self):
+        parser = None
         if self.settings.config.parser_path:
             try:
-                self.plot_tab.set_parser(self.parser.load(self.settings.parser_path))
+                parser = self.parser.load(self.settings.parser_path)
             except Exception as e:
                 messagebox.showerror("Parser error", f"Failed to load parser: {e}")
-                self.plot_tab.set_parser(None)
-        else:
-            self.plot_tab.set_parser(None)
+        if self.plot_tab is not None:
+            self.plot_tab.set_parser(parser)
+        try:
+            self.output.set_parser(parser, self.settings.config.parse_mode)
+        except ValueError as e:
+            messagebox.showerror("Parser error", str(e))
+            self.output.set_parser(parser, "inline")
     
     def _connection(self):
         if not self.serial.connected:
             
             self.serial.connect()
             self.connect_btn.config(image=self.icon_connect)
-            self.plot_tab.set_connected(True)
+            self._set_plot_connected(True)
         self._update_window_title()
     
     def _disconnection(self):
         self.serial.disconnect()
         self.connect_btn.config(image=self.icon_disconnect)
-        self.plot_tab.set_connected(False)
+        self._set_plot_connected(False)
         self._update_window_title()
 
+    def _set_plot_connected(self, state: bool):
+        if self.plot_tab is not None:
+            self.plot_tab.set_connected(state)
+
     # --- connection ---
     def _toggle_connection(self):
         if self.serial.connected:
@@ -189,10 +260,109 @@ class MainWindow(tk.Tk):
         self._update_window_title()
     
     # --- update loop ---
+    def _schedule_update(self, delay: int):
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+        self._poll_id = self.after(delay, self._update_output)
+
+    def _on_serial_data(self):
+        # одиночный кадр рисуем сразу, поток кадров — не чаще раза в poll_min_ms
+        since_ms = (time.monotonic() - self._last_tick) * 1000
+        self._schedule_update(max(0, int(self.poll.min_ms - since_ms)))
+
     def _update_output(self):
-        for raw in self.serial.read_lines():
-            self.output.display_received(raw, self.display_mode.get())
-        self.after(200, self._update_output)
+        self.wakeup.rearm()
+        self._poll_id = None
+        self._last_tick = time.monotonic()
+        config = self.settings.config
+        frames = self.serial.read_lines(config.poll_budget_lines)
+        self.output.display_received_many(frames, self.display_mode.get())
+        for event in self.serial.pop_events():
+            self.output.display_note(event)
+        # что не влезло в бюджет тика, переносится на следующий
+        backlog = self.output.flush(config.poll_budget_ms / 1000)
+        # пока парсер в фоне занят, опрашиваем с минимальным интервалом
+        got_data = bool(frames) or self.output.parse_stage.busy
+        if self.serial.replaying and not (got_data or backlog):
+            self.serial.handler.drained()
+        delay = self.poll.next_interval(got_data, backlog or self.serial.has_pending)
+        self._schedule_update(delay)
+
+    # --- capture ---
+    def _open_capture(self):
+        file_path = filedialog.askopenfilename(
+            title="Open capture",
+            filetypes=[("Captures", f"*{CAPTURE_SUFFIX}"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+        try:
+            capture = CaptureReader(file_path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Capture error", str(e))
+            return
+        if self.serial.connected:
+            self._disconnection()
+        if self.capture is not None:
+            self.capture.close()
+        self.capture = capture
+        self.output.clear()
+        if self.plot_tab is not None:
+            self.plot_tab.clear()
+        self._set_plot_connected(False)
+        # консоль и график всё равно хранят только хвост — его и грузим
+        config = self.settings.config
+        keep = max(config.scrollback_lines, config.plot_max_points)
+        start = max(0, len(capture) - keep) if config.scrollback_lines else 0
+        self._load_capture_chunk(capture, capture.records(start))
+
+    def _load_capture_chunk(self, capture: CaptureReader, records):
+        # по бюджету тика за раз, чтобы UI не замирал на больших захватах
+        if capture is not self.capture:
+            return
+        chunk = [record for _, record in zip(range(self.settings.config.poll_budget_lines), records)]
+        if not chunk:
+            return
+        self.output.display_records(chunk, self.display_mode.get(), capture.start_time)
+        self.output.flush(self.settings.config.poll_budget_ms / 1000)
+        self.after(1, self._load_capture_chunk, capture, records)
+
+    def _replay(self):
+        file_path = filedialog.askopenfilename(
+            title="Replay capture or log",
+            filetypes=[("Captures and logs", f"*{CAPTURE_SUFFIX} *.log *.gz *.zst"),
+                       ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+        if self.serial.connected:
+            self._disconnection()
+        try:
+            self.serial.connect_replay(file_path, self.settings.config.replay_speed)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Replay error", str(e))
+            return
+        self.connect_btn.config(image=self.icon_connect)
+        self._set_plot_connected(True)
+        self._update_window_title()
+
+    # --- multi-port ---
+    def _open_multi_port(self):
+        ports = simpledialog.askstring(
+            "Monitor several ports", "Ports (comma separated):",
+            initialvalue=", ".join(self.ports.ports), parent=self,
+        )
+        ports = [port.strip() for port in (ports or "").split(",") if port.strip()]
+        if not ports:
+            return
+        from serial_monitor.ui.multi_port_window import MultiPortWindow  # тянет numpy
+
+        try:
+            window = MultiPortWindow(self, self.settings, ports)
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self._multi_windows = [w for w in self._multi_windows if w.winfo_exists()] + [window]
 
     # --- send data ---
     def _send(self):
@@ -204,6 +374,7 @@ class MainWindow(tk.Tk):
             return
         self.serial.send(data)
         self.output.display_sent(data, self.display_mode.get())
+        self.output.flush()
         self.input_entry.delete(0, "end")
 
     def _send_file(self):
@@ -223,7 +394,9 @@ class MainWindow(tk.Tk):
 
     # --- helpers ---
     def _refresh_ports(self):
-        ports = self.serial.available_ports()
+        # список из кэша, без сканирования в потоке Tk; заодно просим пересканировать
+        ports = self.ports.ports
+        self.ports.poke()
         self.port_cb["values"] = ports
         if self.port_cb.get() not in ports and ports:
             self.port_cb.set(ports[0])
@@ -260,7 +433,25 @@ class MainWindow(tk.Tk):
             self._disconnection()
             self.after(200, self._connection)
 
+    def _close(self):
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        self.ports.stop()  # фоновый поток реестра больше не будит закрытое окно
+        for window in self._multi_windows:
+            if window.winfo_exists():
+                window._close()  # иначе destroy() снесёт окно, а IOLoop и порты останутся
+        self.serial.disconnect()
+        self.wakeup.close()
+        self.ports_wakeup.close()
+        self.output.parse_stage.close()
+        self.destroy()
+
     def _update_window_title(self):
         if self.serial.connected: self.iconphoto(False, self.icon_connect)
         else: self.iconphoto(False, self.icon_disconnect)
+        if self.serial.replaying:
+            handler = self.serial.handler
+            self.title(f"Replay {Path(handler.path).name} x{handler.speed or 'max'}")
+            return
         self.title(f"{self.settings.port} {self.settings.baudrate}")
\ No newline at end of file
@@ -0,0 +1,186 @@
+import time
+import tkinter as tk
+from tkinter import ttk, scrolledtext, messagebox, filedialog
+from serial_monitor.formatters import ENCODINGS
+from serial_monitor.settings_model import SettingsModel
+from serial_monitor.controllers.multi_port_controller import MultiPortController
+from serial_monitor.controllers.output_controller import OutputController
+from serial_monitor.console_model import ConsoleModel
+from serial_monitor.parsers import load_parser_config
+from serial_monitor.scheduler import PollScheduler
+from serial_monitor.ui.simple_plot import SimplePlot
+from serial_monitor.ui.wakeup import TkWakeup
+
+
+class MultiPortWindow(tk.Toplevel):
+    """
+    Несколько портов в одном окне на одном IOLoop. Вкладка "All" —
+    общая консоль в порядке прихода кадров с меткой порта; у каждого
+    порта своя вкладка со своей консолью, парсером и графиком.
+    """
+
+    def __init__(self, master, settings: SettingsModel, ports: list[str]):
+        super().__init__(master)
+        self.title("Serial Monitor - " + ", ".join(ports))
+        self.geometry("900x650")
+        self.settings = settings
+        self.serial = MultiPortController()
+        self.display_mode = tk.StringVar(value=settings.config.display_mode)
+
+        self._setup_ui(ports)
+        self.poll = PollScheduler(settings.config.poll_min_ms, settings.config.poll_max_ms)
+        self._poll_id = None
+        self._last_tick = 0.0
+        self.wakeup = TkWakeup(self, self._on_serial_data)
+        self.serial.on_frames = self.wakeup.notify
+        try:
+            self.serial.connect(ports, settings)
+        except Exception:
+            self.wakeup.close()
+            self.destroy()
+            raise
+        if settings.config.parser_path:
+            for index in range(len(ports)):
+                self._set_parser(index, settings.config.parser_path)
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        self._schedule_update(self.poll.interval)
+
+    def _output(self, parent, plot=None) -> tuple[OutputController, scrolledtext.ScrolledText]:
+        config = self.settings.config
+        box = scrolledtext.ScrolledText(parent, state="disabled", height=12)
+        box.pack(expand=True, fill="both")
+        output = OutputController(
+            box, plot,
+            max_lines_per_flush=config.poll_budget_lines,
+            model=ConsoleModel(config.scrollback_lines, config.scrollback_chars),
+        )
+        return output, box
+
+    def _setup_ui(self, ports: list[str]):
+        config = self.settings.config
+        top_frame = ttk.Frame(self)
+        top_frame.pack(fill="x")
+        ttk.Label(top_frame, text="Display:").pack(side="left", padx=5)
+        ttk.Combobox(top_frame, values=tuple(ENCODINGS.keys()),
+                     textvariable=self.display_mode, width=8).pack(side="left")
+
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(expand=True, fill="both")
+
+        merged_tab = ttk.Frame(self.notebook)
+        self.merged, _ = self._output(merged_tab)
+        self.notebook.add(merged_tab, text="All")
+
+        self.outputs: list[OutputController] = []
+        self.plots: list[SimplePlot] = []
+        self.entries: list[tk.Entry] = []
+        self.tabs: list[ttk.Frame] = []
+        self._shown_lost: set[int] = set()
+        for index, port in enumerate(ports):
+            tab = ttk.Frame(self.notebook)
+            panes = ttk.PanedWindow(tab, orient="vertical")
+            panes.pack(expand=True, fill="both")
+            console = ttk.Frame(panes)
+            plot = SimplePlot(panes, max_points=config.plot_max_points,
+                              decimation=config.plot_decimation)
+            panes.add(console, weight=1)
+            panes.add(plot, weight=1)
+            output, _ = self._output(console, plot)
+            plot.set_connected(True)
+
+            entry_frame = ttk.Frame(console)
+            entry_frame.pack(fill="x")
+            entry = tk.Entry(entry_frame)
+            entry.pack(side="left", fill="x", expand=True)
+            entry.bind("<Return>", lambda e, i=index: self._send(i))
+            ttk.Button(entry_frame, text="Send",
+                       command=lambda i=index: self._send(i)).pack(side="left", padx=5)
+            ttk.Button(entry_frame, text="Parser...",
+                       command=lambda i=index: self._choose_parser(i)).pack(side="left")
+
+            self.outputs.append(output)
+            self.plots.append(plot)
+            self.entries.append(entry)
+            self.tabs.append(tab)
+            self.notebook.add(tab, text=port)
+
+    # --- parsers ---
+    def _choose_parser(self, index: int):
+        path = filedialog.askopenfilename(
+            parent=self, title="Parser config", filetypes=[("JSON", "*.json"), ("All files", "*.*")]
+        )
+        if path:
+            self._set_parser(index, path)
+
+    def _set_parser(self, index: int, path: str):
+        try:
+            parser = load_parser_config(path)
+            self.outputs[index].set_parser(parser, self.settings.config.parse_mode)
+        except Exception as e:
+            messagebox.showerror("Parser error", f"Failed to load parser: {e}", parent=self)
+            return
+        self.plots[index].set_parser(parser)
+
+    # --- send ---
+    def _send(self, index: int):
+        entry = self.entries[index]
+        data = entry.get()
+        if not data:
+            return
+        if index in self.serial.lost:
+            self.outputs[index].display_note("port lost, nothing sent")
+            return
+        self.serial.send(index, data)
+        mode = self.display_mode.get()
+        self.outputs[index].display_sent(data, mode)
+        self.merged.display_received_many([data], mode, f"[{self.serial.labels[index]}] >> ")
+        entry.delete(0, "end")
+
+    # --- update loop ---
+    def _schedule_update(self, delay: int):
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+        self._poll_id = self.after(delay, self._update_output)
+
+    def _on_serial_data(self):
+        since_ms = (time.monotonic() - self._last_tick) * 1000
+        self._schedule_update(max(0, int(self.poll.min_ms - since_ms)))
+
+    def _update_output(self):
+        self.wakeup.rearm()
+        self._poll_id = None
+        self._last_tick = time.monotonic()
+        config = self.settings.config
+        mode = self.display_mode.get()
+        labels = self.serial.labels
+        records = self.serial.read_records(config.poll_budget_lines)
+        for _, index, frames in records:
+            self.merged.display_received_many(frames, mode, f"[{labels[index]}] ")
+            self.outputs[index].display_received_many(frames, mode)
+        for event in self.serial.pop_events():
+            self.merged.display_note(event)
+            self._show_lost()
+        budget = config.poll_budget_ms / 1000 / (len(self.outputs) + 1)
+        backlog = False
+        busy = False
+        for output in [self.merged, *self.outputs]:
+            backlog = output.flush(budget) or backlog
+            busy = busy or output.parse_stage.busy
+        delay = self.poll.next_interval(bool(records) or busy, backlog or self.serial.has_pending)
+        self._schedule_update(delay)
+
+    def _show_lost(self):
+        for index in self.serial.lost - self._shown_lost:
+            self._shown_lost.add(index)
+            self.notebook.tab(self.tabs[index], text=f"{self.serial.labels[index]} (lost)")
+            self.outputs[index].display_note(f"{self.serial.labels[index]} lost")
+            self.plots[index].set_connected(False)
+
+    def _close(self):
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+        self.serial.disconnect()
+        self.wakeup.close()
+        for output in self.outputs:
+            output.parse_stage.close()
+        self.destroy()
@@ -0,0 +1,119 @@
+import numpy as np
+
+
+class SeriesBuffer:
+    """
+    Кольцевой буфер точек (t, v) одной серии на заранее выделенных массивах float64.
+
+    Каждая точка пишется дважды — в позицию i и i + capacity, поэтому
+    последние capacity точек всегда лежат в массиве подряд: times/values
+    отдаются как view без копирования, а окно по времени ищется через
+    searchsorted. Добавление точки — O(1).
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"Invalid capacity: {capacity}")
+        self.capacity = capacity
+        self._t = np.empty(2 * capacity, dtype=np.float64)
+        self._v = np.empty(2 * capacity, dtype=np.float64)
+        self._head = 0  # индекс самой старой точки
+        self._size = 0
+        # экстремумы окна (значение, время) для автомасштаба без полного пересчёта
+        self._lo: tuple[float, float] | None = None
+        self._hi: tuple[float, float] | None = None
+        self._bounds_from = float("inf")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, t: float, v: float) -> None:
+        cap = self.capacity
+        if self._size < cap:
+            i = self._head + self._size
+            if i >= cap:
+                i -= cap
+            self._size += 1
+        else:
+            i = self._head
+            self._head = i + 1 if i + 1 < cap else 0
+        self._t[i] = self._t[i + cap] = t
+        self._v[i] = self._v[i + cap] = v
+        if self._lo is not None:
+            if v <= self._lo[0]:
+                self._lo = (v, t)
+            if v >= self._hi[0]:
+                self._hi = (v, t)
+
+    def extend(self, ts, vs) -> None:
+        """Добавляет пачку точек одной векторной операцией."""
+        ts = np.asarray(ts, dtype=np.float64)[-self.capacity:]
+        vs = np.asarray(vs, dtype=np.float64)[-self.capacity:]
+        n = len(ts)
+        if not n:
+            return
+        cap = self.capacity
+        idx = (self._head + self._size + np.arange(n)) % cap
+        self._t[idx] = self._t[idx + cap] = ts
+        self._v[idx] = self._v[idx + cap] = vs
+        overflow = max(0, self._size + n - cap)
+        self._head = (self._head + overflow) % cap
+        self._size = min(cap, self._size + n)
+        if self._lo is not None:
+            i, j = _last_argmin(vs), _last_argmax(vs)
+            if vs[i] <= self._lo[0]:
+                self._lo = (float(vs[i]), float(ts[i]))
+            if vs[j] >= self._hi[0]:
+                self._hi = (float(vs[j]), float(ts[j]))
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._t[self._head:self._head + self._size]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._v[self._head:self._head + self._size]
+
+    @property
+    def last_time(self) -> float | None:
+        return float(self.times[-1]) if self._size else None
+
+    def window(self, min_t: float) -> tuple[np.ndarray, np.ndarray]:
+        """Точки с t >= min_t (времена монотонны, поэтому бинарный поиск)."""
+        times = self.times
+        start = int(np.searchsorted(times, min_t, side="left"))
+        return times[start:], self.values[start:]
+
+    def bounds(self, min_t: float) -> tuple[float, float] | None:
+        """
+        (min, max) значений в окне t >= min_t. Экстремумы обновляются при
+        добавлении точек; окно пересчитывается, только если экстремум ушёл
+        из окна (или был затёрт) или окно расширилось.
+        """
+        if not self._size:
+            return None
+        start_t = max(min_t, self._t[self._head])
+        lo, hi = self._lo, self._hi
+        if lo is None or min_t < self._bounds_from or lo[1] < start_t or hi[1] < start_t:
+            times, values = self.window(min_t)
+            if not len(values):
+                self._lo = self._hi = None
+                return None
+            i, j = _last_argmin(values), _last_argmax(values)
+            self._lo = (float(values[i]), float(times[i]))
+            self._hi = (float(values[j]), float(times[j]))
+            self._bounds_from = min_t
+        return self._lo[0], self._hi[0]
+
+    def clear(self) -> None:
+        self._head = self._size = 0
+        self._lo = self._hi = None
+        self._bounds_from = float("inf")
+
+
+# при равных значениях берём самый свежий экстремум — он дольше останется в окне
+def _last_argmin(values: np.ndarray) -> int:
+    return len(values) - 1 - int(values[::-1].argmin())
+
+def _last_argmax(values: np.ndarray) -> int:
+    return len(values) - 1 - int(values[::-1].argmax())
@@ -2,13 +2,17 @@ import tkinter as tk
 from tkinter import ttk, filedialog
 from serial_monitor.formatters import ENCODINGS
 from serial_monitor.config import PARITY_OPTIONS
+from serial_monitor.framing import FRAMING_OPTIONS
+from serial_monitor.controllers.parse_stage import PARSE_MODES
+from serial_monitor.controllers.serial_controller import IO_BACKENDS
+from serial_monitor.session_log import LOG_COMPRESSION
 
 class SettingsWindow(tk.Toplevel):
     def __init__(self, parent, model):
         super().__init__(parent)
         self.model = model
         self.title("Settings")
-        self.geometry("400x300")
+        self.geometry("400x450")
         self.resizable(False, False)
 
         # tk-переменные инициализируются значениями из модели
@@ -16,9 +20,14 @@ class SettingsWindow(tk.Toplevel):
         self.dtr_default = tk.BooleanVar(value=model.config.dtr_default)
         self.rts_default = tk.BooleanVar(value=model.config.rts_default)
         self.log_path = tk.StringVar(value=model.config.log_path)
+        self.log_compress = tk.StringVar(value=model.config.log_compress)
         self.send_delay_ms = tk.IntVar(value=model.config.send_delay_ms)
         self.parser_path = tk.StringVar(value=model.config.parser_path)
-        self.parity = tk.StringVar(value=ENCODINGS.get(model.parity,"None"))  # используем человекочитаемое имя
+        self.framing = tk.StringVar(value=model.config.framing)
+        self.parse_mode = tk.StringVar(value=model.config.parse_mode)
+        self.io_backend = tk.StringVar(value=model.config.io_backend)
+        parity_name = next((name for name, code in PARITY_OPTIONS.items() if code == model.parity), "None")
+        self.parity = tk.StringVar(value=parity_name)  # используем человекочитаемое имя
 
         self._setup_ui()
 
@@ -61,6 +70,26 @@ class SettingsWindow(tk.Toplevel):
         parser_entry.grid(row=6, column=1, sticky="w")
         ttk.Button(frame, text="Browse", command=self._choose_parser_file).grid(row=6, column=2, padx=5)
 
+        # Framing
+        ttk.Label(frame, text="Framing:").grid(row=7, column=0, sticky="w", pady=5)
+        ttk.Combobox(frame, values=FRAMING_OPTIONS, textvariable=self.framing,
+                     width=10, state="readonly").grid(row=7, column=1, sticky="w")
+
+        # Parse mode
+        ttk.Label(frame, text="Parse in:").grid(row=8, column=0, sticky="w", pady=5)
+        ttk.Combobox(frame, values=PARSE_MODES, textvariable=self.parse_mode,
+                     width=10, state="readonly").grid(row=8, column=1, sticky="w")
+
+        # Log compression for rotated files
+        ttk.Label(frame, text="Compress old logs:").grid(row=9, column=0, sticky="w", pady=5)
+        ttk.Combobox(frame, values=LOG_COMPRESSION, textvariable=self.log_compress,
+                     width=10, state="readonly").grid(row=9, column=1, sticky="w")
+
+        # Port I/O backend
+        ttk.Label(frame, text="Port I/O:").grid(row=10, column=0, sticky="w", pady=5)
+        ttk.Combobox(frame, values=IO_BACKENDS, textvariable=self.io_backend,
+                     width=10, state="readonly").grid(row=10, column=1, sticky="w")
+
         # Buttons
         btn_frame = ttk.Frame(self)
         btn_frame.pack(side="bottom", fill="x", pady=10)
@@ -90,8 +119,12 @@ class SettingsWindow(tk.Toplevel):
             dtr_default=self.dtr_default.get(),
             rts_default=self.rts_default.get(),
             log_path=self.log_path.get(),
+            log_compress=self.log_compress.get(),
             send_delay_ms=self.send_delay_ms.get(),
             parser_path=self.parser_path.get(),
+            framing=self.framing.get(),
+            parse_mode=self.parse_mode.get(),
+            io_backend=self.io_backend.get(),
         )
         self.model.save()
         self.destroy()
@@ -2,20 +2,31 @@ import tkinter as tk
 import time
 import numpy as np
 import random
+from array import array
+from serial_monitor.ui.series_buffer import SeriesBuffer
+from serial_monitor.ui.decimate import decimate
+from serial_monitor.formatters import to_text
 
 class SimplePlot(tk.Frame):
-    def __init__(self, parent, time_window=10):
+    def __init__(self, parent, time_window=10, max_points=100_000, decimation="minmax"):
         super().__init__(parent)
 
-        self.data_history = {}   # { "TEMP": [(t, v), ...], ... }
+        self.data_history: dict[str, SeriesBuffer] = {}   # { "TEMP": SeriesBuffer, ... }
         self.colors = {}
         self.available_colors = ["red", "blue", "green", "orange", "purple", "brown"]
-        self.max_points = 1000
+        self.max_points = max_points
+        self.decimation = decimation  # "none" | "minmax" | "lttb", ~2 точки на пиксель
 
+        self.parser = None
         self.last_update = None
         self.frozen = False
         self.margin = 40
 
+        # по одной линии на серию, обновляются через canvas.coords
+        self._items: dict[str, int] = {}
+        self._hidden: set[str] = set()
+        self._dirty = True
+
         # предопределённые шкалы времени
         self.time_scales = [1, 5, 10, 30, 60, 120, 300, 600]
         self.time_index = self.time_scales.index(time_window) if time_window in self.time_scales else 2
@@ -28,6 +39,7 @@ class SimplePlot(tk.Frame):
         self.canvas.pack(fill="both", expand=True)
 
         self.canvas.bind("<Configure>", lambda e: self._draw_static_elements())
+        self.bind("<Map>", lambda e: self._mark_dirty())
 
         # zoom колесиком
         self.canvas.bind("<MouseWheel>", self._on_zoom)   # Windows
@@ -84,20 +96,22 @@ class SimplePlot(tk.Frame):
     def add_point(self, key, value):
         ts = time.time()
         if key not in self.data_history:
-            self.data_history[key] = []
+            self.data_history[key] = SeriesBuffer(self.max_points)
             self.colors[key] = self._random_color()
-        self.data_history[key].append((ts, value))
+        # история ограничена ёмкостью кольцевого буфера
+        self.data_history[key].append(ts, value)
         self.last_update = ts
-
-        # ограничиваем историю
-        cutoff = ts - (max(self.time_scales) * 2)
-        self.data_history[key] = [(t, v) for t, v in self.data_history[key] if t >= cutoff]
+        self._dirty = True
 
     def _random_color(self):
         return f"#{random.randint(0, 0xFFFFFF):06x}"
 
+    def _mark_dirty(self):
+        self._dirty = True
+
     def _draw_static_elements(self):
         """Рисуем оси и подписи"""
+        self._dirty = True
         self.canvas.delete("axes")
 
         w = self.canvas.winfo_width()
@@ -134,29 +148,31 @@ class SimplePlot(tk.Frame):
     
     
     def _refresh_plot(self):
-        self.canvas.delete("lines")
+        # вкладка скрыта или данных нет — не рисуем вовсе
+        if not self.data_history or not self.winfo_ismapped():
+            self._update_frame()
+            return
+        # на паузе картинка меняется только от новых данных, зума или ресайза
+        if self.frozen and not self._dirty:
+            self._update_frame()
+            return
+
         w = self.canvas.winfo_width()
         h = self.canvas.winfo_height()
         plot_w = w - 2 * self.margin
         plot_h = h - 2 * self.margin
         now = time.time()
 
-        if not self.data_history:
-            self._update_frame()
-            return
-
         min_t = now - self.time_window if self.time_window and not self.frozen else \
                 (self.last_update - self.time_window if self.time_window else 0)
 
-        all_values = [
-            v for series in self.data_history.values()
-            for t, v in series if not self.time_window or t >= min_t
-        ]
-        if not all_values:
+        bounds = [b for b in (series.bounds(min_t) for series in self.data_history.values()) if b]
+        if not bounds:
             self._update_frame()
             return
 
-        min_v, max_v = min(all_values), max(all_values)
+        min_v = min(lo for lo, _ in bounds)
+        max_v = max(hi for _, hi in bounds)
         if min_v == max_v:
             min_v -= 1
             max_v += 1
@@ -168,16 +184,30 @@ class SimplePlot(tk.Frame):
         y0 = h - self.margin
 
         for key, series in self.data_history.items():
-            points = [(t, v) for t, v in series if t >= min_t] if self.time_window else series
-            if len(points) < 2:
+            times, values = series.window(min_t) if self.time_window else (series.times, series.values)
+            item = self._items.get(key)
+            if item is None:
+                item = self.canvas.create_line(0, 0, 0, 0, fill=self.colors[key], width=3,
+                                               tags="lines", state="hidden")
+                self._items[key] = item
+                self._hidden.add(key)
+            if len(times) < 2:
+                if key not in self._hidden:
+                    self.canvas.itemconfigure(item, state="hidden")
+                    self._hidden.add(key)
                 continue
 
-            xs = [x0 + (t - min_t) / self.time_window * plot_w for t, _ in points]
-            ys = [y0 - (v - min_v) / (max_v - min_v) * plot_h for _, v in points]
+            times, values = decimate(self.decimation, times, values, plot_w,
+                                     (min_t, min_t + self.time_window))
+            xs = x0 + (times - min_t) / self.time_window * plot_w
+            ys = y0 - (values - min_v) / (max_v - min_v) * plot_h
 
-            coords = list(np.ravel(np.column_stack([xs, ys])))
-            self.canvas.create_line(*coords, fill=self.colors[key], width=3, tags="lines")
+            self.canvas.coords(item, np.column_stack([xs, ys]).ravel().tolist())
+            if key in self._hidden:
+                self.canvas.itemconfigure(item, state="normal")
+                self._hidden.discard(key)
 
+        self._dirty = False
         self._update_frame()
 
     # --- интеграция с MainWindow ---
@@ -187,6 +217,7 @@ class SimplePlot(tk.Frame):
     def set_connected(self, state: bool):
         self.connected = state
         self.frozen = not state
+        self._dirty = True
 
     def add_data(self, line: str):
         if not self.parser:
@@ -198,13 +229,72 @@ class SimplePlot(tk.Frame):
         ts = time.time()
         self.last_update = ts
         self.frozen = False
+        self._dirty = True
         for key, value in parsed.items():
             if not isinstance(value, (int, float)):
                 continue
-            if key not in self.data_history:
-                self.data_history[key] = []
-                color = self.available_colors[len(self.colors) % len(self.available_colors)]
-                self.colors[key] = color
-            self.data_history[key].append((ts, value))
-            if len(self.data_history[key]) > self.max_points:
-                self.data_history[key] = self.data_history[key][-self.max_points:]
+            self._series(key).append(ts, value)
+
+    def add_frames(self, frames: list):
+        """
+        Разбирает все кадры тика одним parse_many и добавляет точки пачками.
+        Текстовым парсерам кадры декодируются в строки, бинарным идут как есть.
+        """
+        if not self.parser or not frames:
+            return
+        if not getattr(self.parser, "binary", False):
+            frames = [to_text(frame) for frame in frames]
+        self.add_batch(self.parser.parse_many(frames))
+
+    def add_batch(self, batch, ts=None):
+        """
+        Точки из ParsedBatch (колонки парсера). ts — общее время пачки
+        (живые данные) или время каждого кадра (захват; график при этом
+        остаётся на паузе, окно — у последней точки).
+        """
+        if not batch.rows:
+            return
+        ts = time.time() if ts is None else ts
+        per_frame = not isinstance(ts, (int, float))
+        if per_frame:
+            ts = np.asarray(ts, dtype=np.float64)
+            self.last_update = float(ts[batch.rows[-1]])
+        else:
+            self.last_update = ts
+            self.frozen = False
+        self._dirty = True
+        for key, column in batch.columns.items():
+            keep = None
+            if isinstance(column, array):
+                values = np.frombuffer(column, dtype=np.float64)
+            elif isinstance(column, np.ndarray):
+                if column.dtype.kind not in "biuf":
+                    continue
+                values = column.astype(np.float64)
+            else:
+                keep = np.array([isinstance(v, (int, float)) for v in column], dtype=bool)
+                values = np.array([v for v in column if isinstance(v, (int, float))], dtype=np.float64)
+            if not len(values):
+                continue
+            if per_frame:
+                rows = np.asarray((batch.column_rows or {}).get(key, batch.rows))
+                times = ts[rows if keep is None else rows[keep]]
+            else:
+                times = np.full(len(values), ts)
+            self._series(key).extend(times, values)
+
+    def clear(self):
+        self.data_history.clear()
+        self.colors.clear()
+        self.canvas.delete("lines")
+        self._items.clear()
+        self._hidden.clear()
+        self.last_update = None
+        self._dirty = True
+
+    def _series(self, key) -> SeriesBuffer:
+        if key not in self.data_history:
+            self.data_history[key] = SeriesBuffer(self.max_points)
+            color = self.available_colors[len(self.colors) % len(self.available_colors)]
+            self.colors[key] = color
+        return self.data_history[key]
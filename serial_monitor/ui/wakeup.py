@@ -0,0 +1,74 @@
+import os
+import threading
+import tkinter as tk
+
+
+class TkWakeup:
+    """
+    Будит главный цикл Tk из потока чтения.
+
+    На POSIX используется self-pipe, зарегистрированный через
+    createfilehandler, иначе — виртуальное событие <<SerialData>>.
+    До rearm() повторные notify() склеиваются в одно пробуждение: callback
+    обычно только планирует тик, и rearm() зовётся в начале тика, перед
+    тем как он заберёт все накопившиеся кадры.
+    """
+
+    EVENT = "<<SerialData>>"
+
+    def __init__(self, root: tk.Misc, callback):
+        self.root = root
+        self.callback = callback
+        self._armed = threading.Event()
+        self._closed = False
+        self._pipe: tuple[int, int] | None = None
+        if os.name == "posix" and hasattr(root.tk, "createfilehandler"):
+            r, w = os.pipe()
+            os.set_blocking(r, False)
+            os.set_blocking(w, False)
+            root.tk.createfilehandler(r, tk.READABLE, self._on_readable)
+            self._pipe = (r, w)
+        else:
+            root.bind(self.EVENT, lambda e: self._fire())
+
+    def notify(self):
+        """Можно вызывать из любого потока."""
+        if self._armed.is_set():
+            return
+        self._armed.set()
+        if self._pipe:
+            try:
+                os.write(self._pipe[1], b"\0")
+            except (BlockingIOError, OSError):
+                pass
+        else:
+            try:
+                self.root.event_generate(self.EVENT, when="tail")
+            except (tk.TclError, RuntimeError):
+                # Tcl без потоков: данные подберёт обычный опрос по таймеру
+                self._armed.clear()
+
+    def rearm(self):
+        """Снова принимать notify(); звать из потока Tk перед тем, как забрать данные."""
+        if not self._closed:
+            self._armed.clear()
+
+    def close(self):
+        self._closed = True
+        self._armed.set()  # поздние notify() из других потоков больше ничего не делают
+        if self._pipe:
+            self.root.tk.deletefilehandler(self._pipe[0])
+            for fd in self._pipe:
+                os.close(fd)
+            self._pipe = None
+
+    def _on_readable(self, fd, mask):
+        try:
+            os.read(fd, 4096)
+        except BlockingIOError:
+            pass
+        self._fire()
+
+    def _fire(self):
+        # флаг не снимаем: до rearm() новые кадры заберёт уже запланированный тик
+        self.callback()
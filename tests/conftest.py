@@ -0,0 +1,70 @@
+"""Общие заглушки для тестов: from tests.conftest import DummySerial, wait_for, ..."""
+import time
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class DummySerial:
+    def __init__(self, *a, **kw):
+        self.is_open = True
+        self.timeout = kw.get("timeout")
+        self.incoming = bytearray()
+        self.read_calls = 0
+        self.buffer = []
+        self.dtr = True
+        self.rts = True
+
+    @property
+    def in_waiting(self):
+        return len(self.incoming)
+
+    def write(self, data):
+        self.buffer.append(data)
+
+    def read(self, size=1):
+        self.read_calls += 1
+        if not self.incoming:
+            time.sleep(self.timeout or 0)  # как настоящий порт: ждём до таймаута
+            return b""
+        data = bytes(self.incoming[:size])
+        del self.incoming[:size]
+        return data
+
+    def close(self):
+        self.is_open = False
+
+
+class FakeScan:
+    def __init__(self, ports):
+        self.ports = list(ports)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return list(self.ports)
+
+
+class DummyText:
+    def __init__(self):
+        self.text = ""
+        self.calls = []
+        self.view = (0.0, 1.0)
+
+    def configure(self, **kw):
+        self.calls.append(("configure", kw))
+
+    def insert(self, index, text):
+        self.calls.append(("insert", index))
+        self.text += text
+
+    def yview(self, *args):
+        if not args:
+            return self.view
+        self.calls.append(("yview", args))
@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+import serial
+from serial_monitor.aio import AsyncSerialPort
+from serial_monitor.controllers.serial_controller import SerialController
+from serial_monitor.framing import make_framer
+from serial_monitor.settings_model import SettingsModel
+from tests.conftest import wait_for
+
+simulator = pytest.importorskip("serial_monitor.simulator")  # нужен pty (POSIX)
+
+
+def test_many_ports_in_one_event_loop():
+    async def exchange(port: AsyncSerialPort, command: str):
+        async with port:
+            await port.write(command + "\n")
+            frame = await asyncio.wait_for(port.__anext__(), 2)
+            return bytes(frame)
+
+    async def main(devices):
+        ports = [AsyncSerialPort(device.port, 115200) for device in devices]
+        return await asyncio.gather(*(exchange(port, f"ping {i}") for i, port in enumerate(ports)))
+
+    devices = [simulator.VirtualDevice(rate=0, echo=True).start() for _ in range(4)]
+    try:
+        answers = asyncio.run(main(devices))
+    finally:
+        for device in devices:
+            device.stop()
+    assert answers == [b"ping 0", b"ping 1", b"ping 2", b"ping 3"]
+
+
+def test_async_for_stream_and_lost_device():
+    async def main(device):
+        frames = []
+        with pytest.raises(serial.SerialException):
+            async with AsyncSerialPort(device.port) as port:
+                async for frame in port:
+                    frames.append(bytes(frame))
+                    if len(frames) == 50:
+                        device.stop()
+        return frames
+
+    device = simulator.VirtualDevice("csv", rate=1000, burst=10, seed=1).start()
+    frames = asyncio.run(main(device))
+    assert len(frames) >= 50
+    assert all(frame.count(b",") == 2 for frame in frames)
+
+
+def test_idle_gap_frames():
+    async def main(device):
+        async with AsyncSerialPort(device.port, framer=make_framer("IDLE", idle_gap_ms=20)) as port:
+            device.write(b"\x01\x02\x03")
+            return await asyncio.wait_for(port.read_frames(), 2)
+
+    with simulator.VirtualDevice(rate=0) as device:
+        frames = asyncio.run(main(device))
+    assert [bytes(frame) for frame in frames] == [b"\x01\x02\x03"]
+
+
+def test_concurrent_large_writes_do_not_interleave():
+    lines = [bytes([ord("a") + i]) * 200_000 for i in range(4)]
+
+    async def main(device):
+        async with AsyncSerialPort(device.port) as port:
+            await asyncio.wait_for(asyncio.gather(*(port.write(line + b"\n") for line in lines)), 10)
+
+    with simulator.VirtualDevice(rate=0) as device:
+        asyncio.run(main(device))
+        assert wait_for(lambda: len(device.lines_received) == 4, timeout=5)
+    assert sorted(device.lines_received) == lines
+
+
+def test_controller_asyncio_backend(monkeypatch, tmp_path):
+    monkeypatch.setattr("serial_monitor.config.CONFIG_FILE", tmp_path / "cfg.json")
+    with simulator.VirtualDevice(rate=0, echo=True) as device:
+        settings = SettingsModel()
+        settings.update(port=device.port, io_backend="asyncio")
+        controller = SerialController()
+        controller.connect(settings)
+        try:
+            controller.send("hello")
+            assert wait_for(lambda: controller.has_pending)
+            assert [bytes(frame) for frame in controller.read_lines()] == [b"hello"]
+            assert device.lines_received == [b"hello"]
+        finally:
+            controller.disconnect()
+        assert not controller.connected
+
+
+def test_invalid_backend(monkeypatch, tmp_path):
+    monkeypatch.setattr("serial_monitor.config.CONFIG_FILE", tmp_path / "cfg.json")
+    settings = SettingsModel()
+    settings.update(io_backend="twisted")
+    with pytest.raises(ValueError):
+        SerialController().connect(settings)
@@ -0,0 +1,92 @@
+import threading
+import time
+import pytest
+from serial_monitor.capture import CaptureWriter, CaptureReader, INDEX_EVERY, FOOTER
+from serial_monitor.serial_io import SerialHandler
+from tests.conftest import DummySerial
+
+
+def write_capture(path, count):
+    with CaptureWriter(str(path)) as writer:
+        for i in range(count):
+            writer.log("TX" if i % 10 == 0 else "RX", b"frame %d" % i, port_id=i % 3)
+    return writer
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "s.smcap"
+    write_capture(path, 50)
+    with CaptureReader(str(path)) as reader:
+        records = list(reader.records())
+        assert len(reader) == 50
+        assert [bytes(r.data) for r in records] == [b"frame %d" % i for i in range(50)]
+        assert records[0].direction == "TX" and records[1].direction == "RX"
+        assert [r.port for r in records[:4]] == [0, 1, 2, 0]
+        times = [r.t_ns for r in records]
+        assert times == sorted(times)
+        assert abs(reader.start_time - time.time()) < 60
+
+
+def test_seek_and_records_from(tmp_path):
+    path = tmp_path / "s.smcap"
+    count = 3 * INDEX_EVERY + 17
+    write_capture(path, count)
+    with CaptureReader(str(path)) as reader:
+        records = list(reader.records())
+        for n in (0, 1, INDEX_EVERY - 1, INDEX_EVERY, 2 * INDEX_EVERY + 5, count - 1):
+            assert bytes(next(reader.records(n)).data) == b"frame %d" % n
+            t = records[n].t_ns / 1e9
+            first = reader.seek(t)
+            assert records[first].t_ns >= records[n].t_ns
+            assert first == 0 or records[first - 1].t_ns < records[n].t_ns
+        assert reader.seek(reader.duration + 1) == count
+        window = list(reader.between(0, reader.duration + 1))
+        assert len(window) == count
+
+
+def test_unclosed_capture_rebuilds_index(tmp_path):
+    path = tmp_path / "s.smcap"
+    write_capture(path, INDEX_EVERY + 3)
+    data = path.read_bytes()
+    # обрезаем индекс, хвост и половину последней записи
+    index_offset = FOOTER.unpack_from(data, len(data) - FOOTER.size)[0]
+    path.write_bytes(data[:index_offset - 3])
+    with CaptureReader(str(path)) as reader:
+        assert len(reader) == INDEX_EVERY + 2
+        assert bytes(next(reader.records(INDEX_EVERY + 1)).data) == b"frame %d" % (INDEX_EVERY + 1)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "s.log"
+    path.write_text("2026-01-01 00:00:00.000000 RX hello\n")
+    with pytest.raises(ValueError):
+        CaptureReader(str(path))
+
+
+def test_handler_records_capture(tmp_path, monkeypatch):
+    monkeypatch.setattr("serial_monitor.serial_io.serial.Serial", DummySerial)
+    path = tmp_path / "s.smcap"
+    writer = CaptureWriter(str(path))
+    handler = SerialHandler("COM1", 9600, logger=writer)
+    handler.ser.incoming += b"a\nb\n"
+    handler._read_loop_iteration()
+    handler.send("c")
+    writer.close()
+    with CaptureReader(str(path)) as reader:
+        assert [(r.direction, bytes(r.data)) for r in reader.records()] == \
+               [("RX", b"a"), ("RX", b"b"), ("TX", b"c")]
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    writer = CaptureWriter(str(tmp_path / "s.smcap"), queue_size=2)
+    release = threading.Event()
+    write = writer._write
+    writer._write = lambda *item: release.wait(5) and write(*item)  # диск «завис»
+    for _ in range(10):
+        writer.log("RX", b"x")
+    assert writer.dropped >= 7
+    release.set()
+    writer.close()
+    assert writer.frames + writer.dropped == 10
+    with CaptureReader(writer.path) as reader:
+        assert len(reader) == writer.frames
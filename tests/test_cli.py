@@ -0,0 +1,91 @@
+import csv
+import io
+import json
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+from serial_monitor import cli
+from serial_monitor.capture import CaptureWriter
+from serial_monitor.parsers import make_parser
+
+ROOT = Path(__file__).resolve().parents[1]
+TEMP_PARSER = str(ROOT / "example" / "temp_n_num.json")
+
+
+def make_capture(path, count=10):
+    with CaptureWriter(str(path)) as writer:
+        writer.log_many("RX", [b"TEMP:%d.5 HUM:%d" % (i, i) for i in range(count)])
+        writer.log("RX", b"garbage")
+    return str(path)
+
+
+def run_cli(tmp_path, *args):
+    env = {"HOME": str(tmp_path), "PYTHONPATH": str(ROOT)}
+    return subprocess.run([sys.executable, "-m", "serial_monitor.app", "--headless", *args],
+                          capture_output=True, text=True, env=env, cwd=tmp_path, timeout=30)
+
+
+def test_text_output(tmp_path):
+    result = run_cli(tmp_path, "--replay", make_capture(tmp_path / "s.smcap"), "--mode", "HEX")
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.splitlines()
+    assert len(lines) == 11
+    assert lines[0] == b"TEMP:0.5 HUM:0".hex(" ").upper()
+
+
+def test_csv_output(tmp_path):
+    result = run_cli(tmp_path, "--replay", make_capture(tmp_path / "s.smcap"),
+                     "--format", "csv", "--parser", TEMP_PARSER)
+    rows = list(csv.reader(io.StringIO(result.stdout)))
+    assert rows[0] == ["time", "TEMP", "HUM"]
+    assert [row[1:] for row in rows[1:3]] == [["0.5", "0.0"], ["1.5", "1.0"]]
+    assert len(rows) == 11  # неразобранная строка пропущена
+
+
+def test_jsonl_output_to_file_with_count(tmp_path):
+    out = tmp_path / "out.jsonl"
+    result = run_cli(tmp_path, "--replay", make_capture(tmp_path / "s.smcap"), "--format", "jsonl",
+                     "--count", "3", "-o", str(out))
+    assert result.returncode == 0, result.stderr
+    rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [row["data"] for row in rows] == ["TEMP:0.5 HUM:0", "TEMP:1.5 HUM:1", "TEMP:2.5 HUM:2"]
+
+
+def test_headless_does_not_import_gui_or_numpy(tmp_path):
+    capture = make_capture(tmp_path / "s.smcap")
+    code = (
+        "import sys\n"
+        "from serial_monitor.app import main\n"
+        f"main(['--headless', '--replay', {capture!r}, '--format', 'jsonl', '--parser', {TEMP_PARSER!r}])\n"
+        "print(sorted(m for m in ('tkinter', 'numpy') if m in sys.modules), file=sys.stderr)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            env={"HOME": str(tmp_path), "PYTHONPATH": str(ROOT)}, timeout=30)
+    assert result.stderr.strip() == "[]"
+
+
+def test_missing_port_reports_error(tmp_path):
+    result = run_cli(tmp_path, "--port", str(tmp_path / "no-such-port"))
+    assert result.returncode == 1
+    assert "serial-monitor:" in result.stderr
+
+
+def test_multi_parser_rows():
+    parser = make_parser(json.loads((ROOT / "example" / "multi_messages.json").read_text()))
+    assert cli.field_names(parser)[:3] == ["TEMP", "HUM", "ax"]
+    batch = parser.parse_many(["TEMP:1.0 HUM:2.0", "IMU:0.1,0.2,9.8", "nothing"])
+    assert cli.batch_rows(batch) == [{"TEMP": 1.0, "HUM": 2.0}, {"ax": 0.1, "ay": 0.2, "az": 9.8}]
+
+
+def test_several_ports_one_stream(tmp_path):
+    simulator = pytest.importorskip("serial_monitor.simulator")
+    with simulator.VirtualDevice("regex", rate=200, seed=1) as a, \
+            simulator.VirtualDevice("regex", rate=200, seed=2) as b:
+        result = run_cli(tmp_path, "--port", a.port, "--port", b.port, "--format", "jsonl",
+                         "--parser", TEMP_PARSER, "--count", "100")
+    assert result.returncode == 0, result.stderr
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(rows) == 100
+    assert {row["port"] for row in rows} == {a.port, b.port}
+    assert all("TEMP" in row for row in rows)
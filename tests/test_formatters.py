@@ -0,0 +1,22 @@
+import pytest
+from serial_monitor.formatters import format_data, format_many
+
+FRAME = memoryview(b" \x00\xff\n")
+
+@pytest.mark.parametrize("mode, expected", [
+    ("HEX", "20 00 FF 0A"),
+    ("DEC", "32 0 255 10"),
+    ("BIN", "00100000 00000000 11111111 00001010"),
+    ("ANSI", " \x00\xff\n"),
+])
+def test_format_raw_bytes(mode, expected):
+    assert format_data(mode, FRAME) == expected
+
+def test_format_sent_string():
+    assert format_data("HEX", "Я") == "D0 AF"
+
+def test_format_many():
+    frames = [memoryview(b"A"), memoryview(b"BC")]
+    assert format_many("HEX", frames, "> ") == "> 41\n> 42 43"
+    assert format_many("UTF-8", frames) == "A\nBC"
+    assert format_many("HEX", []) == ""
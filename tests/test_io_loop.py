@@ -0,0 +1,77 @@
+import threading
+import time
+import pytest
+from serial_monitor.controllers.multi_port_controller import MultiPortController
+from serial_monitor.framing import make_framer
+from serial_monitor.io_loop import IOLoop, LoopPort
+from tests.conftest import wait_for
+
+simulator = pytest.importorskip("serial_monitor.simulator")  # нужен pty (POSIX)
+
+
+def drain(controller, until, timeout=3.0):
+    records = []
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not until(records):
+        records.extend(controller.read_records())
+        time.sleep(0.01)
+    return records
+
+
+def test_one_thread_serves_many_ports(monkeypatch, tmp_path):
+    monkeypatch.setattr("serial_monitor.config.CONFIG_FILE", tmp_path / "cfg.json")
+    devices = [simulator.VirtualDevice("csv", rate=200, seed=i).start() for i in range(8)]
+    before = threading.active_count()
+    controller = MultiPortController()
+    try:
+        controller.connect([device.port for device in devices])
+        assert threading.active_count() == before + 1
+        records = drain(controller, lambda r: {index for _, index, _ in r} == set(range(8)))
+    finally:
+        controller.disconnect()
+        for device in devices:
+            device.stop()
+
+    assert {index for _, index, _ in records} == set(range(8))
+    times = [ts for ts, _, _ in records]
+    assert times == sorted(times)  # общая очередь уже упорядочена по времени
+    frames = [bytes(frame) for _, _, batch in records for frame in batch]
+    assert all(frame.count(b",") == 2 for frame in frames)
+
+
+def test_send_and_lost_port(monkeypatch, tmp_path):
+    monkeypatch.setattr("serial_monitor.config.CONFIG_FILE", tmp_path / "cfg.json")
+    first = simulator.VirtualDevice(rate=0, echo=True).start()
+    second = simulator.VirtualDevice(rate=0, echo=True).start()
+    controller = MultiPortController()
+    controller.connect([first.port, second.port])
+    try:
+        controller.send(1, "ping")
+        records = drain(controller, lambda r: bool(r))
+        assert [(index, [bytes(f) for f in batch]) for _, index, batch in records] == [(1, [b"ping"])]
+
+        first.stop()
+        assert wait_for(lambda: controller.events)
+        assert "lost" in controller.pop_events()[0]
+        assert controller.lost == {0}
+        assert not controller.handlers[0].ser.is_open  # fd закрыт сразу, не при disconnect
+        controller.send(0, "nobody")  # не бросает
+        controller.send(1, "still here")
+        records = drain(controller, lambda r: bool(r))
+        assert records[0][1] == 1
+    finally:
+        controller.disconnect()
+        second.stop()
+
+
+def test_idle_gap_framing_without_port_timeout():
+    loop = IOLoop().start()
+    with simulator.VirtualDevice(rate=0) as device:
+        port = LoopPort(loop, device.port, 115200, framer=make_framer("IDLE", idle_gap_ms=20))
+        port.start()
+        device.write(b"\x01\x02\x03")
+        assert wait_for(lambda: not port.queue.empty())
+        assert bytes(port.queue.get_nowait()) == b"\x01\x02\x03"
+        port.stop()
+    loop.stop()
+    assert loop.stats["ports"] == 0
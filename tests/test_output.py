@@ -0,0 +1,85 @@
+from serial_monitor.controllers.output_controller import OutputController
+from tests.conftest import DummyText
+
+def test_batch_single_insert():
+    text = DummyText()
+    out = OutputController(text, None)
+    out.display_received_many([b"a", b"b", b"c"], "UTF-8")
+    out.display_sent("ping", "UTF-8")
+
+    assert out.flush() is False
+    assert text.text == "[Receive]: a\n[Receive]: b\n[Receive]: c\n[Send]: ping\n"
+    assert [c[0] for c in text.calls].count("insert") == 1
+    assert ("yview", ("end",)) in text.calls
+
+def test_no_autoscroll_when_scrolled_up():
+    text = DummyText()
+    text.view = (0.2, 0.5)
+    out = OutputController(text, None)
+    out.display_received(b"a", "HEX")
+    out.flush()
+
+    assert text.text == "[Receive]: 61\n"
+    assert not any(c[0] == "yview" for c in text.calls)
+
+def test_flush_budget_carries_over():
+    text = DummyText()
+    out = OutputController(text, None, max_lines_per_flush=2)
+    out.display_received_many([b"1", b"2", b"3"], "UTF-8")
+
+    assert out.flush() is True
+    assert text.text.count("\n") == 2
+    assert out.flush() is False
+    assert text.text.endswith("[Receive]: 3\n")
+
+def test_scrollback_trimmed_in_bulk():
+    from serial_monitor.console_model import ConsoleModel
+
+    text = DummyText()
+    text.delete = lambda start, end: text.calls.append(("delete", start, end))
+    out = OutputController(text, None, model=ConsoleModel(max_lines=100))
+    for i in range(10):
+        out.display_received_many([b"x"] * 20, "UTF-8")
+        out.flush()
+
+    deletes = [c for c in text.calls if c[0] == "delete"]
+    assert 0 < len(deletes) < 10
+    assert out.model.lines <= 110
+
+def test_clear_drops_pending_and_console():
+    text = DummyText()
+    text.delete = lambda start, end: text.calls.append(("delete", start, end))
+    out = OutputController(text, None)
+    out.display_received_many([b"a"] * 10, "UTF-8")
+    out.flush()
+    out.display_received_many([b"b"] * 10, "UTF-8")
+
+    out.clear()
+    assert ("delete", "1.0", "end") in text.calls
+    assert not out.has_pending and out.model.lines == 0
+    assert out.flush() is False
+
+def test_console_model_limits():
+    from serial_monitor.console_model import ConsoleModel
+
+    model = ConsoleModel(max_chars=1000)
+    for _ in range(1000):
+        model.add(10, 100)
+        model.trim()
+    assert model.chars <= 1100
+    assert len(model._chunks) <= 11
+
+def test_display_capture_records():
+    from serial_monitor.capture import CaptureRecord
+
+    text = DummyText()
+    out = OutputController(text, None)
+    out.display_records([
+        CaptureRecord(0, "RX", 0, memoryview(b"a")),
+        CaptureRecord(1, "RX", 0, memoryview(b"b")),
+        CaptureRecord(2, "TX", 0, memoryview(b"ping")),
+        CaptureRecord(3, "RX", 0, memoryview(b"c")),
+    ], "UTF-8")
+    out.flush()
+
+    assert text.text == "[Receive]: a\n[Receive]: b\n[Send]: ping\n[Receive]: c\n"
@@ -0,0 +1,190 @@
+import binascii
+import struct
+import time
+from pathlib import Path
+import pytest
+from serial_monitor.parsers import LineParser, MultiParser, BinaryParser, load_parser_config
+from serial_monitor.framing import make_framer, slip_encode, cobs_encode
+from serial_monitor.controllers.parse_stage import ParseStage
+
+EXAMPLE = Path(__file__).resolve().parents[1] / "example"
+
+def test_regex_example_config():
+    parser = load_parser_config(str(EXAMPLE / "temp_n_num.json"))
+    assert parser.parse("TEMP:23.4 HUM:50.1") == {"TEMP": 23.4, "HUM": 50.1}
+    assert parser.parse("garbage") == {}
+
+def test_regex_auto_types():
+    parser = LineParser({"type": "regex", "pattern": r"A:(?P<A>\S+) B:(?P<B>\S+)"})
+    assert parser.parse("A:1.5 B:7") == {"A": 1.5, "B": 7}
+    assert parser.parse("A:1.5 B:on") == {"A": 1.5, "B": "on"}
+
+def test_csv_typed_fields():
+    parser = LineParser({"type": "csv", "delimiter": ";",
+                         "fields": {"id": "hex", "temp": "float", "name": "str"}})
+    assert parser.parse("1F;20.5;probe\n") == {"id": 31, "temp": 20.5, "name": "probe"}
+    assert parser.parse("zz;20.5;probe") == {}
+    assert parser.parse("1;2") == {}
+
+def test_invalid_field_type():
+    with pytest.raises(ValueError):
+        LineParser({"type": "csv", "fields": {"x": "decimal"}})
+
+def test_parse_many_columns():
+    parser = load_parser_config(str(EXAMPLE / "temp_n_num.json"))
+    lines = (EXAMPLE / "temp_n_hum_values.txt").read_text().splitlines()
+    batch = parser.parse_many(["noise"] + lines[:3])
+
+    assert batch.rows == [1, 2, 3]
+    assert batch.columns["TEMP"].tolist() == [23.4, 22.8, 24.1]
+    assert batch.columns["HUM"].tolist() == [50.1, 48.7, 52.3]
+
+def test_multi_parser_dispatch():
+    parser = load_parser_config(str(EXAMPLE / "multi_messages.json"))
+
+    assert parser.parse("TEMP:23.4 HUM:50.1") == {"TEMP": 23.4, "HUM": 50.1}
+    assert parser.parse("IMU:0.1,-0.2,9.8") == {"ax": 0.1, "ay": -0.2, "az": 9.8}
+    assert parser.parse("boot ok, uptime=42") == {"uptime": 42}
+    assert parser.parse("IMU:broken") == {}
+    assert parser.parse("hello") == {}
+    assert parser.matched == {"climate": 1, "imu": 1, "gps": 0, "status": 1}
+    assert parser.unmatched == 2
+
+def test_multi_parser_parse_many():
+    parser = load_parser_config(str(EXAMPLE / "multi_messages.json"))
+    lines = ["GPS:55.75,37.61", "noise", "TEMP:20 HUM:40", "uptime=7", "TEMP:21 HUM:41"]
+    batch = parser.parse_many(lines)
+
+    assert batch.rows == [0, 2, 3, 4]
+    assert batch.columns["TEMP"].tolist() == [20, 21]
+    assert batch.column_rows["TEMP"] == [2, 4]
+    assert batch.column_rows["lat"] == [0]
+    assert batch.columns["uptime"].tolist() == [7]
+    assert parser.unmatched == 1
+
+def test_multi_parser_duplicate_prefix():
+    message = {"prefix": "A:", "type": "csv", "fields": ["x"]}
+    with pytest.raises(ValueError):
+        MultiParser({"type": "multi", "messages": [dict(message, name="a"), dict(message, name="b")]})
+
+def test_multi_parser_shared_field_types():
+    a = {"name": "a", "prefix": "A:", "type": "csv", "fields": {"x": "float"}}
+    b = {"name": "b", "prefix": "B:", "type": "csv", "fields": {"x": "int"}}
+    parser = MultiParser({"type": "multi", "messages": [a, b]})
+    batch = parser.parse_many(["A:1.5", "B:2"])
+    assert batch.columns["x"].tolist() == [1.5, 2.0]
+    with pytest.raises(ValueError, match="'x'"):
+        MultiParser({"type": "multi", "messages": [a, dict(b, fields={"x": "str"})]})
+
+def test_multi_parser_shared_field_keeps_line_order():
+    parser = MultiParser({"type": "multi", "messages": [
+        {"name": "a", "prefix": "A:", "type": "csv", "fields": {"x": "float"}},
+        {"name": "b", "prefix": "B:", "type": "csv", "fields": {"x": "float", "y": "float"}},
+    ]})
+    batch = parser.parse_many(["A:1", "B:2,3", "A:4", "B:5,6"])
+    assert batch.columns["x"].tolist() == [1, 2, 4, 5]
+    assert batch.column_rows["x"] == [0, 1, 2, 3]
+    assert batch.columns["y"].tolist() == [3, 6]
+    assert batch.column_rows["y"] == [1, 3]
+
+def _telemetry_frame(i: int, temp: float, hum: float) -> bytes:
+    payload = struct.pack("<Hff", i, temp, hum)
+    crc = binascii.crc_hqx(payload, 0xFFFF).to_bytes(2, "little")
+    return slip_encode(payload + crc)
+
+def test_binary_parser_slip_crc():
+    parser = load_parser_config(str(EXAMPLE / "binary_telemetry.json"))
+    framer = make_framer("SLIP")
+    stream = b"".join(_telemetry_frame(i, 20.5 + i, 50.0) for i in range(5))
+    stream = stream.replace(b"\x02\x00", b"\x02\x01", 1)  # портим кадр №2 — CRC не сойдётся
+    frames = framer.feed(stream)
+
+    batch = parser.parse_many(frames)
+
+    assert batch.rows == [0, 1, 3, 4]
+    assert batch.columns["id"].tolist() == [0, 1, 3, 4]
+    assert batch.columns["temp"].tolist() == [20.5, 21.5, 23.5, 24.5]
+    assert parser.crc_errors == 1
+    assert parser.parse(frames[0]) == {"id": 0, "temp": 20.5, "hum": 50.0}
+
+def test_binary_parser_cobs_length_check():
+    parser = BinaryParser({"type": "binary", "framing": "cobs", "format": ">hB", "fields": ["a", "b"]})
+    frames = make_framer("NUL").feed(cobs_encode(b"\xff\xfe\x00") + cobs_encode(b"\x01"))
+
+    batch = parser.parse_many(frames)
+
+    assert batch.rows == [0]
+    assert batch.columns["a"].tolist() == [-2]
+    assert parser.size_errors == 1
+
+def test_length_prefix_framer():
+    framer = make_framer("LEN16")
+    frames = framer.feed(b"\x03\x00abc\x02\x00d")
+    frames += framer.feed(b"e")
+    assert [bytes(f) for f in frames] == [b"abc", b"de"]
+
+@pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+def test_parse_stage_modes(mode):
+    parser = load_parser_config(str(EXAMPLE / "temp_n_num.json"))
+    stage = ParseStage(parser, mode)
+    stage.submit([memoryview(b"TEMP:1.5 HUM:2.5"), memoryview(b"noise")])
+    stage.submit([b"TEMP:3.5 HUM:4.5"])
+
+    batches = []
+    deadline = time.monotonic() + 10
+    while len(batches) < 2 and time.monotonic() < deadline:
+        batches += stage.collect()
+        time.sleep(0.01)
+    stage.close()
+
+    assert [batch.columns["TEMP"].tolist() for _, batch in batches] == [[1.5], [3.5]]
+    assert batches[0][0] <= batches[1][0]
+
+
+def _collect(stage, count):
+    batches = []
+    deadline = time.monotonic() + 10
+    while len(batches) < count and time.monotonic() < deadline:
+        batches += stage.collect()
+        time.sleep(0.01)
+    return batches
+
+
+def test_parse_stage_thread_failure_falls_back_inline():
+    parser = load_parser_config(str(EXAMPLE / "temp_n_num.json"))
+    parse_many = parser.parse_many
+    calls = []
+
+    def flaky(lines):
+        calls.append(lines)
+        if len(calls) == 1:
+            raise RuntimeError("parser bug")
+        return parse_many(lines)
+
+    parser.parse_many = flaky
+    stage = ParseStage(parser, "thread")
+    stage.submit([b"TEMP:1.5 HUM:2.5"])
+    stage.submit([b"TEMP:3.5 HUM:4.5"])
+    batches = _collect(stage, 2)
+    stage.close()
+
+    assert [batch.columns["TEMP"].tolist() for _, batch in batches] == [[1.5], [3.5]]
+    assert stage.failed == 1 and stage.mode == "inline"
+    assert not stage.busy
+
+
+def test_parse_stage_dead_process_falls_back_inline():
+    parser = load_parser_config(str(EXAMPLE / "temp_n_num.json"))
+    stage = ParseStage(parser, "process")
+    stage.submit([b"TEMP:1.5 HUM:2.5"])
+    assert _collect(stage, 1)
+    for process in list(stage._executor._processes.values()):
+        process.kill()
+        process.join()
+    stage.submit([b"TEMP:3.5 HUM:4.5"])
+    stage.submit([b"TEMP:5.5 HUM:6.5"])
+    batches = _collect(stage, 2)
+    stage.close()
+
+    assert [batch.columns["TEMP"].tolist() for _, batch in batches] == [[3.5], [5.5]]
+    assert stage.failed >= 1 and stage.mode == "inline"
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from serial_monitor.ui.series_buffer import SeriesBuffer
+from serial_monitor.ui.decimate import decimate
+
+def test_series_buffer_keeps_last_points():
+    buf = SeriesBuffer(capacity=5)
+    for i in range(12):
+        buf.append(float(i), float(i * 10))
+
+    assert len(buf) == 5
+    assert buf.times.tolist() == [7, 8, 9, 10, 11]
+    assert buf.values.tolist() == [70, 80, 90, 100, 110]
+    assert buf.last_time == 11
+
+def test_series_buffer_window():
+    buf = SeriesBuffer(capacity=100)
+    buf.extend(np.arange(50.0), np.arange(50.0) * 2)
+
+    times, values = buf.window(45.5)
+    assert times.tolist() == [46, 47, 48, 49]
+    assert values.tolist() == [92, 94, 96, 98]
+
+def test_series_buffer_extend_wraps():
+    buf = SeriesBuffer(capacity=4)
+    buf.append(0.0, 0.0)
+    buf.extend([1.0, 2.0, 3.0, 4.0, 5.0], [1.0, 2.0, 3.0, 4.0, 5.0])
+
+    assert buf.times.tolist() == [2, 3, 4, 5]
+    buf.append(6.0, 6.0)
+    assert buf.values.tolist() == [3, 4, 5, 6]
+
+def test_series_buffer_running_bounds():
+    buf = SeriesBuffer(capacity=1000)
+    buf.extend(np.arange(10.0), [5, 1, 9, 3, 3, 3, 3, 3, 3, 3])
+    assert buf.bounds(0.0) == (1, 9)
+
+    buf.append(10.0, 0.0)
+    assert buf.bounds(0.0) == (0, 9)
+    # максимум ушёл из окна — пересчёт по оставшимся точкам
+    assert buf.bounds(3.0) == (0, 3)
+    assert buf.bounds(20.0) is None
+
+@pytest.mark.parametrize("mode", ["minmax", "lttb"])
+def test_decimation_keeps_peaks(mode):
+    x = np.linspace(0, 10, 100_000)
+    y = np.sin(x)
+    y[12_345], y[67_890] = 50.0, -40.0
+
+    xs, ys = decimate(mode, x, y, pixels=500)
+
+    assert len(xs) <= 2 * 500 + 2
+    assert ys.max() == 50.0 and ys.min() == -40.0
+    assert np.all(np.diff(xs) >= 0)
+
+def test_decimation_passthrough_when_sparse():
+    x = np.arange(10.0)
+    xs, ys = decimate("minmax", x, x, pixels=500)
+    assert xs is x
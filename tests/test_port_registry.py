@@ -0,0 +1,78 @@
+import time
+from serial_monitor.port_registry import PortRegistry
+from tests.conftest import FakeScan, wait_for
+
+
+def test_refresh_reports_added_and_removed():
+    scan = FakeScan(["/dev/ttyUSB0"])
+    registry = PortRegistry(scan=scan, watch_paths=())
+    events = []
+    registry.subscribe(lambda added, removed: events.append((added, removed)))
+
+    registry.refresh()
+    scan.ports = ["/dev/ttyUSB0", "/dev/ttyACM0"]
+    registry.refresh()
+    registry.refresh()  # без изменений — без события
+    scan.ports = ["/dev/ttyACM0"]
+    registry.refresh()
+
+    assert events == [(["/dev/ttyUSB0"], []), (["/dev/ttyACM0"], []), ([], ["/dev/ttyUSB0"])]
+    assert registry.ports == ["/dev/ttyACM0"]
+
+
+def test_rescans_only_when_watched_dir_changes(tmp_path):
+    scan = FakeScan(["COM1"])
+    events = []
+    registry = PortRegistry(scan=scan, interval=0.01, watch_paths=(str(tmp_path),))
+    registry.subscribe(lambda added, removed: events.append((added, removed)))
+    registry.start()
+    try:
+        assert wait_for(lambda: registry.ready)
+        time.sleep(0.1)
+        assert scan.calls == 1  # каталог не менялся — comports() не зовём
+
+        scan.ports = ["COM1", "COM2"]
+        (tmp_path / "ttyUSB1").touch()  # «подключили устройство»
+        assert wait_for(lambda: registry.ports == ["COM1", "COM2"])
+        assert events[-1] == (["COM2"], [])
+    finally:
+        registry.stop()
+
+
+def test_poke_forces_rescan():
+    scan = FakeScan([])
+    registry = PortRegistry(scan=scan, interval=10, watch_paths=())
+    registry.start()
+    try:
+        assert wait_for(lambda: registry.ready)
+        scan.ports = ["COM3"]
+        registry.poke()
+        assert wait_for(lambda: registry.ports == ["COM3"])
+    finally:
+        registry.stop()
+
+
+def test_failures_do_not_stop_registry():
+    scan = FakeScan(["COM1"])
+    registry = PortRegistry(scan=scan, interval=10, watch_paths=())
+    events = []
+
+    def broken(added, removed):
+        raise RuntimeError("subscriber bug")
+
+    registry.subscribe(broken)
+    registry.subscribe(lambda added, removed: events.append((added, removed)))
+    registry.refresh()
+    assert events == [(["COM1"], [])] and registry.errors == 1
+
+    scan.ports = None  # list(None): TypeError из «сломанного» comports()
+    registry.start()
+    try:
+        assert wait_for(lambda: registry.errors == 2)
+        assert isinstance(registry.last_error, TypeError)
+        scan.ports = ["COM1", "COM2"]
+        registry.poke()
+        assert wait_for(lambda: registry.ports == ["COM1", "COM2"])
+        assert events[-1] == (["COM2"], [])
+    finally:
+        registry.stop()
@@ -0,0 +1,110 @@
+import serial
+from serial_monitor.controllers.serial_controller import SerialController
+from serial_monitor.port_registry import PortRegistry
+from serial_monitor.session_log import SessionLogger
+from serial_monitor.settings_model import SettingsModel
+from tests.conftest import DummySerial, FakeScan, wait_for
+
+
+class FlakySerial(DummySerial):
+    """Порт, который можно «выдернуть»: чтение падает, открытие не удаётся."""
+    present = True
+    opened = []
+
+    def __init__(self, *a, **kw):
+        if not FlakySerial.present:
+            raise serial.SerialException("could not open port")
+        super().__init__(*a, **kw)
+        self.unplugged = False
+        FlakySerial.opened.append(self)
+
+    def read(self, size=1):
+        if self.unplugged:
+            raise serial.SerialException("device reports readiness to read but returned no data")
+        return super().read(size)
+
+
+def make_controller(monkeypatch, tmp_path, ports=None, **config):
+    monkeypatch.setattr("serial_monitor.config.CONFIG_FILE", tmp_path / "cfg.json")
+    monkeypatch.setattr("serial_monitor.serial_io.serial.Serial", FlakySerial)
+    monkeypatch.setattr(FlakySerial, "present", True)
+    monkeypatch.setattr(FlakySerial, "opened", [])
+    settings = SettingsModel()
+    settings.update(port="COM1", **config)
+    controller = SerialController(ports)
+    controller.connect(settings)
+    return controller
+
+
+def unplug():
+    FlakySerial.present = False
+    FlakySerial.opened[-1].unplugged = True
+
+
+def test_reconnect_keeps_queue_and_records_gap(monkeypatch, tmp_path):
+    controller = make_controller(monkeypatch, tmp_path, log_path=str(tmp_path / "s.log"))
+    FlakySerial.opened[0].incoming += b"before\n"
+    assert wait_for(lambda: controller.has_pending)
+    controller.set_dtr(False)
+
+    unplug()
+    assert wait_for(lambda: controller.reconnect_attempts > 1)
+    FlakySerial.present = True
+    assert wait_for(lambda: controller.reconnects == 1)
+
+    assert controller.connected and not controller.reconnecting
+    assert len(FlakySerial.opened) == 2
+    assert FlakySerial.opened[1].dtr is False
+    FlakySerial.opened[1].incoming += b"after\n"
+    assert wait_for(lambda: controller.handler.queue.qsize() == 2)
+    assert [bytes(f) for f in controller.read_lines()] == [b"before", b"after"]
+
+    events = controller.pop_events()
+    assert "lost" in events[0] and "reconnected" in events[1]
+    stats = controller.reconnect_stats
+    assert 0 < stats["last_ms"] == stats["max_ms"] < 1000
+    assert stats["downtime"] > 0
+
+    assert isinstance(controller.logger, SessionLogger)
+    controller.disconnect()
+    lines = (tmp_path / "s.log").read_text(encoding="utf-8").splitlines()
+    assert [line.split(" ", 3)[2] for line in lines] == ["RX", "--", "--", "RX"]
+
+
+def test_registry_event_wakes_reconnect(monkeypatch, tmp_path):
+    scan = FakeScan(["COM1"])
+    registry = PortRegistry(scan=scan, watch_paths=())
+    registry.refresh()
+    # backoff длиннее таймаута теста: успеть можно только по событию реестра
+    controller = make_controller(monkeypatch, tmp_path, registry,
+                                 reconnect_min_ms=10_000, reconnect_max_ms=10_000)
+
+    unplug()
+    assert wait_for(lambda: controller.reconnect_attempts == 1)
+    scan.ports = []
+    registry.refresh()
+    FlakySerial.present = True
+    scan.ports = ["COM1"]
+    registry.refresh()
+
+    assert wait_for(lambda: controller.reconnects == 1)
+    assert controller.last_reconnect_ms < 2000
+    controller.disconnect()
+
+
+def test_disconnect_cancels_reconnect(monkeypatch, tmp_path):
+    controller = make_controller(monkeypatch, tmp_path)
+    lost = controller.handler
+
+    unplug()
+    assert wait_for(lambda: controller.reconnecting)
+    controller.disconnect()
+
+    assert not lost.thread.is_alive()
+    assert controller.handler is None and controller.reconnects == 0
+
+
+def test_auto_reconnect_off(monkeypatch, tmp_path):
+    controller = make_controller(monkeypatch, tmp_path, auto_reconnect=False)
+    assert controller.handler.on_error is None
+    controller.disconnect()
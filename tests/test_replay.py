@@ -0,0 +1,120 @@
+import threading
+import pytest
+from serial_monitor.capture import CaptureWriter
+from serial_monitor.replay import ReplayHandler
+from serial_monitor.session_log import SessionLogger
+from serial_monitor.controllers.serial_controller import SerialController
+from serial_monitor.controllers.output_controller import OutputController
+from tests.conftest import DummyText
+
+
+def replay_all(handler):
+    handler.start()
+    assert handler.finished.wait(5)
+    frames = []
+    while not handler.queue.empty():
+        frames.append(bytes(handler.queue.get_nowait()))
+    handler.stop()
+    return frames
+
+
+def test_replay_capture_max_speed(tmp_path):
+    path = tmp_path / "s.smcap"
+    with CaptureWriter(str(path)) as writer:
+        for i in range(3000):
+            writer.log("RX", b"line %d" % i)
+        writer.log("TX", b"ping")
+
+    handler = ReplayHandler(str(path), speed=0)
+    assert replay_all(handler) == [b"line %d" % i for i in range(3000)]
+    assert handler.stats["frames"] == 3000
+    assert handler.stats["frames_per_s"] > 0
+
+
+def test_replay_stats_end_when_consumer_drains(tmp_path):
+    path = tmp_path / "s.smcap"
+    with CaptureWriter(str(path)) as writer:
+        writer.log_many("RX", [b"line %d" % i for i in range(100)])
+
+    handler = ReplayHandler(str(path), speed=0)
+    handler.start()
+    assert handler.finished.wait(5)
+    assert not handler.drained()  # всё проиграно, но ещё не забрано
+    while not handler.queue.empty():
+        handler.queue.get_nowait()
+    assert handler.drained()
+    stats = handler.stats
+    handler.stop()
+
+    assert stats["produced"] <= stats["elapsed"] == handler.stats["elapsed"]
+
+
+def test_replay_session_log(tmp_path):
+    path = tmp_path / "s.log"
+    logger = SessionLogger(str(path))
+    logger.log_many("RX", [b"a\\b", b"\xff\x00"])
+    logger.log("TX", b"ping")
+    logger.log("RX", b"c")
+    logger.close()
+
+    assert replay_all(ReplayHandler(str(path), speed=0)) == [b"a\\b", b"\xff\x00", b"c"]
+
+
+def test_replay_speed(tmp_path):
+    path = tmp_path / "s.log"
+    path.write_text("".join(
+        f"2026-01-01 00:00:0{i}.000000 RX {i}\n" for i in range(3)
+    ))
+    # 2 с записи при скорости x10 — около 0.2 с
+    handler = ReplayHandler(str(path), speed=10)
+    assert replay_all(handler) == [b"0", b"1", b"2"]
+    assert 0.15 < handler.stats["elapsed"] < 1.5
+
+
+def test_replay_through_pipeline(tmp_path):
+    path = tmp_path / "s.smcap"
+    with CaptureWriter(str(path)) as writer:
+        writer.log_many("RX", [b"TEMP:%d" % i for i in range(10)])
+
+    serial = SerialController()
+    serial.connect_replay(str(path), speed=0)
+    assert serial.replaying
+    serial.handler.finished.wait(5)
+    text = DummyText()
+    out = OutputController(text, None)
+    out.display_received_many(serial.read_lines(), "UTF-8")
+    out.flush()
+    serial.disconnect()
+
+    assert text.text.splitlines() == [f"[Receive]: TEMP:{i}" for i in range(10)]
+
+
+def test_stop_leaves_capture_to_the_playing_thread(tmp_path):
+    path = tmp_path / "s.smcap"
+    with CaptureWriter(str(path)) as writer:
+        writer.log_many("RX", [b"line %d" % i for i in range(10)])
+
+    handler = ReplayHandler(str(path), speed=0)
+    release = threading.Event()
+    emit = handler._emit
+    handler._emit = lambda batch: release.wait(5) and emit(batch)  # поток завис на отдаче пачки
+    handler.start()
+    handler.stop()
+    assert handler.thread.is_alive() and handler.capture._map is not None
+
+    release.set()
+    handler.thread.join(5)
+    assert handler.capture._map is None
+
+
+def test_stop_without_start_closes_capture(tmp_path):
+    path = tmp_path / "s.smcap"
+    CaptureWriter(str(path)).close()
+    handler = ReplayHandler(str(path))
+    handler.stop()
+    assert handler.capture._map is None
+
+
+def test_replay_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ReplayHandler(str(tmp_path / "nope.log"))
@@ -0,0 +1,59 @@
+import os
+import threading
+import tkinter as tk
+import pytest
+from queue import Queue
+from serial_monitor.scheduler import PollScheduler
+from serial_monitor.controllers.serial_controller import SerialController
+from serial_monitor.ui.wakeup import TkWakeup
+
+def test_poll_interval_adapts():
+    poll = PollScheduler(min_ms=10, max_ms=200)
+    assert poll.next_interval(True) == 10
+    intervals = [poll.next_interval(False) for _ in range(10)]
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == 200
+    assert poll.next_interval(False, backlog=True) == 1
+    assert poll.next_interval(True) == 10
+
+def test_read_lines_budget():
+    class Handler:
+        queue = Queue()
+
+    controller = SerialController()
+    controller.handler = Handler()
+    for i in range(5):
+        controller.handler.queue.put(i)
+
+    assert controller.read_lines(3) == [0, 1, 2]
+    assert controller.has_pending
+    assert controller.read_lines(3) == [3, 4]
+    assert not controller.has_pending
+
+@pytest.mark.skipif(os.name != "posix", reason="self-pipe wakeup is POSIX only")
+def test_wakeup_coalesces_notifications():
+    root = tk.Tcl()
+    calls = []
+    wakeup = TkWakeup(root, lambda: calls.append(1))
+    threads = [threading.Thread(target=wakeup.notify) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    root.tk.dooneevent(tk._tkinter.DONT_WAIT)
+    assert calls == [1]
+
+    # до rearm() новые notify() ждут уже запланированный тик
+    wakeup.notify()
+    root.tk.dooneevent(tk._tkinter.DONT_WAIT)
+    assert calls == [1]
+
+    wakeup.rearm()
+    wakeup.notify()
+    root.tk.dooneevent(tk._tkinter.DONT_WAIT)
+    assert calls == [1, 1]
+    wakeup.close()
+    wakeup.rearm()
+    wakeup.notify()  # после close() — ничего
+    assert calls == [1, 1]
@@ -1,32 +1,18 @@
+import time
 import pytest
 from serial_monitor.serial_io import SerialHandler
-
-class DummySerial:
-    def __init__(self, *a, **kw):
-        self.is_open = True
-        self.in_waiting = 0
-        self.buffer = []
-        self.dtr = True
-        self.rts = True
-
-    def write(self, data):
-        self.buffer.append(data)
-
-    def readline(self):
-        return b"Hello\n"
-
-    def close(self):
-        self.is_open = False
+from serial_monitor.framing import make_framer
+from tests.conftest import DummySerial
 
 def test_send_and_receive(monkeypatch):
     monkeypatch.setattr("serial_monitor.serial_io.serial.Serial", DummySerial)
     handler = SerialHandler("COM1", 9600)
-    handler.ser.in_waiting = 1  # чтобы _read_loop прочитал
+    handler.ser.incoming += b"Hello\n"  # чтобы _read_loop прочитал
 
     # запускаем один проход
     handler._read_loop_iteration()
 
-    assert handler.queue.get_nowait() == "Hello"
+    assert handler.queue.get_nowait() == b"Hello"
 
     handler.send("Ping")
     assert handler.ser.buffer[-1] == b"Ping\n"
@@ -40,3 +26,78 @@ def test_dtr_rts(monkeypatch):
 
     handler.set_rts(False)
     assert handler.ser.rts is False
+
+def test_bulk_read(monkeypatch):
+    monkeypatch.setattr("serial_monitor.serial_io.serial.Serial", DummySerial)
+    handler = SerialHandler("COM1", 921600)
+    handler.ser.incoming += b"".join(b"line %d\n" % i for i in range(1000))
+
+    handler._read_loop_iteration()
+
+    assert handler.ser.read_calls == 1
+    assert handler.queue.qsize() == 1000
+
+def test_idle_port_does_not_spin(monkeypatch):
+    monkeypatch.setattr("serial_monitor.serial_io.serial.Serial", DummySerial)
+    handler = SerialHandler("COM1", 9600, timeout=50)
+    handler.start()
+    time.sleep(0.3)
+    handler.stop()
+
+    # busy-wait would make millions of calls; blocking read makes ~6
+    assert handler.ser.read_calls < 20
+    assert not handler.thread.is_alive()
+
+@pytest.mark.parametrize("framing, chunks, expected", [
+    ("LF", [b"ab\nc", b"d\n"], [b"ab", b"cd"]),
+    ("CRLF", [b"ab\r", b"\ncd\r\n"], [b"ab", b"cd"]),
+    ("NUL", [b"\x01\x02\x00\x03", b"\x00"], [b"\x01\x02", b"\x03"]),
+    ("FIXED", [b"abc", b"defgh"], [b"abcd", b"efgh"]),
+])
+def test_framers(framing, chunks, expected):
+    framer = make_framer(framing, frame_length=4)
+    frames = []
+    for chunk in chunks:
+        frames += framer.feed(chunk)
+    assert [bytes(f) for f in frames] == expected
+
+def test_idle_gap_framer():
+    framer = make_framer("IDLE", idle_gap_ms=10)
+    assert framer.feed(b"\x01\x02") == []
+    assert framer.poll() == []
+    time.sleep(0.02)
+    assert [bytes(f) for f in framer.poll()] == [b"\x01\x02"]
+
+def test_raw_frames_are_lossless(monkeypatch):
+    monkeypatch.setattr("serial_monitor.serial_io.serial.Serial", DummySerial)
+    handler = SerialHandler("COM1", 9600)
+    handler.ser.incoming += b" \xff\x00\t\n"
+
+    handler._read_loop_iteration()
+
+    frame = handler.queue.get_nowait()
+    assert isinstance(frame, memoryview)
+    assert bytes(frame) == b" \xff\x00\t"
+
+def test_ring_frames_survive_rotation():
+    from serial_monitor.ring_buffer import ByteRing
+    from serial_monitor.framing import DelimiterFramer
+
+    framer = DelimiterFramer(b"\n", ByteRing(slab_size=64, slabs=2))
+    kept = []
+    for i in range(100):
+        kept += framer.feed(b"frame-%03d\n" % i)
+
+    assert [bytes(f) for f in kept] == [b"frame-%03d" % i for i in range(100)]
+
+def test_on_frames_called_once_per_read(monkeypatch):
+    monkeypatch.setattr("serial_monitor.serial_io.serial.Serial", DummySerial)
+    wakeups = []
+    handler = SerialHandler("COM1", 9600, on_frames=lambda: wakeups.append(1))
+    handler.ser.incoming += b"a\nb\nc\n"
+
+    handler._read_loop_iteration()
+    handler._read_loop_iteration()  # таймаут без данных
+
+    assert handler.queue.qsize() == 3
+    assert wakeups == [1]
@@ -0,0 +1,68 @@
+import codecs
+import gzip
+import threading
+import time
+from serial_monitor.serial_io import SerialHandler
+from serial_monitor.session_log import SessionLogger, escape
+from tests.conftest import DummySerial
+
+
+def test_escape_round_trip():
+    data = b"a\\b\r\n\xff\x00\t\x1b[0m\x7f\xd0\xbf"
+    line = escape(data)
+    assert line.isprintable()
+    assert codecs.escape_decode(line.encode("utf-8"))[0] == data
+
+
+def test_logs_rx_and_tx(tmp_path, monkeypatch):
+    monkeypatch.setattr("serial_monitor.serial_io.serial.Serial", DummySerial)
+    path = tmp_path / "session.log"
+    logger = SessionLogger(str(path), flush_interval=0.05)
+    handler = SerialHandler("COM1", 9600, logger=logger)
+    handler.ser.incoming += b"one\ntwo\n"
+    handler._read_loop_iteration()
+    handler.send("ping")
+    logger.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [line.split(" ", 2)[2] for line in lines] == ["RX one", "RX two", "TX ping"]
+    assert logger.frames == 3
+    assert logger.dropped == 0
+    assert logger.flushes >= 1
+
+
+def test_copies_frames_before_queueing(tmp_path):
+    logger = SessionLogger(str(tmp_path / "s.log"))
+    buf = bytearray(b"abc")
+    logger.log("RX", memoryview(buf))
+    buf[:] = b"xyz"  # кольцевой буфер переписал слаб
+    logger.close()
+    assert (tmp_path / "s.log").read_text().endswith("RX abc\n")
+
+
+def test_rotation_by_size_with_gzip(tmp_path):
+    path = tmp_path / "session.log"
+    logger = SessionLogger(str(path), max_bytes=200, compress="gzip", flush_interval=0.01)
+    for i in range(20):
+        logger.log_many("RX", [b"frame %d" % i] * 5)
+        time.sleep(0.01)
+    logger.close()
+
+    rotated = sorted(tmp_path.glob("session-*.log.gz"))
+    assert rotated and logger.rotations == len(rotated)
+    text = b"".join(gzip.decompress(p.read_bytes()) for p in rotated) + path.read_bytes()
+    assert text.count(b" RX frame ") == 100
+
+
+def test_close_with_stalled_writer(tmp_path, monkeypatch):
+    release = threading.Event()
+    logger = SessionLogger(str(tmp_path / "s.log"), queue_size=1, flush_interval=0.01)
+    monkeypatch.setattr(logger, "_write", lambda items: release.wait(2))
+    logger.log("RX", b"taken by the writer")
+    time.sleep(0.05)
+    logger.log("RX", b"fills the queue")
+
+    start = time.monotonic()
+    logger.close(timeout=0.1)  # не бросает queue.Full
+    assert time.monotonic() - start < 1
+    release.set()
@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFERRED = ("numpy", "serial.tools.list_ports", "concurrent.futures.process",
+            "serial_monitor.ui.simple_plot", "serial_monitor.ui.settings_window")
+
+
+def run_python(code: str, tmp_path) -> subprocess.CompletedProcess:
+    env = dict(os.environ, HOME=str(tmp_path), PYTHONPATH=str(ROOT))
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                          env=env, timeout=60)
+
+
+def test_main_window_import_defers_heavy_modules(tmp_path):
+    code = (
+        "import sys\n"
+        "import serial_monitor.ui.main_window\n"
+        f"print([m for m in {DEFERRED!r} if m in sys.modules])\n"
+    )
+    result = run_python(code, tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.skipif(os.environ.get("DISPLAY", "") == "" and os.name != "nt",
+                    reason="No display available for Tkinter")
+def test_startup_probe(tmp_path):
+    code = "from serial_monitor.app import main; main(['--startup-probe'])"
+    result = run_python(code, tmp_path)
+    assert result.returncode == 0, result.stderr
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    marks, modules = probe["marks"], probe["modules"]
+
+    assert marks["imports"] < marks["window"] < marks["first_frame"] < marks["plot"] <= marks["ports"]
+    assert not set(modules["first_frame"]) & {"numpy", "serial.tools.list_ports"}
+    assert "numpy" in modules["plot"]